@@ -48,6 +48,10 @@ class ControlInterface {
   std::string GetName();
   std::vector<std::string> GetDependencies();
 
+  // Called by the executable controller when the module is registered
+  void SetModuleId(ModuleId module_id);
+  ModuleId GetModuleId() const;
+
   void StartExecutor();
   void StopExecutor();
 
@@ -59,6 +63,7 @@ protected:
   std::vector<std::string> dependencies_;
   ExecutableControllerInterface& executable_controller_interface_;
   vaf::ModuleExecutor executor_;
+  ModuleId module_id_{kUnregisteredModule};
 };
 
 } // namespace vaf
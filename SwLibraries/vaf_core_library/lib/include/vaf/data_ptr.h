@@ -18,10 +18,13 @@
 #ifndef INCLUDE_VAF_DATA_PTR_H
 #define INCLUDE_VAF_DATA_PTR_H
 
+#include "vaf/internal/data_control_block.h"
 #include "vaf/logging.h"
 
+#include <cstdlib>
 #include <memory>
 #include <type_traits>
+#include <utility>
 
 namespace vaf {
 
@@ -30,126 +33,178 @@ namespace vaf {
         class DataPtrHelper;
     }  // namespace internal
 
+    /*!
+     * \brief Shared pointer to a mutable sample
+     * Payload and reference count are stored in one control block, copies only change its reference count.
+     */
     template<typename T>
     class DataPtr {
         friend internal::DataPtrHelper<T>;
 
-    private:
-        enum class Contains {
-            Empty, RawPtr
-        };
-
-        struct Container {
-            std::unique_ptr<T> raw_ptr_;
-        };
-
     public:
-        DataPtr() : contains_{Contains::Empty}, container_{std::make_shared<Container>()} {}
+        DataPtr() noexcept = default;
 
-        DataPtr (const DataPtr& other) {
-          this->container_= other.container_;
-          this->contains_= other.contains_;
+        DataPtr(const DataPtr &other) noexcept : control_{other.control_}, value_{other.value_} {
+            if (control_ != nullptr) {
+                control_->AddReference();
+            }
         }
 
-        DataPtr (DataPtr&& other) {
-          this->container_= std::move(other.container_);
-          this->contains_= std::move(other.contains_);
+        DataPtr(DataPtr &&other) noexcept : control_{other.control_}, value_{other.value_} {
+            other.control_ = nullptr;
+            other.value_ = nullptr;
         }
 
-        DataPtr(std::unique_ptr<T> &&ptr) : contains_{Contains::RawPtr}, container_{std::make_shared<Container>()} {
-            container_->raw_ptr_ = std::move(ptr);
-        }
+        DataPtr(std::unique_ptr<T> &&ptr) : DataPtr{new internal::UniquePtrControlBlock<T>{std::move(ptr)}} {}
+
+        // Takes over one reference of the control block
+        explicit DataPtr(internal::DataControlBlock<T> *control) noexcept
+                : control_{control}, value_{control != nullptr ? control->Value() : nullptr} {}
+
+        ~DataPtr() { Reset(); }
 
         T &operator*() noexcept { return *(this->operator->()); }
 
         T *operator->() const noexcept {
-            if (contains_ == Contains::RawPtr) {
-                return container_->raw_ptr_.get();
+            if (value_ != nullptr) {
+                return value_;
             }
             vaf::LoggerSingleton::getInstance()->default_logger_.LogFatal() << "DataPtr is empty";
             std::abort();
         }
 
-        DataPtr& operator=(const DataPtr& other) {
-          this->container_= other.container_;
-          this->contains_= other.contains_;
-          return *this;
+        DataPtr &operator=(const DataPtr &other) noexcept {
+            DataPtr copy{other};
+            std::swap(control_, copy.control_);
+            std::swap(value_, copy.value_);
+            return *this;
         }
 
-        DataPtr& operator=(DataPtr&& other) {
-          this->container_= std::move(other.container_);
-          this->contains_= std::move(other.contains_);
-          return *this;
+        DataPtr &operator=(DataPtr &&other) noexcept {
+            if (this != &other) {
+                Reset();
+                control_ = other.control_;
+                value_ = other.value_;
+                other.control_ = nullptr;
+                other.value_ = nullptr;
+            }
+            return *this;
         }
 
-        explicit operator bool() const { return contains_ != Contains::Empty; }
+        explicit operator bool() const { return control_ != nullptr; }
 
     private:
-        Contains contains_;
-        std::shared_ptr<Container> container_;
+        void Reset() noexcept {
+            if (control_ != nullptr) {
+                control_->RemoveReference();
+                control_ = nullptr;
+                value_ = nullptr;
+            }
+        }
+
+        internal::DataControlBlock<T> *control_{nullptr};
+        T *value_{nullptr};
     };
 
+    /*!
+     * \brief Shared pointer to an immutable sample
+     * T is the const qualified type of the sample, the control block may be shared with the DataPtr it was made of.
+     */
     template<typename T>
     class ConstDataPtr {
-    private:
-        enum class Contains {
-            Empty, SamplePtr, RawPtr
-        };
+        using ValueType = typename std::remove_const<T>::type;
 
-        struct Container {
-            std::unique_ptr<T> raw_ptr_{};
-        };
+        friend internal::DataPtrHelper<ValueType>;
 
     public:
-        ConstDataPtr() : contains_{Contains::Empty}, container_{std::make_shared<Container>()} {}
+        ConstDataPtr() noexcept = default;
 
-        ConstDataPtr (const ConstDataPtr& other) {
-          this->container_= other.container_;
-          this->contains_= other.contains_;
+        ConstDataPtr(const ConstDataPtr &other) noexcept : control_{other.control_}, value_{other.value_} {
+            if (control_ != nullptr) {
+                control_->AddReference();
+            }
         }
 
-        ConstDataPtr (ConstDataPtr&& other) {
-          this->container_= std::move(other.container_);
-          this->contains_= std::move(other.contains_);
+        ConstDataPtr(ConstDataPtr &&other) noexcept : control_{other.control_}, value_{other.value_} {
+            other.control_ = nullptr;
+            other.value_ = nullptr;
         }
 
-        ConstDataPtr(std::unique_ptr<T> &&ptr) : contains_{Contains::RawPtr},
-                                                 container_{std::make_shared<Container>()} {
-            container_->raw_ptr_ = std::move(ptr);
-        }
+        ConstDataPtr(std::unique_ptr<T> &&ptr)
+                : ConstDataPtr{new internal::UniquePtrControlBlock<ValueType>{
+                std::unique_ptr<ValueType>{const_cast<ValueType *>(ptr.release())}}} {}
+
+        // Takes over one reference of the control block
+        explicit ConstDataPtr(internal::DataControlBlock<ValueType> *control) noexcept
+                : control_{control}, value_{control != nullptr ? control->Value() : nullptr} {}
+
+        ~ConstDataPtr() { Reset(); }
 
         const T &operator*() const noexcept { return *(this->operator->()); }
 
         const T *operator->() const noexcept {
-            if (contains_ == Contains::RawPtr) {
-                return container_->raw_ptr_.get();
+            if (value_ != nullptr) {
+                return value_;
             }
             vaf::LoggerSingleton::getInstance()->default_logger_.LogFatal() << "DataPtr is empty";
             std::abort();
         }
 
-        ConstDataPtr& operator=(const ConstDataPtr& other) {
-          this->container_= other.container_;
-          this->contains_= other.contains_;
-          return *this;
+        ConstDataPtr &operator=(const ConstDataPtr &other) noexcept {
+            ConstDataPtr copy{other};
+            std::swap(control_, copy.control_);
+            std::swap(value_, copy.value_);
+            return *this;
         }
 
-        ConstDataPtr& operator=(ConstDataPtr&& other) {
-          this->container_= std::move(other.container_);
-          this->contains_= std::move(other.contains_);
-          return *this;
+        ConstDataPtr &operator=(ConstDataPtr &&other) noexcept {
+            if (this != &other) {
+                Reset();
+                control_ = other.control_;
+                value_ = other.value_;
+                other.control_ = nullptr;
+                other.value_ = nullptr;
+            }
+            return *this;
         }
 
-        explicit operator bool() const { return contains_ != Contains::Empty; }
+        explicit operator bool() const { return control_ != nullptr; }
 
-        std::unique_ptr<T> getRawPtr() { return std::move(container_->raw_ptr_); };
+        // A sample still in use by other references is copied
+        std::unique_ptr<T> getRawPtr() {
+            if (control_ == nullptr) {
+                return nullptr;
+            }
+            std::unique_ptr<T> ptr{control_->TakeValue()};
+            Reset();
+            return ptr;
+        };
 
     private:
-        Contains contains_;
-        std::shared_ptr<Container> container_;
+        void Reset() noexcept {
+            if (control_ != nullptr) {
+                control_->RemoveReference();
+                control_ = nullptr;
+                value_ = nullptr;
+            }
+        }
+
+        internal::DataControlBlock<ValueType> *control_{nullptr};
+        const T *value_{nullptr};
     };
 
+    // Creates a sample with a single allocation for value & reference count
+    template<typename T, typename... Args>
+    DataPtr<T> MakeDataPtr(Args &&... args) {
+        return DataPtr<T>{new internal::InlineControlBlock<T>{std::forward<Args>(args)...}};
+    }
+
+    // Creates an immutable sample with a single allocation for value & reference count
+    template<typename T, typename... Args>
+    ConstDataPtr<const T> MakeConstDataPtr(Args &&... args) {
+        return ConstDataPtr<const T>{new internal::InlineControlBlock<T>{std::forward<Args>(args)...}};
+    }
+
 }  // namespace vaf
 
 #endif  // INCLUDE_VAF_DATA_PTR_H
-
@@ -22,7 +22,12 @@
  *  INCLUDES
  *********************************************************************************************************************/
 #include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <functional>
+#include <mutex>
 #include <thread>
+#include <unordered_map>
 #include <vector>
 
 #include "vaf/controller_interface.h"
@@ -48,10 +53,16 @@ class ExecutableControllerBase : public vaf::ExecutableControllerInterface {
   void Run(int argc, char* argv[], bool use_exec_mgr = false) noexcept;
   void InitiateShutdown() noexcept;
 
+  // Registers a module with the next free id, its dependencies are looked up by name
   void RegisterModule(std::shared_ptr<vaf::ControlInterface> module);
+  // Registers a module with the id and dependency ids assigned by the generator
+  void RegisterModule(ModuleId module_id, std::shared_ptr<vaf::ControlInterface> module,
+                      std::vector<ModuleId> dependencies);
 
  void ReportOperationalOfModule(std::string name) override;
  void ReportErrorOfModule(vaf::Error error, std::string name, bool critical) override;
+ void ReportOperationalOfModule(ModuleId module_id) override;
+ void ReportErrorOfModule(vaf::Error error, ModuleId module_id, bool critical) override;
 
  protected:
   virtual void DoInitialize();
@@ -61,22 +72,36 @@ class ExecutableControllerBase : public vaf::ExecutableControllerInterface {
   bool IsShutdownRequested();
 
  private:
-  void ChangeStateOfModule(std::string name, ModuleStates state);
+  using Clock = std::chrono::steady_clock;
+
+  void AddModule(ModuleId module_id, std::shared_ptr<vaf::ControlInterface> module);
+  ModuleId FindModule(const std::string& name) const;
+  void ChangeStateOfModule(ModuleId module_id, ModuleStates state);
+  void HandleErrorOfModule(const vaf::Error& error, ModuleId module_id, bool critical);
+  void ResolveDependencies();
+  void PostEvent(std::function<void()> event);
+  Clock::time_point NextDeadline() const;
   void StartModules();
-  void StartEventHandlersForModule(const std::string& module_name, const std::vector<std::string>& dependencies);
-  void StopEventHandlersForModule(const std::string& module_name, const std::vector<std::string>& dependencies);
+  void AddStartCandidate(ModuleId module_id);
+  bool CanStart(ModuleId module_id) const;
+  void StartEventHandlersForModule(ModuleId module_id);
+  void StopEventHandlersForModule(ModuleId module_id);
   void CheckStartingModules();
 
   class ModuleContainer {
   public:
-    ModuleContainer(std::string name, std::shared_ptr<vaf::ControlInterface> module, std::vector<std::string> dependencies) 
-      : name_{std::move(name)}, module_{std::move(module)}, dependencies_{std::move(dependencies)} {
+    ModuleContainer(std::string name, std::shared_ptr<vaf::ControlInterface> module)
+      : name_{std::move(name)}, module_{std::move(module)} {
     }
     std::string name_;
     std::shared_ptr<vaf::ControlInterface> module_;
-    std::vector<std::string> dependencies_;
-    ModuleStates state_{ModuleStates::kNotInitialized};
-    uint64_t starting_counter_{0};
+    std::vector<ModuleId> dependencies_{};
+    std::vector<ModuleId> dependants_{};
+    // Dependencies of modules registered without ids are looked up by name before the modules are initialized
+    bool has_dependency_ids_{false};
+    // End of the startup time limit while starting, earliest (re)start while not operational
+    Clock::time_point deadline_{};
+    bool is_start_candidate_{false};
   };
 
   void SetupExecutionManager();
@@ -94,7 +119,16 @@ class ExecutableControllerBase : public vaf::ExecutableControllerInterface {
   bool use_execution_mgr_{false};
   
   vaf::Logger& logger_;
+  // Reports of the modules are queued and handled by the thread running the controller
+  std::mutex event_mutex_;
+  std::condition_variable event_condition_;
+  std::vector<std::function<void()>> events_;
+
+  // Indexed by module id
   std::vector<ModuleContainer> modules_;
+  std::vector<ModuleStates> states_;
+  std::unordered_map<std::string, ModuleId> module_ids_;
+  std::vector<ModuleId> start_candidates_;
   std::unique_ptr<UserControllerInterface> user_controller_;
 
   std::thread signal_handler_thread_;
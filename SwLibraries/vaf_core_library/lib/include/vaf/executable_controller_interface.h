@@ -23,17 +23,25 @@
  *  INCLUDES
  *********************************************************************************************************************/
 
+#include <cstddef>
+#include <limits>
 #include <string>
 #include "vaf/error_domain.h"
 #include "vaf/module_states.h"
 
 namespace vaf {
 
+// Position of a module in the registry of its executable controller
+using ModuleId = std::size_t;
+constexpr ModuleId kUnregisteredModule{std::numeric_limits<ModuleId>::max()};
+
 class ExecutableControllerInterface {
 public:
   virtual ~ExecutableControllerInterface() = default;
   virtual void ReportOperationalOfModule(std::string name) = 0;
   virtual void ReportErrorOfModule(vaf::Error error, std::string name, bool critical) = 0;
+  virtual void ReportOperationalOfModule(ModuleId module_id) = 0;
+  virtual void ReportErrorOfModule(vaf::Error error, ModuleId module_id, bool critical) = 0;
 };
 
 } // namespace vaf
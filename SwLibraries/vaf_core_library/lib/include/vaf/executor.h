@@ -18,12 +18,17 @@
 #ifndef INCLUDE_VAF_EXECUTOR_H
 #define INCLUDE_VAF_EXECUTOR_H
 
+#include "vaf/executor_statistics.h"
 #include "vaf/logging.h"
 
+#include <algorithm>
 #include <atomic>
 #include <chrono>
+#include <condition_variable>
+#include <deque>
 #include <functional>
 #include <memory>
+#include <mutex>
 #include <string>
 #include <thread>
 #include <utility>
@@ -56,20 +61,34 @@ namespace vaf {
 
         std::chrono::nanoseconds Budget() const;
 
+        const DurationStatistics &Statistics() const;
+
+        DurationStatistics &Statistics();
+
     private:
         std::string name_;
-        bool is_active_{false};
+        std::atomic<bool> is_active_{false};
         uint64_t period_;
         std::function<void(void)> runnable_;
         std::string owner_;
         std::vector<std::string> run_after_;
         uint64_t offset_;
         std::chrono::nanoseconds budget_;
+        DurationStatistics statistics_{};
     };
 
     class Executor {
     public:
-        explicit Executor(std::chrono::milliseconds running_period);
+        /*!
+         * \brief Creates the executor and starts its thread
+         * \param running_period Period of the executor tick
+         * \param thread_count Number of threads executing the runnables of a tick. With more than one thread,
+         *        independent runnables are dispatched to a worker pool. Runnables of the same module and of modules
+         *        depending on each other keep their order.
+         * \param enable_statistics Measure the execution times of all runnables and the timing of the ticks
+         */
+        explicit Executor(std::chrono::milliseconds running_period, std::size_t thread_count = 1,
+                          bool enable_statistics = false);
 
         ~Executor();
 
@@ -101,6 +120,7 @@ namespace vaf {
                                                     const std::vector<std::string> &run_after_runnables = {},
                                                     uint64_t offset = 0,
                                                     std::chrono::nanoseconds budget = std::chrono::nanoseconds{0}) {
+            std::lock_guard<std::mutex> lock{runnables_mutex_};
             auto check_can_run = [this, &run_after, &run_after_runnables](
                     std::vector<std::shared_ptr<RunnableHandle>>::iterator current_position) {
                 auto pos{std::next(current_position)};
@@ -139,21 +159,94 @@ namespace vaf {
                                                 std::make_unique<RunnableHandle>(name, period / running_period_,
                                                                                  std::forward<T>(runnable), owner,
                                                                                  run_after, offset, budget));
+            runnables_changed_ = true;
             return *insert_pos;
         }
 
+        bool IsStatisticsEnabled() const;
+
+        /*!
+         * \brief Statistics of the execution times of the ticks, overruns are ticks exceeding the executor period
+         */
+        const DurationStatistics &TickStatistics() const;
+
+        /*!
+         * \brief Statistics of the delays of the tick starts relative to their planned start
+         */
+        const DurationStatistics &JitterStatistics() const;
+
+        /*!
+         * \brief Visits the statistics of all runnables, overruns are budget violations
+         * \param visitor Called with owner, name and statistics of each runnable
+         */
+        void VisitRunnableStatistics(
+                const std::function<void(const std::string &, const std::string &, const DurationStatistics &)> &visitor);
+
+        void ResetStatistics();
+
+        /*!
+         * \brief Logs the statistics of the ticks and of all runnables
+         */
+        void DumpStatistics();
+
     private:
         void ExecutorThread();
 
         void ExecuteRunnable(RunnableHandle &runnable);
 
+        void ExecuteRunnablesParallel(uint64_t counter);
+
+        void ExecuteReadyRunnable(std::unique_lock<std::mutex> &lock);
+
+        void WorkerThread();
+
+        void UpdateSchedule();
+
+        void CollectDueRunnables(uint64_t counter);
+
         std::chrono::milliseconds running_period_;
+
+        // runnables are added by the modules while the executor is running, the executor thread takes over the
+        // changed list at the start of a tick, so the executing threads never see it changing
         std::vector<std::shared_ptr<RunnableHandle>> runnables_{};
+        std::atomic<bool> runnables_changed_{false};
+        std::mutex runnables_mutex_;
+        std::vector<std::shared_ptr<RunnableHandle>> scheduled_runnables_{};
         std::atomic<bool> exit_requested_{false};
+        bool statistics_enabled_;
+        DurationStatistics tick_statistics_{};
+        DurationStatistics jitter_statistics_{};
+
+        // schedule table of one hyperperiod, runnables due in tick t (modulo hyperperiod) are
+        // schedule_[schedule_begin_[t]] to schedule_[schedule_begin_[t + 1] - 1], without table all runnables are checked
+        uint64_t hyperperiod_{0};
+        std::vector<std::size_t> schedule_begin_{};
+        std::vector<std::size_t> schedule_{};
+        std::vector<std::size_t> due_runnables_{};
+
+        // worker pool of the parallel mode, all guarded by mutex_
+        std::size_t thread_count_;
+        std::vector<std::vector<std::size_t>> successors_{};
+        std::vector<bool> due_{};
+        std::vector<std::size_t> pending_predecessors_{};
+        std::deque<std::size_t> ready_{};
+        std::size_t outstanding_{0};
+        bool stop_workers_{false};
+        std::mutex mutex_;
+        std::condition_variable cv_;
+        std::mutex log_mutex_;
+        std::vector<std::thread> workers_{};
+
         std::thread thread_;
         vaf::Logger &logger_;
     };
 
+    /*!
+     * \brief Gets the executor of the executable, e.g. to poll its statistics from the user controller
+     * \return The most recently created executor, nullptr if there is none
+     */
+    Executor *GetExecutor();
+
     class ModuleExecutor {
     public:
         ModuleExecutor(Executor &executor, std::string name, std::vector<std::string> dependencies);
@@ -0,0 +1,79 @@
+/*!********************************************************************************************************************
+ *  COPYRIGHT
+ *  -------------------------------------------------------------------------------------------------------------------
+ *
+ *  Copyright (c) 2025 by Vector Informatik GmbH. All rights reserved.
+ *
+ *                This software is copyright protected and proprietary to Vector Informatik GmbH.
+ *                Vector Informatik GmbH grants to you only those rights as set out in the license conditions.
+ *                All other rights remain with Vector Informatik GmbH.
+ *
+ *  -------------------------------------------------------------------------------------------------------------------
+ *  FILE DESCRIPTION
+ *  -----------------------------------------------------------------------------------------------------------------*/
+/*!        file  executor_statistics.h
+ *         brief Lock-free timing statistics of the executor
+ *
+ *********************************************************************************************************************/
+#ifndef INCLUDE_VAF_EXECUTOR_STATISTICS_H
+#define INCLUDE_VAF_EXECUTOR_STATISTICS_H
+
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <limits>
+
+namespace vaf {
+
+    /*!
+     * \brief Statistics of measured durations with a histogram of power of two buckets
+     * Recording is lock-free and wait-free apart from the min/max updates, so it can be done from the executor
+     * threads while other threads read the statistics.
+     */
+    class DurationStatistics {
+    public:
+        // bucket i counts durations in [2^(i-1), 2^i) ns, bucket 0 durations of 0 ns, the last one all longer ones
+        static constexpr std::size_t kBucketCount{40};
+
+        DurationStatistics() = default;
+
+        DurationStatistics(const DurationStatistics &) = delete;
+
+        DurationStatistics &operator=(const DurationStatistics &) = delete;
+
+        void Record(std::chrono::nanoseconds duration, bool overrun = false) noexcept;
+
+        void Reset() noexcept;
+
+        uint64_t Count() const noexcept;
+
+        uint64_t Overruns() const noexcept;
+
+        std::chrono::nanoseconds Min() const noexcept;
+
+        std::chrono::nanoseconds Max() const noexcept;
+
+        std::chrono::nanoseconds Mean() const noexcept;
+
+        /*!
+         * \brief Estimates a percentile from the histogram
+         * \param percentile Percentile in the range 0 to 100
+         * \return Upper bound of the histogram bucket containing the percentile, limited to Max()
+         */
+        std::chrono::nanoseconds Percentile(double percentile) const noexcept;
+
+        uint64_t BucketCount(std::size_t bucket) const noexcept;
+
+    private:
+        std::atomic<uint64_t> count_{0};
+        std::atomic<uint64_t> overruns_{0};
+        std::atomic<uint64_t> sum_{0};
+        std::atomic<uint64_t> min_{std::numeric_limits<uint64_t>::max()};
+        std::atomic<uint64_t> max_{0};
+        std::array<std::atomic<uint64_t>, kBucketCount> buckets_{};
+    };
+
+} // namespace vaf
+
+#endif // INCLUDE_VAF_EXECUTOR_STATISTICS_H
@@ -0,0 +1,116 @@
+/*!********************************************************************************************************************
+ *  COPYRIGHT
+ *  -------------------------------------------------------------------------------------------------------------------
+ *
+ *  Copyright (c) 2025 by Vector Informatik GmbH. All rights reserved.
+ *
+ *                This software is copyright protected and proprietary to Vector Informatik GmbH.
+ *                Vector Informatik GmbH grants to you only those rights as set out in the license conditions.
+ *                All other rights remain with Vector Informatik GmbH.
+ *
+ *  -------------------------------------------------------------------------------------------------------------------
+ *  FILE DESCRIPTION
+ *  -----------------------------------------------------------------------------------------------------------------*/
+/*!        file  data_control_block.h
+ *         brief Reference counted storage of the samples of DataPtr & ConstDataPtr
+ *
+ *********************************************************************************************************************/
+#ifndef INCLUDE_VAF_INTERNAL_DATA_CONTROL_BLOCK_H
+#define INCLUDE_VAF_INTERNAL_DATA_CONTROL_BLOCK_H
+
+#include <atomic>
+#include <cstdint>
+#include <memory>
+#include <utility>
+
+namespace vaf {
+    namespace internal {
+
+        /*!
+         * \brief Intrusive reference count of a sample
+         * The derived classes define where the value is stored and what happens when the last reference is removed.
+         */
+        template<typename T>
+        class DataControlBlock {
+        public:
+            virtual ~DataControlBlock() = default;
+
+            DataControlBlock(const DataControlBlock &) = delete;
+
+            DataControlBlock &operator=(const DataControlBlock &) = delete;
+
+            T *Value() const noexcept { return value_; }
+
+            void AddReference() noexcept { references_.fetch_add(1, std::memory_order_relaxed); }
+
+            void RemoveReference() noexcept {
+                if (references_.fetch_sub(1, std::memory_order_acq_rel) == 1) {
+                    Destroy();
+                }
+            }
+
+            // Hands out the value as unique pointer, a value still in use by other references is copied
+            virtual std::unique_ptr<T> TakeValue() { return std::make_unique<T>(*value_); }
+
+        protected:
+            DataControlBlock() = default;
+
+            bool IsUnique() const noexcept { return references_.load(std::memory_order_acquire) == 1; }
+
+            void SetReferences(uint32_t references) noexcept {
+                references_.store(references, std::memory_order_relaxed);
+            }
+
+            virtual void Destroy() noexcept = 0;
+
+            T *value_{nullptr};
+
+        private:
+            std::atomic<uint32_t> references_{1};
+        };
+
+        /*!
+         * \brief Control block and value in a single allocation
+         */
+        template<typename T>
+        class InlineControlBlock final : public DataControlBlock<T> {
+        public:
+            template<typename... Args>
+            explicit InlineControlBlock(Args &&... args) : value_storage_(std::forward<Args>(args)...) {
+                this->value_ = &value_storage_;
+            }
+
+        private:
+            void Destroy() noexcept override { delete this; }
+
+            T value_storage_;
+        };
+
+        /*!
+         * \brief Control block taking over a value allocated by the user
+         */
+        template<typename T>
+        class UniquePtrControlBlock final : public DataControlBlock<T> {
+        public:
+            explicit UniquePtrControlBlock(std::unique_ptr<T> &&ptr) : ptr_{std::move(ptr)} {
+                this->value_ = ptr_.get();
+            }
+
+            std::unique_ptr<T> TakeValue() override {
+                if (this->IsUnique() || (ptr_ == nullptr)) {
+                    this->value_ = nullptr;
+                    return std::move(ptr_);
+                }
+                return std::make_unique<T>(*ptr_);
+            }
+
+        private:
+            void Destroy() noexcept override { delete this; }
+
+            std::unique_ptr<T> ptr_;
+        };
+
+    }  // namespace internal
+}  // namespace vaf
+
+#endif  // INCLUDE_VAF_INTERNAL_DATA_CONTROL_BLOCK_H
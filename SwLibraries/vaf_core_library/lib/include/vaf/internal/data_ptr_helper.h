@@ -32,7 +32,23 @@ namespace vaf {
 
             DataPtrHelper &operator=(const DataPtrHelper &) = delete;
 
-            static std::unique_ptr<T> getRawPtr(::vaf::DataPtr<T> &ptr) { return std::move(ptr.container_->raw_ptr_); };
+            // A sample still in use by other references is copied
+            static std::unique_ptr<T> getRawPtr(::vaf::DataPtr<T> &ptr) {
+                if (ptr.control_ == nullptr) {
+                    return nullptr;
+                }
+                std::unique_ptr<T> raw_ptr{ptr.control_->TakeValue()};
+                ptr.Reset();
+                return raw_ptr;
+            };
+
+            // Moves the sample into a ConstDataPtr without copying it
+            static ::vaf::ConstDataPtr<const T> toConstDataPtr(::vaf::DataPtr<T> &ptr) noexcept {
+                ::vaf::ConstDataPtr<const T> const_ptr{ptr.control_};
+                ptr.control_ = nullptr;
+                ptr.value_ = nullptr;
+                return const_ptr;
+            };
         };
 
     }  // namespace internal
@@ -0,0 +1,126 @@
+/*!********************************************************************************************************************
+ *  COPYRIGHT
+ *  -------------------------------------------------------------------------------------------------------------------
+ *
+ *  Copyright (c) 2025 by Vector Informatik GmbH. All rights reserved.
+ *
+ *                This software is copyright protected and proprietary to Vector Informatik GmbH.
+ *                Vector Informatik GmbH grants to you only those rights as set out in the license conditions.
+ *                All other rights remain with Vector Informatik GmbH.
+ *
+ *  -------------------------------------------------------------------------------------------------------------------
+ *  FILE DESCRIPTION
+ *  -----------------------------------------------------------------------------------------------------------------*/
+/*!        file  pooled_sample.h
+ *         brief Reference counted samples of a preallocated sample pool
+ *
+ *********************************************************************************************************************/
+#ifndef INCLUDE_VAF_INTERNAL_POOLED_SAMPLE_H
+#define INCLUDE_VAF_INTERNAL_POOLED_SAMPLE_H
+
+#include "vaf/internal/data_control_block.h"
+
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace vaf {
+    namespace internal {
+
+        template<typename T>
+        class SamplePoolStorage;
+
+        /*!
+         * \brief A sample of a pool, which goes back to its pool when the last reference is removed
+         */
+        template<typename T>
+        class PooledSample final : public DataControlBlock<T> {
+        public:
+            PooledSample() { this->value_ = &value_storage_; }
+
+        private:
+            friend class SamplePoolStorage<T>;
+
+            void Destroy() noexcept override { storage_->Release(*this); }
+
+            std::atomic<uint32_t> next_free_{0};
+            SamplePoolStorage<T> *storage_{nullptr};
+            T value_storage_{};
+        };
+
+        /*!
+         * \brief Preallocated samples with a lock-free free list
+         * The storage is deleted when its owner and all samples in use are gone, so samples may outlive the pool.
+         */
+        template<typename T>
+        class SamplePoolStorage {
+        public:
+            explicit SamplePoolStorage(std::size_t size) : samples_(size) {
+                for (std::size_t i{0}; i < samples_.size(); ++i) {
+                    samples_[i].storage_ = this;
+                    samples_[i].next_free_.store(i + 1 < samples_.size() ? static_cast<uint32_t>(i + 1) : kNoSample,
+                                                 std::memory_order_relaxed);
+                }
+                free_head_.store(samples_.empty() ? kNoSample : 0, std::memory_order_relaxed);
+            }
+
+            SamplePoolStorage(const SamplePoolStorage &) = delete;
+
+            SamplePoolStorage &operator=(const SamplePoolStorage &) = delete;
+
+            // Returns a free sample with one reference or nullptr if all samples are in use
+            PooledSample<T> *Acquire() noexcept {
+                uint64_t head{free_head_.load(std::memory_order_acquire)};
+                for (;;) {
+                    auto index = static_cast<uint32_t>(head & kIndexMask);
+                    if (index == kNoSample) {
+                        return nullptr;
+                    }
+                    uint64_t next{samples_[index].next_free_.load(std::memory_order_relaxed)};
+                    // the tag in the upper half avoids the ABA problem
+                    if (free_head_.compare_exchange_weak(head, (((head >> 32U) + 1) << 32U) | next,
+                                                         std::memory_order_acquire, std::memory_order_acquire)) {
+                        references_.fetch_add(1, std::memory_order_relaxed);
+                        samples_[index].SetReferences(1);
+                        return &samples_[index];
+                    }
+                }
+            }
+
+            // Resets the value, so the next Acquire returns a default constructed sample like the heap does
+            void Release(PooledSample<T> &sample) noexcept {
+                sample.value_storage_ = T{};
+                auto index = static_cast<uint64_t>(&sample - samples_.data());
+                uint64_t head{free_head_.load(std::memory_order_relaxed)};
+                do {
+                    sample.next_free_.store(static_cast<uint32_t>(head & kIndexMask), std::memory_order_relaxed);
+                } while (!free_head_.compare_exchange_weak(head, (((head >> 32U) + 1) << 32U) | index,
+                                                           std::memory_order_release, std::memory_order_relaxed));
+                RemoveReference();
+            }
+
+            std::size_t Size() const noexcept { return samples_.size(); }
+
+            // Called by the owning pool instead of deleting the storage
+            void RemoveReference() noexcept {
+                if (references_.fetch_sub(1, std::memory_order_acq_rel) == 1) {
+                    delete this;
+                }
+            }
+
+        private:
+            static constexpr uint32_t kNoSample{0xFFFFFFFFU};
+            static constexpr uint64_t kIndexMask{0xFFFFFFFFU};
+
+            ~SamplePoolStorage() = default;
+
+            std::vector<PooledSample<T>> samples_;
+            std::atomic<uint64_t> free_head_{0};
+            std::atomic<uint32_t> references_{1};
+        };
+
+    }  // namespace internal
+}  // namespace vaf
+
+#endif  // INCLUDE_VAF_INTERNAL_POOLED_SAMPLE_H
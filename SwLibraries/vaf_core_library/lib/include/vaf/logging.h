@@ -1,112 +1,216 @@
 #ifndef VAF_LOGGING_H_
 #define VAF_LOGGING_H_
 
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
 #include <iostream>
+#include <memory>
 #include <mutex>
 #include <list>
+#include <string>
+
+// Log statements above this level are removed at compile time (0 = OFF ... 6 = VERBOSE)
+#ifndef VAF_LOG_MAX_LEVEL
+#define VAF_LOG_MAX_LEVEL 6
+#endif
 
 namespace vaf {
+    class Logger;
+
     class LoggerSingleton;
 
-    class Logger {
+    class AsyncLogBackend;
+
+    /*!
+     * \brief A single log message with its context
+     * Messages longer than kMaxMessageSize are truncated.
+     */
+    struct LogRecord {
+        static constexpr std::size_t kMaxMessageSize{256};
+
+        const char *ctx_id;
+        const char *ctx_description;
+        uint8_t level;
+        uint16_t size;
+        char message[kMaxMessageSize];
+    };
+
+    /*!
+     * \brief Destination of the log records
+     * Write and Flush are never called concurrently.
+     */
+    class LogSink {
     public:
-        ~Logger() {
-            if (previous_line_streamed) {
-                std::cout << std::endl;
-            }
-            std::cout << std::flush;
-        }
+        virtual ~LogSink() = default;
 
-        auto LogFatal() -> Logger & {
-            current_log_level_ = FATAL;
-            log_start_message = true;
-            if (previous_line_streamed) {
-                std::cout << std::endl;
-            }
-            return *this;
+        virtual void Write(const LogRecord &record) = 0;
+
+        virtual void Flush() = 0;
+    };
+
+    /*!
+     * \brief Writes one "[ctx_id: ctx_description] message" line per record to std::cout
+     */
+    class TextLogSink : public LogSink {
+    public:
+        void Write(const LogRecord &record) override;
+
+        void Flush() override;
+    };
+
+    /*!
+     * \brief Writes the records in a compact binary format to a stream
+     * Per record: level (1 byte), then context id, context description and message, each as a little endian
+     * 2 byte length followed by the characters.
+     */
+    class BinaryLogSink : public LogSink {
+    public:
+        explicit BinaryLogSink(std::ostream &stream) : stream_{stream} {}
+
+        void Write(const LogRecord &record) override;
+
+        void Flush() override;
+
+    private:
+        void WriteString(const char *s, std::size_t size);
+
+        std::ostream &stream_;
+    };
+
+    /*!
+     * \brief Collects one log message in place and hands it to the backend on destruction
+     * Streaming never allocates. A stream of a filtered or rate limited message discards everything.
+     */
+    class LogStream {
+    public:
+        LogStream(LogStream &&other) noexcept : logger_{other.logger_} {
+            record_.ctx_id = other.record_.ctx_id;
+            record_.ctx_description = other.record_.ctx_description;
+            record_.level = other.record_.level;
+            record_.size = 0;
+            Append(other.record_.message, other.record_.size);
+            other.logger_ = nullptr;
         }
 
+        ~LogStream();
+
+        LogStream(const LogStream &) = delete;
+
+        LogStream &operator=(const LogStream &) = delete;
+
+        LogStream &operator=(LogStream &&) = delete;
 
-        auto LogError() -> Logger & {
-            current_log_level_ = ERROR;
-            log_start_message = true;
-            if (previous_line_streamed) {
-                std::cout << std::endl;
+        auto operator<<(const char *s) noexcept -> LogStream & {
+            if ((logger_ != nullptr) && (s != nullptr)) {
+                while ((*s != '\0') && (record_.size < LogRecord::kMaxMessageSize)) {
+                    record_.message[record_.size++] = *s++;
+                }
             }
             return *this;
         }
 
-        auto LogWarn() -> Logger & {
-            current_log_level_ = WARN;
-            log_start_message = true;
-            if (previous_line_streamed) {
-                std::cout << std::endl;
+        auto operator<<(const std::string &s) noexcept -> LogStream & {
+            if (logger_ != nullptr) {
+                Append(s.data(), s.size());
             }
             return *this;
         }
 
-        auto LogInfo() -> Logger & {
-            current_log_level_ = INFO;
-            log_start_message = true;
-            if (previous_line_streamed) {
-                std::cout << std::endl;
+        auto operator<<(int i) noexcept -> LogStream & {
+            if (logger_ != nullptr) {
+                char digits[12];
+                std::size_t count{0};
+                int64_t value{i};
+                uint64_t magnitude{static_cast<uint64_t>(value < 0 ? -value : value)};
+                do {
+                    digits[count++] = static_cast<char>('0' + (magnitude % 10));
+                    magnitude /= 10;
+                } while (magnitude != 0);
+                if (value < 0) {
+                    digits[count++] = '-';
+                }
+                while ((count > 0) && (record_.size < LogRecord::kMaxMessageSize)) {
+                    record_.message[record_.size++] = digits[--count];
+                }
             }
             return *this;
         }
 
-        auto LogDebug() -> Logger & {
-            current_log_level_ = DEBUG;
-            log_start_message = true;
-            if (previous_line_streamed) {
-                std::cout << std::endl;
-            }
-            return *this;
+    private:
+        friend class Logger;
+
+        LogStream(Logger *logger, const char *ctx_id, const char *ctx_description, uint8_t level) noexcept
+                : logger_{logger} {
+            record_.ctx_id = ctx_id;
+            record_.ctx_description = ctx_description;
+            record_.level = level;
+            record_.size = 0;
         }
 
-        auto LogVerbose() -> Logger & {
-            current_log_level_ = VERBOSE;
-            log_start_message = true;
-            if (previous_line_streamed) {
-                std::cout << std::endl;
+        void Append(const char *s, std::size_t size) noexcept {
+            for (std::size_t i{0}; (i < size) && (record_.size < LogRecord::kMaxMessageSize); ++i) {
+                record_.message[record_.size++] = s[i];
             }
-            return *this;
         }
 
-        auto operator<<(const char *s) noexcept -> Logger & {
-            if (current_log_level_ <= aimed_log_level_) {
-                previous_line_streamed = true;
-                if (log_start_message) {
-                    std::cout << "[" << ctx_id_ << ": " << ctx_description_ << "] ";
-                    log_start_message = false;
-                }
-                std::cout << s;
-            }
-            return *this;
+        Logger *logger_;
+        LogRecord record_;
+    };
+
+    class Logger {
+    public:
+        auto LogFatal() -> LogStream {
+            return Start<FATAL>();
         }
 
-        auto operator<<(int i) noexcept -> Logger & {
-            if (current_log_level_ <= aimed_log_level_) {
-                previous_line_streamed = true;
-                if (log_start_message) {
-                    std::cout << "[" << ctx_id_ << ": " << ctx_description_ << "] ";
-                    log_start_message = false;
-                }
-                std::cout << i;
-            }
-            return *this;
+        auto LogError() -> LogStream {
+            return Start<ERROR>();
         }
 
-        friend class LoggerSingleton;
+        auto LogWarn() -> LogStream {
+            return Start<WARN>();
+        }
+
+        auto LogInfo() -> LogStream {
+            return Start<INFO>();
+        }
+
+        auto LogDebug() -> LogStream {
+            return Start<DEBUG>();
+        }
+
+        auto LogVerbose() -> LogStream {
+            return Start<VERBOSE>();
+        }
 
-        Logger(Logger &&logger_) {
-            this->log_start_message = logger_.log_start_message;
-            this->previous_line_streamed = logger_.previous_line_streamed;
-            this->current_log_level_ = logger_.current_log_level_;
-            this->ctx_description_ = logger_.ctx_description_;
-            this->ctx_id_ = logger_.ctx_id_;
-            this->aimed_log_level_ = logger_.aimed_log_level_;
+        /*!
+         * \brief Limits the records of this logger per second, fatal records are never limited
+         * \param records_per_second Maximum number of records per second, 0 disables the limit
+         */
+        void SetRateLimit(uint32_t records_per_second) noexcept {
+            rate_limit_.store(records_per_second, std::memory_order_relaxed);
         }
 
+        // Number of records dropped by the rate limit
+        uint64_t RateLimitedRecords() const noexcept {
+            return rate_limited_.load(std::memory_order_relaxed);
+        }
+
+        friend class LoggerSingleton;
+
+        friend class LogStream;
+
+        Logger(Logger &&logger_) : owner_{logger_.owner_},
+                                   ctx_id_{logger_.ctx_id_},
+                                   ctx_description_{logger_.ctx_description_},
+                                   aimed_log_level_{logger_.aimed_log_level_},
+                                   rate_limit_{logger_.rate_limit_.load(std::memory_order_relaxed)},
+                                   rate_window_{logger_.rate_window_.load(std::memory_order_relaxed)},
+                                   rate_count_{logger_.rate_count_.load(std::memory_order_relaxed)},
+                                   rate_limited_{logger_.rate_limited_.load(std::memory_order_relaxed)} {}
+
     private:
 
         enum LogLevel {
@@ -119,11 +223,12 @@ namespace vaf {
             VERBOSE = 6
         };
 
-        Logger(const char *ctx_id, const char *ctx_description, LogLevel aimed_log_level) : ctx_id_{ctx_id},
-                                                                                            ctx_description_{
-                                                                                                    ctx_description},
-                                                                                            aimed_log_level_{
-                                                                                                    aimed_log_level} {}
+        Logger(LoggerSingleton *owner, const char *ctx_id, const char *ctx_description, LogLevel aimed_log_level,
+               uint32_t rate_limit) : owner_{owner},
+                                      ctx_id_{ctx_id},
+                                      ctx_description_{ctx_description},
+                                      aimed_log_level_{aimed_log_level},
+                                      rate_limit_{rate_limit} {}
 
         Logger() = delete;
 
@@ -131,18 +236,47 @@ namespace vaf {
 
         Logger &operator=(const Logger &) = delete;
 
+        template<LogLevel kLevel>
+        auto Start() -> LogStream {
+            // the first condition is a constant, so disabled levels are removed by the compiler
+            bool enabled{(kLevel <= VAF_LOG_MAX_LEVEL) && (kLevel <= aimed_log_level_) &&
+                         ((kLevel == FATAL) || Admit())};
+            return LogStream{enabled ? this : nullptr, ctx_id_, ctx_description_, static_cast<uint8_t>(kLevel)};
+        }
+
+        bool Admit() noexcept {
+            uint32_t limit{rate_limit_.load(std::memory_order_relaxed)};
+            if (limit == 0) {
+                return true;
+            }
+            int64_t now{std::chrono::duration_cast<std::chrono::seconds>(
+                    std::chrono::steady_clock::now().time_since_epoch()).count()};
+            int64_t window{rate_window_.load(std::memory_order_relaxed)};
+            if ((window != now) && rate_window_.compare_exchange_strong(window, now, std::memory_order_relaxed)) {
+                rate_count_.store(0, std::memory_order_relaxed);
+            }
+            if (rate_count_.fetch_add(1, std::memory_order_relaxed) < limit) {
+                return true;
+            }
+            rate_limited_.fetch_add(1, std::memory_order_relaxed);
+            return false;
+        }
+
+        LoggerSingleton *owner_;
         const char *ctx_id_;
         const char *ctx_description_;
         LogLevel aimed_log_level_;
-        LogLevel current_log_level_ = DEBUG;
-        bool log_start_message = false;
-        bool previous_line_streamed = false;
+        std::atomic<uint32_t> rate_limit_{0};
+        std::atomic<int64_t> rate_window_{0};
+        std::atomic<uint32_t> rate_count_{0};
+        std::atomic<uint64_t> rate_limited_{0};
     };
 
     class LoggerSingleton {
     private:
-        LoggerSingleton() : log_level_{Logger::LogLevel::FATAL},
-                            default_logger_{CreateLogger("DL", "DefaultLogger")} {}
+        LoggerSingleton();
+
+        ~LoggerSingleton();
 
         LoggerSingleton(const LoggerSingleton &) = delete;
 
@@ -154,6 +288,13 @@ namespace vaf {
         std::list<Logger> loggers_{};
 
         Logger::LogLevel log_level_;
+        uint32_t rate_limit_{0};
+
+        std::mutex sink_mtx_{}; // Serializes the sink & the consumer side of the async backend
+        std::unique_ptr<LogSink> sink_;
+        std::mutex async_mtx_{};
+        std::unique_ptr<AsyncLogBackend> async_backend_storage_{};
+        std::atomic<AsyncLogBackend *> async_backend_{nullptr};
     public:
         static LoggerSingleton *getInstance() {
             // Acquire lock before checking instance
@@ -165,7 +306,7 @@ namespace vaf {
         }
 
         Logger &CreateLogger(const char *ctx_id, const char *ctx_description) {
-            loggers_.push_back(std::move(Logger{ctx_id, ctx_description, log_level_}));
+            loggers_.push_back(std::move(Logger{this, ctx_id, ctx_description, log_level_, rate_limit_}));
             return loggers_.back();
         }
 
@@ -197,6 +338,37 @@ namespace vaf {
             log_level_ = Logger::LogLevel::VERBOSE;
         };
 
+        /*!
+         * \brief Sets the rate limit of all existing & future loggers
+         * \param records_per_second Maximum number of records per logger & second, 0 disables the limit
+         */
+        void SetRateLimit(uint32_t records_per_second) {
+            rate_limit_ = records_per_second;
+            for (Logger &logger: loggers_) {
+                logger.SetRateLimit(records_per_second);
+            }
+        }
+
+        void SetLogSink(std::unique_ptr<LogSink> sink);
+
+        /*!
+         * \brief Decouples logging from the sink
+         * Records are put into a preallocated lock-free ring buffer, which is drained by a background thread. If the
+         * buffer is full, records are dropped & their number is reported. Fatal records are written directly after
+         * the buffered ones.
+         * \param capacity Number of records in the buffer, rounded up to a power of two. Only the first start
+         * allocates the buffer, later starts reuse it.
+         */
+        void StartAsyncLogging(std::size_t capacity = 1024);
+
+        // Writes all buffered records & returns to writing every record directly to the sink
+        void StopAsyncLogging();
+
+        // Number of records dropped because the async buffer was full
+        uint64_t DroppedRecords() const noexcept;
+
+        void Write(const LogRecord &record) noexcept;
+
         void CleanLoggers() {
             loggers_.clear();
         }
@@ -204,8 +376,14 @@ namespace vaf {
         Logger &default_logger_;
     };
 
+    inline LogStream::~LogStream() {
+        if (logger_ != nullptr) {
+            logger_->owner_->Write(record_);
+        }
+    }
+
     Logger &CreateLogger(const char *ctx_id, const char *ctx_description);
 
 } // namespace vaf
 
-#endif // VAF_LOGGING_H_
\ No newline at end of file
+#endif // VAF_LOGGING_H_
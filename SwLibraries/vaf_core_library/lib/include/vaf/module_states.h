@@ -18,11 +18,12 @@
 #ifndef INCLUDE_VAF_MODULE_STATES_H
 #define INCLUDE_VAF_MODULE_STATES_H
 
+#include <cstdint>
 #include <string>
 
 namespace vaf {
 
-enum class ModuleStates {
+enum class ModuleStates : std::uint8_t {
   kNotInitialized,
   kNotOperational,
   kStarting,
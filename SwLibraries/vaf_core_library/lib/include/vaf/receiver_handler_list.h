@@ -0,0 +1,161 @@
+/*!********************************************************************************************************************
+ *  COPYRIGHT
+ *  -------------------------------------------------------------------------------------------------------------------
+ *
+ *  Copyright (c) 2025 by Vector Informatik GmbH. All rights reserved.
+ *
+ *                This software is copyright protected and proprietary to Vector Informatik GmbH.
+ *                Vector Informatik GmbH grants to you only those rights as set out in the license conditions.
+ *                All other rights remain with Vector Informatik GmbH.
+ *
+ *  -------------------------------------------------------------------------------------------------------------------
+ *  FILE DESCRIPTION
+ *  -----------------------------------------------------------------------------------------------------------------*/
+/*!        file  receiver_handler_list.h
+ *         brief Receiver handlers with lock-free dispatch
+ *
+ *********************************************************************************************************************/
+#ifndef INCLUDE_VAF_RECEIVER_HANDLER_LIST_H
+#define INCLUDE_VAF_RECEIVER_HANDLER_LIST_H
+
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <vector>
+
+namespace vaf {
+
+    /*!
+     * \brief Receiver handlers of a data element, which are active while their owner module is running
+     * Registering, activating and deactivating handlers publishes an immutable snapshot of the active handlers.
+     * Dispatch only reads the current snapshot, so it is lock-free and can run concurrently to the changes.
+     * Replaced snapshots are freed as soon as no dispatch is in progress.
+     */
+    template<typename T>
+    class ReceiverHandlerList {
+    public:
+        ReceiverHandlerList() : snapshot_{new Snapshot{}} {}
+
+        ~ReceiverHandlerList() {
+            delete snapshot_.load(std::memory_order_acquire);
+            FreeRetiredSnapshots();
+        }
+
+        ReceiverHandlerList(const ReceiverHandlerList &) = delete;
+
+        ReceiverHandlerList(ReceiverHandlerList &&) = delete;
+
+        ReceiverHandlerList &operator=(const ReceiverHandlerList &) = delete;
+
+        ReceiverHandlerList &operator=(ReceiverHandlerList &&) = delete;
+
+        // Adds a handler, which is active at once if its owner is active
+        void Register(std::string owner, T &&handler) {
+            std::lock_guard<std::mutex> lock{mutex_};
+            bool is_active{std::find(active_owners_.begin(), active_owners_.end(), owner) != active_owners_.end()};
+            entries_.emplace_back(new Entry{std::move(owner), std::move(handler), is_active});
+            if (is_active) {
+                PublishSnapshot();
+            }
+        }
+
+        void Activate(const std::string &owner) {
+            std::lock_guard<std::mutex> lock{mutex_};
+            if (std::find(active_owners_.begin(), active_owners_.end(), owner) == active_owners_.end()) {
+                active_owners_.push_back(owner);
+            }
+            SetActive(owner, true);
+        }
+
+        void Deactivate(const std::string &owner) {
+            std::lock_guard<std::mutex> lock{mutex_};
+            active_owners_.erase(std::remove(active_owners_.begin(), active_owners_.end(), owner),
+                                 active_owners_.end());
+            SetActive(owner, false);
+        }
+
+        // Calls all active handlers in the order of their registration
+        template<typename... Args>
+        void Dispatch(const Args &... args) const {
+            ReaderGuard guard{readers_};
+            const Snapshot *snapshot{snapshot_.load(std::memory_order_seq_cst)};
+            for (T *handler: snapshot->handlers_) {
+                (*handler)(args...);
+            }
+        }
+
+    private:
+        struct Entry {
+            std::string owner_;
+            T handler_;
+            bool is_active_;
+        };
+
+        struct Snapshot {
+            std::vector<T *> handlers_;
+        };
+
+        class ReaderGuard {
+        public:
+            explicit ReaderGuard(std::atomic<uint32_t> &readers) : readers_{readers} {
+                readers_.fetch_add(1, std::memory_order_seq_cst);
+            }
+
+            ~ReaderGuard() { readers_.fetch_sub(1, std::memory_order_release); }
+
+            ReaderGuard(const ReaderGuard &) = delete;
+
+            ReaderGuard &operator=(const ReaderGuard &) = delete;
+
+        private:
+            std::atomic<uint32_t> &readers_;
+        };
+
+        void SetActive(const std::string &owner, bool is_active) {
+            bool changed{false};
+            for (std::unique_ptr<Entry> &entry: entries_) {
+                if ((entry->owner_ == owner) && (entry->is_active_ != is_active)) {
+                    entry->is_active_ = is_active;
+                    changed = true;
+                }
+            }
+            if (changed) {
+                PublishSnapshot();
+            }
+        }
+
+        void PublishSnapshot() {
+            std::unique_ptr<Snapshot> snapshot{new Snapshot{}};
+            for (std::unique_ptr<Entry> &entry: entries_) {
+                if (entry->is_active_) {
+                    snapshot->handlers_.push_back(&entry->handler_);
+                }
+            }
+            retired_snapshots_.push_back(snapshot_.exchange(snapshot.release(), std::memory_order_seq_cst));
+            // a dispatch starting after this check sees the new snapshot
+            if (readers_.load(std::memory_order_seq_cst) == 0) {
+                FreeRetiredSnapshots();
+            }
+        }
+
+        void FreeRetiredSnapshots() {
+            for (Snapshot *snapshot: retired_snapshots_) {
+                delete snapshot;
+            }
+            retired_snapshots_.clear();
+        }
+
+        std::mutex mutex_{};
+        std::vector<std::unique_ptr<Entry>> entries_{};
+        std::vector<std::string> active_owners_{};
+        std::vector<Snapshot *> retired_snapshots_{};
+        std::atomic<Snapshot *> snapshot_;
+        mutable std::atomic<uint32_t> readers_{0};
+    };
+
+}  // namespace vaf
+
+#endif  // INCLUDE_VAF_RECEIVER_HANDLER_LIST_H
@@ -0,0 +1,72 @@
+/*!********************************************************************************************************************
+ *  COPYRIGHT
+ *  -------------------------------------------------------------------------------------------------------------------
+ *
+ *  Copyright (c) 2025 by Vector Informatik GmbH. All rights reserved.
+ *
+ *                This software is copyright protected and proprietary to Vector Informatik GmbH.
+ *                Vector Informatik GmbH grants to you only those rights as set out in the license conditions.
+ *                All other rights remain with Vector Informatik GmbH.
+ *
+ *  -------------------------------------------------------------------------------------------------------------------
+ *  FILE DESCRIPTION
+ *  -----------------------------------------------------------------------------------------------------------------*/
+/*!        file  sample_pool.h
+ *         brief Preallocated samples for data pointers
+ *
+ *********************************************************************************************************************/
+#ifndef INCLUDE_VAF_SAMPLE_POOL_H
+#define INCLUDE_VAF_SAMPLE_POOL_H
+
+#include "vaf/data_ptr.h"
+#include "vaf/internal/pooled_sample.h"
+
+#include <atomic>
+#include <cstdint>
+#include <memory>
+
+namespace vaf {
+
+    /*!
+     * \brief A fixed number of preallocated samples, which DataPtr & ConstDataPtr return to the pool when released
+     * Allocating and releasing pooled samples is lock-free and does not use the heap. A released sample is reset to a
+     * default constructed value. If all samples are in use, a sample is allocated from the heap instead.
+     */
+    template<typename T>
+    class SamplePool {
+    public:
+        explicit SamplePool(std::size_t size) : storage_{new internal::SamplePoolStorage<T>{size}} {}
+
+        // Samples in use stay valid, the storage is freed with the last one
+        ~SamplePool() { storage_->RemoveReference(); }
+
+        SamplePool(const SamplePool &) = delete;
+
+        SamplePool(SamplePool &&) = delete;
+
+        SamplePool &operator=(const SamplePool &) = delete;
+
+        SamplePool &operator=(SamplePool &&) = delete;
+
+        DataPtr<T> Allocate() {
+            internal::PooledSample<T> *sample{storage_->Acquire()};
+            if (sample != nullptr) {
+                return DataPtr<T>{sample};
+            }
+            heap_allocations_.fetch_add(1, std::memory_order_relaxed);
+            return MakeDataPtr<T>();
+        }
+
+        std::size_t Size() const noexcept { return storage_->Size(); }
+
+        // Number of samples allocated from the heap because the pool was exhausted
+        uint64_t HeapAllocations() const noexcept { return heap_allocations_.load(std::memory_order_relaxed); }
+
+    private:
+        internal::SamplePoolStorage<T> *storage_;
+        std::atomic<uint64_t> heap_allocations_{0};
+    };
+
+}  // namespace vaf
+
+#endif  // INCLUDE_VAF_SAMPLE_POOL_H
@@ -12,13 +12,21 @@ ControlInterface::ControlInterface(std::string name, std::vector<std::string> de
 }
 
 void ControlInterface::ReportOperational() {
-  executable_controller_interface_.ReportOperationalOfModule(name_);
+  if (module_id_ != kUnregisteredModule) {
+    executable_controller_interface_.ReportOperationalOfModule(module_id_);
+  } else {
+    executable_controller_interface_.ReportOperationalOfModule(name_);
+  }
 }
 
 void ControlInterface::ReportError(ErrorCode error_code, std::string msg, bool critical) {
   std::cout << "ReportError of module " << name_ << " (msg: " << msg << ")\n";
   Error error{error_code, msg.c_str()};
-  executable_controller_interface_.ReportErrorOfModule(std::move(error), name_, critical);
+  if (module_id_ != kUnregisteredModule) {
+    executable_controller_interface_.ReportErrorOfModule(std::move(error), module_id_, critical);
+  } else {
+    executable_controller_interface_.ReportErrorOfModule(std::move(error), name_, critical);
+  }
 }
 
 void ControlInterface::OnError(const vaf::Error& error) {
@@ -34,6 +42,14 @@ std::vector<std::string> ControlInterface::GetDependencies() {
   return dependencies_;
 }
 
+void ControlInterface::SetModuleId(ModuleId module_id) {
+  module_id_ = module_id;
+}
+
+ModuleId ControlInterface::GetModuleId() const {
+  return module_id_;
+}
+
 void ControlInterface::StartExecutor() {
   executor_.Start();
 }
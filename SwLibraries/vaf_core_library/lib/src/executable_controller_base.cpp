@@ -18,9 +18,11 @@
 
 #include "vaf/executable_controller_base.h"
 #include <algorithm>
+#include <chrono>
 #include <csignal>
-#include <iostream>
+#include <functional>
 #include <memory>
+#include <mutex>
 #include <thread>
 #include <utility>
 #include "vaf/controller_interface.h"
@@ -29,6 +31,12 @@
 
 namespace vaf {
 
+    namespace {
+        constexpr std::chrono::milliseconds kStartupTimeLimit{2000};
+        // Delay before a module is started again after it became not operational
+        constexpr std::chrono::milliseconds kRestartDelay{100};
+    }  // namespace
+
     ExecutableControllerBase::ExecutableControllerBase()
             : signal_handling_init_{[this]() {
         InitializeSignalHandling();
@@ -37,7 +45,13 @@ namespace vaf {
               runtime_{},
               shutdown_requested_{false},
               logger_{vaf::CreateLogger("ECB", "ExecutableControllerBase")},
+              event_mutex_{},
+              event_condition_{},
+              events_{},
               modules_{},
+              states_{},
+              module_ids_{},
+              start_candidates_{},
               user_controller_{CreateUserController()},
               signal_handler_thread_{} {
     }
@@ -57,8 +71,27 @@ namespace vaf {
         DoStart();
         user_controller_->PostStart();
 
+        // Sleeps until a module reports, a startup time limit expires or a module can be restarted
+        std::vector<std::function<void()>> events{};
         while (!IsShutdownRequested()) {
-            std::this_thread::sleep_for(std::chrono::milliseconds{100}); // TODO(virmlj) magic number
+            {
+                std::unique_lock<std::mutex> lock{event_mutex_};
+                auto has_work = [this]() { return shutdown_requested_ || !events_.empty(); };
+                Clock::time_point deadline{NextDeadline()};
+                if (deadline == Clock::time_point::max()) {
+                    event_condition_.wait(lock, has_work);
+                } else {
+                    event_condition_.wait_until(lock, deadline, has_work);
+                }
+                if (shutdown_requested_) {
+                    break;
+                }
+                events.swap(events_);
+            }
+            for (std::function<void()> &event: events) {
+                event();
+            }
+            events.clear();
             StartModules();
             CheckStartingModules();
         }
@@ -68,132 +101,248 @@ namespace vaf {
         user_controller_->PostShutdown();
     }
 
-    void ExecutableControllerBase::InitiateShutdown() noexcept { shutdown_requested_ = true; }
+    void ExecutableControllerBase::InitiateShutdown() noexcept {
+        {
+            std::lock_guard<std::mutex> lock{event_mutex_};
+            shutdown_requested_ = true;
+        }
+        event_condition_.notify_one();
+    }
 
     void ExecutableControllerBase::RegisterModule(std::shared_ptr<vaf::ControlInterface> module) {
-        modules_.emplace_back(module->GetName(), std::move(module), module->GetDependencies());
+        AddModule(modules_.size(), std::move(module));
     }
 
-    void ExecutableControllerBase::ReportOperationalOfModule(std::string name) {
-        ChangeStateOfModule(name, ModuleStates::kOperational);
+    void ExecutableControllerBase::RegisterModule(ModuleId module_id, std::shared_ptr<vaf::ControlInterface> module,
+                                                  std::vector<ModuleId> dependencies) {
+        AddModule(module_id, std::move(module));
+        modules_.back().dependencies_ = std::move(dependencies);
+        modules_.back().has_dependency_ids_ = true;
     }
 
-    void ExecutableControllerBase::ReportErrorOfModule(vaf::Error error, std::string name, bool critical) {
-        user_controller_->OnError(error, name, critical);
-        if (critical) {
-            ChangeStateOfModule(name, ModuleStates::kNotOperational);
+    void ExecutableControllerBase::AddModule(ModuleId module_id, std::shared_ptr<vaf::ControlInterface> module) {
+        std::string name{module->GetName()};
+        if (module_id != modules_.size()) {
+            logger_.LogFatal() << "Module " << name << " is registered with id " << static_cast<int>(module_id)
+                               << " instead of " << static_cast<int>(modules_.size());
+            std::abort();
+        }
+        if (!module_ids_.emplace(name, module_id).second) {
+            logger_.LogFatal() << "Module " << name << " is registered twice";
+            std::abort();
         }
+        module->SetModuleId(module_id);
+        modules_.emplace_back(std::move(name), std::move(module));
+        states_.push_back(ModuleStates::kNotInitialized);
+    }
 
-        for (ModuleContainer &module: modules_) {
-            if (std::find(module.dependencies_.begin(), module.dependencies_.end(), name) !=
-                module.dependencies_.end()) {
-                module.module_->OnError(error);
+    ModuleId ExecutableControllerBase::FindModule(const std::string &name) const {
+        auto module_id = module_ids_.find(name);
+        return module_id == module_ids_.end() ? kUnregisteredModule : module_id->second;
+    }
+
+    void ExecutableControllerBase::ReportOperationalOfModule(std::string name) {
+        PostEvent([this, name]() {
+            ModuleId module_id{FindModule(name)};
+            if (module_id == kUnregisteredModule) {
+                logger_.LogFatal() << "ExecutableControllerBase::ReportOperationalOfModule: Unknown module: " << name;
+                std::abort();
             }
-        }
+            ChangeStateOfModule(module_id, ModuleStates::kOperational);
+        });
     }
 
-    void ExecutableControllerBase::ChangeStateOfModule(std::string name, ModuleStates state) {
-        std::cout << "ExecutableControllerBase::ChangeStateOfModule: name " << name << " state: "
-                  << ModuleStateToString(state) << std::endl;
+    void ExecutableControllerBase::ReportErrorOfModule(vaf::Error error, std::string name, bool critical) {
+        PostEvent([this, error, name, critical]() {
+            ModuleId module_id{FindModule(name)};
+            if (module_id != kUnregisteredModule) {
+                HandleErrorOfModule(error, module_id, critical);
+                return;
+            }
+            user_controller_->OnError(error, name, critical);
+            if (critical) {
+                logger_.LogFatal() << "ExecutableControllerBase::ReportErrorOfModule: Unknown module: " << name;
+                std::abort();
+            }
+        });
+    }
 
-        auto module_pos = std::find_if(modules_.begin(), modules_.end(), [&name](ModuleContainer &m) {
-            return m.name_ == name;
+    void ExecutableControllerBase::ReportOperationalOfModule(ModuleId module_id) {
+        PostEvent([this, module_id]() {
+            if (module_id >= modules_.size()) {
+                logger_.LogFatal() << "ExecutableControllerBase::ReportOperationalOfModule: Unknown module id: "
+                                   << static_cast<int>(module_id);
+                std::abort();
+            }
+            ChangeStateOfModule(module_id, ModuleStates::kOperational);
         });
+    }
 
-        if (module_pos == modules_.end()) {
-            std::cerr << "ExecutableControllerBase::ChangeStateOfModule: Unknown module: " << name << std::endl;
+    void ExecutableControllerBase::ReportErrorOfModule(vaf::Error error, ModuleId module_id, bool critical) {
+        PostEvent([this, error, module_id, critical]() { HandleErrorOfModule(error, module_id, critical); });
+    }
+
+    void ExecutableControllerBase::HandleErrorOfModule(const vaf::Error &error, ModuleId module_id, bool critical) {
+        if (module_id >= modules_.size()) {
+            logger_.LogFatal() << "ExecutableControllerBase::ReportErrorOfModule: Unknown module id: "
+                               << static_cast<int>(module_id);
             std::abort();
         }
+        user_controller_->OnError(error, modules_[module_id].name_, critical);
+        if (critical) {
+            ChangeStateOfModule(module_id, ModuleStates::kNotOperational);
+        }
 
-        ModuleStates current_state{module_pos->state_};
-        module_pos->state_ = state;
+        for (ModuleId dependant: modules_[module_id].dependants_) {
+            modules_[dependant].module_->OnError(error);
+        }
+    }
+
+    void ExecutableControllerBase::PostEvent(std::function<void()> event) {
+        {
+            std::lock_guard<std::mutex> lock{event_mutex_};
+            events_.push_back(std::move(event));
+        }
+        event_condition_.notify_one();
+    }
+
+    void ExecutableControllerBase::ChangeStateOfModule(ModuleId module_id, ModuleStates state) {
+        ModuleContainer &module{modules_[module_id]};
+        ModuleStates current_state{states_[module_id]};
+        states_[module_id] = state;
+        logger_.LogInfo() << "Module " << module.name_ << " changes from " << ModuleStateToString(current_state)
+                          << " to " << ModuleStateToString(state);
 
         switch (state) {
             case ModuleStates::kNotInitialized:
-                std::cerr << "ExecutableControllerBase: Invalid state transition for module " << name << " from "
-                          << ModuleStateToString(current_state) << " to kNotInitialized\n";
+                logger_.LogFatal() << "ExecutableControllerBase: Invalid state transition for module " << module.name_
+                                   << " from " << ModuleStateToString(current_state) << " to kNotInitialized";
                 std::abort();
                 break;
             case ModuleStates::kNotOperational:
                 if (current_state == ModuleStates::kNotInitialized) {
-                    module_pos->module_->Init();
+                    module.module_->Init();
+                    module.deadline_ = Clock::now();
                 } else {
-                    StopEventHandlersForModule(module_pos->name_, module_pos->dependencies_);
-                    module_pos->module_->StopExecutor();
-                    module_pos->module_->Stop();
+                    StopEventHandlersForModule(module_id);
+                    module.module_->StopExecutor();
+                    module.module_->Stop();
+                    module.deadline_ = Clock::now() + kRestartDelay;
                 }
+                AddStartCandidate(module_id);
                 break;
             case ModuleStates::kStarting:
-                module_pos->starting_counter_ = 0;
-                module_pos->module_->Start();
-                module_pos->module_->StartExecutor();
+                module.deadline_ = Clock::now() + kStartupTimeLimit;
+                module.module_->Start();
+                module.module_->StartExecutor();
                 break;
             case ModuleStates::kOperational:
-                StartEventHandlersForModule(module_pos->name_, module_pos->dependencies_);
+                StartEventHandlersForModule(module_id);
+                for (ModuleId dependant: module.dependants_) {
+                    AddStartCandidate(dependant);
+                }
                 break;
             case ModuleStates::kShutdown:
-                module_pos->module_->DeInit();
+                module.module_->DeInit();
                 break;
         }
     }
 
-    void ExecutableControllerBase::StartModules() {
-        auto canStart = [this](ModuleContainer &module) {
-            return std::all_of(module.dependencies_.begin(), module.dependencies_.end(),
-                               [this](const std::string &dependency) {
-                                   for (size_t i = 0; i < modules_.size(); ++i) {
-                                       if (modules_[i].name_ == dependency) {
-                                           if (modules_[i].state_ == ModuleStates::kOperational) {
-                                               return true;
-                                           }
-                                           break;
-                                       }
-                                   }
-                                   return false;
-                               });
-        };
-
+    void ExecutableControllerBase::ResolveDependencies() {
         for (ModuleContainer &module: modules_) {
-            if (module.state_ == ModuleStates::kNotOperational) {
-                if (canStart(module)) {
-                    ChangeStateOfModule(module.name_, ModuleStates::kStarting);
+            module.dependants_.clear();
+        }
+        for (ModuleId module_id{0}; module_id < modules_.size(); ++module_id) {
+            ModuleContainer &module{modules_[module_id]};
+            if (!module.has_dependency_ids_) {
+                module.dependencies_.clear();
+                for (const std::string &dependency: module.module_->GetDependencies()) {
+                    ModuleId dependency_id{FindModule(dependency)};
+                    if (dependency_id == kUnregisteredModule) {
+                        logger_.LogFatal() << "ExecutableControllerBase: Module " << module.name_
+                                           << " depends on unknown module " << dependency;
+                        std::abort();
+                    }
+                    module.dependencies_.push_back(dependency_id);
+                }
+            }
+            for (ModuleId dependency: module.dependencies_) {
+                if (dependency >= modules_.size()) {
+                    logger_.LogFatal() << "ExecutableControllerBase: Module " << module.name_
+                                       << " depends on unknown module id " << static_cast<int>(dependency);
+                    std::abort();
                 }
+                modules_[dependency].dependants_.push_back(module_id);
             }
         }
     }
 
-    void ExecutableControllerBase::StartEventHandlersForModule(const std::string &module_name,
-                                                               const std::vector<std::string> &dependencies) {
-        for (const std::string &dependency: dependencies) {
-            auto dependency_pos{
-                    std::find_if(modules_.begin(), modules_.end(), [&dependency](ModuleContainer &module) {
-                        return module.name_ == dependency;
-                    })};
+    void ExecutableControllerBase::AddStartCandidate(ModuleId module_id) {
+        if (!modules_[module_id].is_start_candidate_) {
+            modules_[module_id].is_start_candidate_ = true;
+            start_candidates_.push_back(module_id);
+        }
+    }
+
+    bool ExecutableControllerBase::CanStart(ModuleId module_id) const {
+        return std::all_of(modules_[module_id].dependencies_.begin(), modules_[module_id].dependencies_.end(),
+                           [this](ModuleId dependency) { return states_[dependency] == ModuleStates::kOperational; });
+    }
+
+    ExecutableControllerBase::Clock::time_point ExecutableControllerBase::NextDeadline() const {
+        Clock::time_point deadline{Clock::time_point::max()};
+        for (ModuleId module_id: start_candidates_) {
+            if (CanStart(module_id)) {
+                deadline = std::min(deadline, modules_[module_id].deadline_);
+            }
+        }
+        for (ModuleId module_id{0}; module_id < states_.size(); ++module_id) {
+            if (states_[module_id] == ModuleStates::kStarting) {
+                deadline = std::min(deadline, modules_[module_id].deadline_);
+            }
+        }
+        return deadline;
+    }
 
-            dependency_pos->module_->StartEventHandlerForModule(module_name);
+    // Only modules which became not operational or whose dependencies became operational are checked. Candidates
+    // with a pending restart delay are kept, the others wait until one of their dependencies becomes operational.
+    void ExecutableControllerBase::StartModules() {
+        std::vector<ModuleId> candidates{};
+        candidates.swap(start_candidates_);
+        Clock::time_point now{Clock::now()};
+
+        for (ModuleId module_id: candidates) {
+            ModuleContainer &module{modules_[module_id]};
+            module.is_start_candidate_ = false;
+            if ((states_[module_id] != ModuleStates::kNotOperational) || !CanStart(module_id)) {
+                continue;
+            }
+            if (module.deadline_ > now) {
+                AddStartCandidate(module_id);
+            } else {
+                ChangeStateOfModule(module_id, ModuleStates::kStarting);
+            }
         }
     }
 
-    void ExecutableControllerBase::StopEventHandlersForModule(const std::string &module_name,
-                                                              const std::vector<std::string> &dependencies) {
-        for (const std::string &dependency: dependencies) {
-            auto dependency_pos{
-                    std::find_if(modules_.begin(), modules_.end(), [&dependency](ModuleContainer &module) {
-                        return module.name_ == dependency;
-                    })};
+    void ExecutableControllerBase::StartEventHandlersForModule(ModuleId module_id) {
+        for (ModuleId dependency: modules_[module_id].dependencies_) {
+            modules_[dependency].module_->StartEventHandlerForModule(modules_[module_id].name_);
+        }
+    }
 
-            dependency_pos->module_->StopEventHandlerForModule(module_name);
+    void ExecutableControllerBase::StopEventHandlersForModule(ModuleId module_id) {
+        for (ModuleId dependency: modules_[module_id].dependencies_) {
+            modules_[dependency].module_->StopEventHandlerForModule(modules_[module_id].name_);
         }
     }
 
     void ExecutableControllerBase::CheckStartingModules() {
-        for (ModuleContainer &module: modules_) {
-            if (module.state_ == ModuleStates::kStarting) {
-                module.starting_counter_ += 1;
-                if (module.starting_counter_ > 20) { // TODO(virmlj) magic number
-                    std::cout << "Module " << module.name_ << " violated its startup time limit\n";
-                    ChangeStateOfModule(module.name_, ModuleStates::kNotOperational);
-                }
+        Clock::time_point now{Clock::now()};
+        for (ModuleId module_id{0}; module_id < states_.size(); ++module_id) {
+            if ((states_[module_id] == ModuleStates::kStarting) && (modules_[module_id].deadline_ <= now)) {
+                logger_.LogWarn() << "Module " << modules_[module_id].name_ << " violated its startup time limit";
+                ChangeStateOfModule(module_id, ModuleStates::kNotOperational);
             }
         }
     }
@@ -202,25 +351,21 @@ namespace vaf {
         SetupExecutionManager();
         signal_handler_thread_ = std::thread{&ExecutableControllerBase::SignalHandlerThread, this};
 
-        for (ModuleContainer &module: modules_) {
-            ChangeStateOfModule(module.name_, ModuleStates::kNotOperational);
+        ResolveDependencies();
+        for (ModuleId module_id{0}; module_id < modules_.size(); ++module_id) {
+            ChangeStateOfModule(module_id, ModuleStates::kNotOperational);
         }
     }
 
-    void ExecutableControllerBase::DoStart() {
-        for (ModuleContainer &module: modules_) {
-            if (module.dependencies_.empty()) {
-                ChangeStateOfModule(module.name_, ModuleStates::kStarting);
-            }
-        }
-    }
+    // Starts the modules without dependencies, their dependants follow as soon as they are operational
+    void ExecutableControllerBase::DoStart() { StartModules(); }
 
     void ExecutableControllerBase::DoShutdown() {
-        for (auto iterator = modules_.rbegin(); iterator != modules_.rend(); ++iterator) {
-            ChangeStateOfModule(iterator->name_, ModuleStates::kNotOperational);
+        for (ModuleId module_id{modules_.size()}; module_id > 0; --module_id) {
+            ChangeStateOfModule(module_id - 1, ModuleStates::kNotOperational);
         }
-        for (auto iterator = modules_.rbegin(); iterator != modules_.rend(); ++iterator) {
-            ChangeStateOfModule(iterator->name_, ModuleStates::kShutdown);
+        for (ModuleId module_id{modules_.size()}; module_id > 0; --module_id) {
+            ChangeStateOfModule(module_id - 1, ModuleStates::kShutdown);
         }
         ReportStateToExecutionManager(false);
         signal_handler_thread_.join();
@@ -282,7 +427,7 @@ namespace vaf {
                 logger_.LogInfo() << "Received SIGTERM or SIGINT, requesting application shutdown.";
                 if (!shutdown_requested_) {
                     // Request application exit. (SignalHandler initiate the shutdown!)
-                    shutdown_requested_ = true;
+                    InitiateShutdown();
                 }
             }
         } while (!shutdown_requested_);
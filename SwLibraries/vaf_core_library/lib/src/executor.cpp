@@ -1,6 +1,8 @@
 #include "vaf/executor.h"
 
+#include <algorithm>
 #include <iostream>
+#include <numeric>
 
 namespace vaf {
 
@@ -36,15 +38,71 @@ namespace vaf {
 
     std::chrono::nanoseconds RunnableHandle::Budget() const { return budget_; }
 
-    Executor::Executor(std::chrono::milliseconds running_period)
+    const DurationStatistics &RunnableHandle::Statistics() const { return statistics_; }
+
+    DurationStatistics &RunnableHandle::Statistics() { return statistics_; }
+
+    namespace {
+
+        // Runnables are related, if one of them might depend on the results of the other
+        bool IsRelated(RunnableHandle &a, RunnableHandle &b) {
+            auto contains{[](const std::vector<std::string> &names, const std::string &name) {
+                return std::find(names.begin(), names.end(), name) != names.end();
+            }};
+            return (a.Owner() == b.Owner()) || contains(a.RunAfter(), b.Owner()) || contains(b.RunAfter(), a.Owner());
+        }
+
+        // limits of the schedule table, longer hyperperiods fall back to checking all runnables each tick
+        constexpr uint64_t kMaxHyperperiod{100000};
+        constexpr uint64_t kMaxScheduleSize{1000000};
+
+        uint64_t Gcd(uint64_t a, uint64_t b) {
+            while (b != 0) {
+                uint64_t rest{a % b};
+                a = b;
+                b = rest;
+            }
+            return a;
+        }
+
+        std::atomic<Executor *> current_executor{nullptr};
+
+        std::string FormatStatistics(const DurationStatistics &statistics) {
+            return "count " + std::to_string(statistics.Count()) + ", overruns " +
+                   std::to_string(statistics.Overruns()) + ", min " + std::to_string(statistics.Min().count()) +
+                   "ns, mean " + std::to_string(statistics.Mean().count()) + "ns, p99 " +
+                   std::to_string(statistics.Percentile(99.0).count()) + "ns, max " +
+                   std::to_string(statistics.Max().count()) + "ns";
+        }
+
+    } // namespace
+
+    Executor::Executor(std::chrono::milliseconds running_period, std::size_t thread_count, bool enable_statistics)
             : running_period_{running_period},
+              statistics_enabled_{enable_statistics},
+              thread_count_{std::max<std::size_t>(thread_count, 1)},
               thread_{[this]() { ExecutorThread(); }},
               logger_{vaf::CreateLogger("E", "Executor")} {
+        // the executor thread works on the runnables too
+        for (std::size_t i{1}; i < thread_count_; ++i) {
+            workers_.emplace_back([this]() { WorkerThread(); });
+        }
+        current_executor = this;
     }
 
     Executor::~Executor() {
+        Executor *self{this};
+        current_executor.compare_exchange_strong(self, nullptr);
         exit_requested_ = true;
         thread_.join();
+        {
+            std::lock_guard<std::mutex> lock{mutex_};
+            stop_workers_ = true;
+        }
+        cv_.notify_all();
+        for (std::thread &worker: workers_) {
+            worker.join();
+        }
     }
 
     void Executor::ExecutorThread() {
@@ -52,18 +110,26 @@ namespace vaf {
         std::chrono::steady_clock::time_point next_run{std::chrono::steady_clock::now()};
         while (!exit_requested_) {
             next_run += running_period_;
+            std::chrono::steady_clock::time_point tick_start{std::chrono::steady_clock::now()};
 
-            for (std::shared_ptr<RunnableHandle> &runnable: runnables_) {
-                if (runnable->IsActive()) {
-                    if (counter >= runnable->Offset()) {
-                        if (((counter - runnable->Offset()) % runnable->Period()) == 0) {
-                            ExecuteRunnable(*runnable);
-                        }
-                    }
+            if (thread_count_ > 1) {
+                ExecuteRunnablesParallel(counter);
+            } else {
+                UpdateSchedule();
+                CollectDueRunnables(counter);
+                for (std::size_t index: due_runnables_) {
+                    ExecuteRunnable(*scheduled_runnables_[index]);
                 }
             }
 
-            if (std::chrono::steady_clock::now() > next_run) {
+            std::chrono::steady_clock::time_point tick_end{std::chrono::steady_clock::now()};
+            if (statistics_enabled_) {
+                tick_statistics_.Record(tick_end - tick_start, tick_end > next_run);
+                jitter_statistics_.Record(tick_start - (next_run - running_period_));
+            }
+
+            if (tick_end > next_run) {
+                std::lock_guard<std::mutex> lock{log_mutex_};
                 logger_.LogWarn() << "Executor could no execute all runnables in time.";
             }
 
@@ -75,18 +141,216 @@ namespace vaf {
 
     void Executor::ExecuteRunnable(RunnableHandle &runnable) {
         std::chrono::nanoseconds budget = runnable.Budget();
-        if (budget.count() == 0) {
+        if ((budget.count() == 0) && !statistics_enabled_) {
             runnable.Execute();
         } else {
             auto start{std::chrono::high_resolution_clock::now()};
             runnable.Execute();
             auto end{std::chrono::high_resolution_clock::now()};
-            if ((end - start) > budget) {
+            bool overrun{(budget.count() != 0) && ((end - start) > budget)};
+            if (statistics_enabled_) {
+                runnable.Statistics().Record(end - start, overrun);
+            }
+            if (overrun) {
+                std::lock_guard<std::mutex> lock{log_mutex_};
                 logger_.LogWarn() << "Budget violation of runnable from " << runnable.Owner().c_str();
             }
         }
     }
 
+    bool Executor::IsStatisticsEnabled() const { return statistics_enabled_; }
+
+    const DurationStatistics &Executor::TickStatistics() const { return tick_statistics_; }
+
+    const DurationStatistics &Executor::JitterStatistics() const { return jitter_statistics_; }
+
+    void Executor::VisitRunnableStatistics(
+            const std::function<void(const std::string &, const std::string &, const DurationStatistics &)> &visitor) {
+        std::lock_guard<std::mutex> lock{runnables_mutex_};
+        for (std::shared_ptr<RunnableHandle> &runnable: runnables_) {
+            visitor(runnable->Owner(), runnable->Name(), runnable->Statistics());
+        }
+    }
+
+    void Executor::ResetStatistics() {
+        tick_statistics_.Reset();
+        jitter_statistics_.Reset();
+        std::lock_guard<std::mutex> lock{runnables_mutex_};
+        for (std::shared_ptr<RunnableHandle> &runnable: runnables_) {
+            runnable->Statistics().Reset();
+        }
+    }
+
+    void Executor::DumpStatistics() {
+        std::lock_guard<std::mutex> runnables_lock{runnables_mutex_};
+        std::lock_guard<std::mutex> lock{log_mutex_};
+        logger_.LogInfo() << "Ticks: " << FormatStatistics(tick_statistics_).c_str();
+        logger_.LogInfo() << "Tick start jitter: " << FormatStatistics(jitter_statistics_).c_str();
+        for (std::shared_ptr<RunnableHandle> &runnable: runnables_) {
+            logger_.LogInfo() << "Runnable " << runnable->Owner().c_str() << " " << runnable->Name().c_str() << ": "
+                              << FormatStatistics(runnable->Statistics()).c_str();
+        }
+    }
+
+    void Executor::UpdateSchedule() {
+        if (!runnables_changed_) {
+            return;
+        }
+        {
+            std::lock_guard<std::mutex> lock{runnables_mutex_};
+            runnables_changed_ = false;
+            scheduled_runnables_ = runnables_;
+        }
+
+        bool use_table{!scheduled_runnables_.empty()};
+        uint64_t hyperperiod{1};
+        uint64_t schedule_size{0};
+        for (std::shared_ptr<RunnableHandle> &runnable: scheduled_runnables_) {
+            if (runnable->Period() == 0) {
+                use_table = false;
+                break;
+            }
+            hyperperiod = hyperperiod / Gcd(hyperperiod, runnable->Period()) * runnable->Period();
+            if (hyperperiod > kMaxHyperperiod) {
+                use_table = false;
+                break;
+            }
+        }
+        if (use_table) {
+            for (std::shared_ptr<RunnableHandle> &runnable: scheduled_runnables_) {
+                schedule_size += hyperperiod / runnable->Period();
+            }
+            use_table = schedule_size <= kMaxScheduleSize;
+        }
+
+        hyperperiod_ = use_table ? hyperperiod : 0;
+        schedule_begin_.clear();
+        schedule_.clear();
+        if (use_table) {
+            // counting sort of the runnables by due tick, keeps the order of the runnables within a tick
+            schedule_begin_.assign(hyperperiod_ + 1, 0);
+            for (std::shared_ptr<RunnableHandle> &runnable: scheduled_runnables_) {
+                for (uint64_t tick{runnable->Offset() % runnable->Period()}; tick < hyperperiod_;
+                     tick += runnable->Period()) {
+                    ++schedule_begin_[tick + 1];
+                }
+            }
+            std::partial_sum(schedule_begin_.begin(), schedule_begin_.end(), schedule_begin_.begin());
+            schedule_.resize(schedule_size);
+            std::vector<std::size_t> next{schedule_begin_.begin(), schedule_begin_.end() - 1};
+            for (std::size_t i{0}; i < scheduled_runnables_.size(); ++i) {
+                RunnableHandle &runnable{*scheduled_runnables_[i]};
+                for (uint64_t tick{runnable.Offset() % runnable.Period()}; tick < hyperperiod_;
+                     tick += runnable.Period()) {
+                    schedule_[next[tick]++] = i;
+                }
+            }
+        }
+        due_runnables_.reserve(scheduled_runnables_.size());
+
+        if (thread_count_ > 1) {
+            successors_.assign(scheduled_runnables_.size(), {});
+            for (std::size_t i{0}; i < scheduled_runnables_.size(); ++i) {
+                for (std::size_t j{i + 1}; j < scheduled_runnables_.size(); ++j) {
+                    // related runnables keep the order of the single threaded executor
+                    if (IsRelated(*scheduled_runnables_[i], *scheduled_runnables_[j])) {
+                        successors_[i].push_back(j);
+                    }
+                }
+            }
+            due_.assign(scheduled_runnables_.size(), false);
+            pending_predecessors_.assign(scheduled_runnables_.size(), 0);
+        }
+    }
+
+    void Executor::CollectDueRunnables(uint64_t counter) {
+        due_runnables_.clear();
+        if (hyperperiod_ == 0) {
+            for (std::size_t i{0}; i < scheduled_runnables_.size(); ++i) {
+                RunnableHandle &runnable{*scheduled_runnables_[i]};
+                if (runnable.IsActive() && (counter >= runnable.Offset()) &&
+                    (((counter - runnable.Offset()) % runnable.Period()) == 0)) {
+                    due_runnables_.push_back(i);
+                }
+            }
+        } else {
+            uint64_t tick{counter % hyperperiod_};
+            for (std::size_t i{schedule_begin_[tick]}; i < schedule_begin_[tick + 1]; ++i) {
+                RunnableHandle &runnable{*scheduled_runnables_[schedule_[i]]};
+                if (runnable.IsActive() && (counter >= runnable.Offset())) {
+                    due_runnables_.push_back(schedule_[i]);
+                }
+            }
+        }
+    }
+
+    void Executor::ExecuteRunnablesParallel(uint64_t counter) {
+        std::unique_lock<std::mutex> lock{mutex_};
+        UpdateSchedule();
+        CollectDueRunnables(counter);
+
+        for (std::size_t index: due_runnables_) {
+            due_[index] = true;
+            pending_predecessors_[index] = 0;
+        }
+        for (std::size_t index: due_runnables_) {
+            for (std::size_t successor: successors_[index]) {
+                if (due_[successor]) {
+                    ++pending_predecessors_[successor];
+                }
+            }
+        }
+        for (std::size_t index: due_runnables_) {
+            ++outstanding_;
+            if (pending_predecessors_[index] == 0) {
+                ready_.push_back(index);
+            }
+        }
+        cv_.notify_all();
+
+        // the tick ends when all due runnables are executed
+        while (outstanding_ > 0) {
+            if (ready_.empty()) {
+                cv_.wait(lock, [this]() { return (outstanding_ == 0) || !ready_.empty(); });
+            } else {
+                ExecuteReadyRunnable(lock);
+            }
+        }
+        for (std::size_t index: due_runnables_) {
+            due_[index] = false;
+        }
+    }
+
+    void Executor::ExecuteReadyRunnable(std::unique_lock<std::mutex> &lock) {
+        std::size_t index{ready_.front()};
+        ready_.pop_front();
+
+        lock.unlock();
+        ExecuteRunnable(*scheduled_runnables_[index]);
+        lock.lock();
+
+        for (std::size_t successor: successors_[index]) {
+            if (due_[successor] && (--pending_predecessors_[successor] == 0)) {
+                ready_.push_back(successor);
+            }
+        }
+        --outstanding_;
+        cv_.notify_all();
+    }
+
+    void Executor::WorkerThread() {
+        std::unique_lock<std::mutex> lock{mutex_};
+        while (true) {
+            cv_.wait(lock, [this]() { return stop_workers_ || !ready_.empty(); });
+            if (stop_workers_) {
+                break;
+            }
+            ExecuteReadyRunnable(lock);
+        }
+    }
+
+    Executor *GetExecutor() { return current_executor; }
+
     ModuleExecutor::ModuleExecutor(Executor &executor, std::string name, std::vector<std::string> dependencies)
             : executor_{executor},
               handles_{},
@@ -0,0 +1,92 @@
+#include "vaf/executor_statistics.h"
+
+#include <algorithm>
+#include <cmath>
+
+namespace vaf {
+
+    namespace {
+
+        std::size_t GetBucket(uint64_t value) {
+            std::size_t bucket{0};
+            while ((value != 0) && (bucket < (DurationStatistics::kBucketCount - 1))) {
+                value >>= 1U;
+                ++bucket;
+            }
+            return bucket;
+        }
+
+    } // namespace
+
+    void DurationStatistics::Record(std::chrono::nanoseconds duration, bool overrun) noexcept {
+        uint64_t value{static_cast<uint64_t>(std::max<int64_t>(duration.count(), 0))};
+
+        count_.fetch_add(1, std::memory_order_relaxed);
+        sum_.fetch_add(value, std::memory_order_relaxed);
+        if (overrun) {
+            overruns_.fetch_add(1, std::memory_order_relaxed);
+        }
+        buckets_[GetBucket(value)].fetch_add(1, std::memory_order_relaxed);
+
+        uint64_t min{min_.load(std::memory_order_relaxed)};
+        while ((value < min) && !min_.compare_exchange_weak(min, value, std::memory_order_relaxed)) {
+        }
+        uint64_t max{max_.load(std::memory_order_relaxed)};
+        while ((value > max) && !max_.compare_exchange_weak(max, value, std::memory_order_relaxed)) {
+        }
+    }
+
+    void DurationStatistics::Reset() noexcept {
+        count_.store(0, std::memory_order_relaxed);
+        overruns_.store(0, std::memory_order_relaxed);
+        sum_.store(0, std::memory_order_relaxed);
+        min_.store(std::numeric_limits<uint64_t>::max(), std::memory_order_relaxed);
+        max_.store(0, std::memory_order_relaxed);
+        for (std::atomic<uint64_t> &bucket: buckets_) {
+            bucket.store(0, std::memory_order_relaxed);
+        }
+    }
+
+    uint64_t DurationStatistics::Count() const noexcept { return count_.load(std::memory_order_relaxed); }
+
+    uint64_t DurationStatistics::Overruns() const noexcept { return overruns_.load(std::memory_order_relaxed); }
+
+    std::chrono::nanoseconds DurationStatistics::Min() const noexcept {
+        return std::chrono::nanoseconds{Count() == 0 ? 0 : min_.load(std::memory_order_relaxed)};
+    }
+
+    std::chrono::nanoseconds DurationStatistics::Max() const noexcept {
+        return std::chrono::nanoseconds{max_.load(std::memory_order_relaxed)};
+    }
+
+    std::chrono::nanoseconds DurationStatistics::Mean() const noexcept {
+        uint64_t count{Count()};
+        return std::chrono::nanoseconds{count == 0 ? 0 : sum_.load(std::memory_order_relaxed) / count};
+    }
+
+    std::chrono::nanoseconds DurationStatistics::Percentile(double percentile) const noexcept {
+        uint64_t total{0};
+        for (const std::atomic<uint64_t> &bucket: buckets_) {
+            total += bucket.load(std::memory_order_relaxed);
+        }
+        if (total == 0) {
+            return std::chrono::nanoseconds{0};
+        }
+
+        auto rank{static_cast<uint64_t>(std::ceil(std::min(std::max(percentile, 0.0), 100.0) / 100.0 * total))};
+        uint64_t seen{0};
+        for (std::size_t i{0}; i < kBucketCount; ++i) {
+            seen += buckets_[i].load(std::memory_order_relaxed);
+            if ((seen >= rank) && (seen > 0)) {
+                uint64_t upper_bound{i == 0 ? 0 : (uint64_t{1} << i) - 1};
+                return std::min(std::chrono::nanoseconds{upper_bound}, Max());
+            }
+        }
+        return Max();
+    }
+
+    uint64_t DurationStatistics::BucketCount(std::size_t bucket) const noexcept {
+        return bucket < kBucketCount ? buckets_[bucket].load(std::memory_order_relaxed) : 0;
+    }
+
+} // namespace vaf
@@ -1,13 +1,287 @@
 #include "vaf/logging.h"
 
+#include <algorithm>
+#include <condition_variable>
+#include <cstdio>
+#include <cstring>
+#include <thread>
+#include <vector>
+
 namespace vaf {
 
+    /*!
+     * \brief Bounded lock-free multi producer ring buffer of log records with a background drain thread
+     * Producers never block. The consumer side is serialized by the sink mutex of the LoggerSingleton, so records are
+     * written by the drain thread or, for fatal records, by the logging thread itself. The drain thread parks while the
+     * ring is empty and the producer that publishes into the parked ring wakes it up.
+     */
+    class AsyncLogBackend {
+    public:
+        explicit AsyncLogBackend(std::size_t capacity) : slots_(GetSlotCount(capacity)), mask_{slots_.size() - 1} {
+            for (std::size_t i{0}; i < slots_.size(); ++i) {
+                slots_[i].sequence.store(i, std::memory_order_relaxed);
+            }
+        }
+
+        bool Push(const LogRecord &record) noexcept {
+            std::size_t position{enqueue_position_.load(std::memory_order_relaxed)};
+            Slot *slot{nullptr};
+            for (;;) {
+                slot = &slots_[position & mask_];
+                std::size_t sequence{slot->sequence.load(std::memory_order_acquire)};
+                auto difference = static_cast<std::ptrdiff_t>(sequence - position);
+                if (difference == 0) {
+                    if (enqueue_position_.compare_exchange_weak(position, position + 1, std::memory_order_relaxed)) {
+                        break;
+                    }
+                } else if (difference < 0) {
+                    dropped_.fetch_add(1, std::memory_order_relaxed);
+                    WakeDrainThread();
+                    return false;
+                } else {
+                    position = enqueue_position_.load(std::memory_order_relaxed);
+                }
+            }
+
+            slot->record.ctx_id = record.ctx_id;
+            slot->record.ctx_description = record.ctx_description;
+            slot->record.level = record.level;
+            slot->record.size = record.size;
+            std::memcpy(slot->record.message, record.message, record.size);
+            // Sequentially consistent, so a parking drain thread sees the record or this producer sees the park flag
+            slot->sequence.store(position + 1, std::memory_order_seq_cst);
+            WakeDrainThread();
+            return true;
+        }
+
+        // Writes all buffered records to the sink, the caller must hold the sink mutex
+        std::size_t Drain(LogSink &sink) {
+            std::size_t count{0};
+            for (;;) {
+                Slot &slot{slots_[dequeue_position_ & mask_]};
+                if (slot.sequence.load(std::memory_order_acquire) != dequeue_position_ + 1) {
+                    break;
+                }
+                sink.Write(slot.record);
+                slot.sequence.store(dequeue_position_ + mask_ + 1, std::memory_order_release);
+                ++dequeue_position_;
+                ++count;
+            }
+
+            uint64_t dropped{dropped_.exchange(0, std::memory_order_relaxed)};
+            if (dropped != 0) {
+                dropped_total_.fetch_add(dropped, std::memory_order_relaxed);
+                LogRecord record{};
+                record.ctx_id = "LOG";
+                record.ctx_description = "Logging";
+                record.level = 3; // WARN
+                int size{std::snprintf(record.message, LogRecord::kMaxMessageSize,
+                                       "%llu log records dropped, the log buffer is full.",
+                                       static_cast<unsigned long long>(dropped))};
+                record.size = static_cast<uint16_t>(std::min<std::size_t>(std::max(size, 0),
+                                                                          LogRecord::kMaxMessageSize - 1));
+                sink.Write(record);
+                ++count;
+            }
+
+            if (count != 0) {
+                sink.Flush();
+            }
+            return count;
+        }
+
+        void Start(std::mutex &sink_mutex, std::unique_ptr<LogSink> &sink) {
+            running_.store(true, std::memory_order_relaxed);
+            thread_ = std::thread{[this, &sink_mutex, &sink]() {
+                while (running_.load(std::memory_order_relaxed)) {
+                    bool park{false};
+                    {
+                        std::lock_guard<std::mutex> lock{sink_mutex};
+                        if (Drain(*sink) == 0) {
+                            // Announce the park before the last look at the ring, a producer publishing after this
+                            // look sees the flag and wakes the thread up
+                            parked_.store(true, std::memory_order_seq_cst);
+                            park = IsEmpty();
+                            if (!park) {
+                                parked_.store(false, std::memory_order_relaxed);
+                            }
+                        }
+                    }
+                    if (park) {
+                        std::unique_lock<std::mutex> lock{wake_mutex_};
+                        wake_condition_.wait_for(lock, kParkTimeout, [this]() {
+                            return !parked_.load(std::memory_order_relaxed) ||
+                                   !running_.load(std::memory_order_relaxed);
+                        });
+                        parked_.store(false, std::memory_order_relaxed);
+                    }
+                }
+            }};
+        }
+
+        void Stop() {
+            running_.store(false, std::memory_order_relaxed);
+            {
+                std::lock_guard<std::mutex> lock{wake_mutex_};
+                wake_condition_.notify_one();
+            }
+            if (thread_.joinable()) {
+                thread_.join();
+            }
+        }
+
+        uint64_t DroppedRecords() const noexcept {
+            return dropped_total_.load(std::memory_order_relaxed) + dropped_.load(std::memory_order_relaxed);
+        }
+
+    private:
+        struct Slot {
+            std::atomic<std::size_t> sequence{0};
+            LogRecord record;
+        };
+
+        // Only a lost race against a drain thread that is just parking waits for this timeout
+        static constexpr std::chrono::milliseconds kParkTimeout{1000};
+        static constexpr int kWakeAttempts{64};
+
+        bool IsEmpty() const noexcept {
+            return slots_[dequeue_position_ & mask_].sequence.load(std::memory_order_seq_cst) != dequeue_position_ + 1;
+        }
+
+        // Wakes a parked drain thread, only the producer that takes the park flag notifies and it never waits for the
+        // wake mutex, which the drain thread holds for a few instructions only
+        void WakeDrainThread() noexcept {
+            if (!parked_.load(std::memory_order_seq_cst) || !parked_.exchange(false, std::memory_order_relaxed)) {
+                return;
+            }
+            for (int attempt{0}; attempt < kWakeAttempts; ++attempt) {
+                std::unique_lock<std::mutex> lock{wake_mutex_, std::try_to_lock};
+                if (lock.owns_lock()) {
+                    wake_condition_.notify_one();
+                    return;
+                }
+                std::this_thread::yield();
+            }
+        }
+
+        static std::size_t GetSlotCount(std::size_t capacity) {
+            std::size_t count{2};
+            while (count < capacity) {
+                count <<= 1U;
+            }
+            return count;
+        }
+
+        std::vector<Slot> slots_;
+        const std::size_t mask_;
+        std::atomic<std::size_t> enqueue_position_{0};
+        std::size_t dequeue_position_{0};
+        std::atomic<uint64_t> dropped_{0};
+        std::atomic<uint64_t> dropped_total_{0};
+        std::atomic<bool> running_{false};
+        std::atomic<bool> parked_{false};
+        std::mutex wake_mutex_{};
+        std::condition_variable wake_condition_{};
+        std::thread thread_{};
+    };
+
+    constexpr std::chrono::milliseconds AsyncLogBackend::kParkTimeout;
+    constexpr int AsyncLogBackend::kWakeAttempts;
+
+    void TextLogSink::Write(const LogRecord &record) {
+        std::cout << "[" << record.ctx_id << ": " << record.ctx_description << "] ";
+        std::cout.write(record.message, record.size);
+        std::cout << '\n';
+    }
+
+    void TextLogSink::Flush() {
+        std::cout << std::flush;
+    }
+
+    void BinaryLogSink::Write(const LogRecord &record) {
+        stream_.put(static_cast<char>(record.level));
+        WriteString(record.ctx_id, std::strlen(record.ctx_id));
+        WriteString(record.ctx_description, std::strlen(record.ctx_description));
+        WriteString(record.message, record.size);
+    }
+
+    void BinaryLogSink::Flush() {
+        stream_.flush();
+    }
+
+    void BinaryLogSink::WriteString(const char *s, std::size_t size) {
+        auto length = static_cast<uint16_t>(std::min<std::size_t>(size, UINT16_MAX));
+        stream_.put(static_cast<char>(length & 0xFFU));
+        stream_.put(static_cast<char>(length >> 8U));
+        stream_.write(s, length);
+    }
+
 // Initialize static members outside the class definition
     std::mutex LoggerSingleton::mtx;
     LoggerSingleton *LoggerSingleton::instance = nullptr;
 
+    LoggerSingleton::LoggerSingleton() : log_level_{Logger::LogLevel::FATAL},
+                                         sink_{new TextLogSink{}},
+                                         default_logger_{CreateLogger("DL", "DefaultLogger")} {}
+
+    LoggerSingleton::~LoggerSingleton() {
+        StopAsyncLogging();
+    }
+
+    void LoggerSingleton::SetLogSink(std::unique_ptr<LogSink> sink) {
+        std::lock_guard<std::mutex> lock{sink_mtx_};
+        AsyncLogBackend *backend{async_backend_.load(std::memory_order_acquire)};
+        if (backend != nullptr) {
+            backend->Drain(*sink_);
+        }
+        sink_->Flush();
+        sink_ = std::move(sink);
+    }
+
+    void LoggerSingleton::StartAsyncLogging(std::size_t capacity) {
+        std::lock_guard<std::mutex> lock{async_mtx_};
+        if (async_backend_.load(std::memory_order_relaxed) != nullptr) {
+            return;
+        }
+        // the buffer is never freed, a producer might still hold a pointer to it after stopping
+        if (async_backend_storage_ == nullptr) {
+            async_backend_storage_.reset(new AsyncLogBackend{capacity});
+        }
+        async_backend_storage_->Start(sink_mtx_, sink_);
+        async_backend_.store(async_backend_storage_.get(), std::memory_order_release);
+    }
+
+    void LoggerSingleton::StopAsyncLogging() {
+        std::lock_guard<std::mutex> lock{async_mtx_};
+        AsyncLogBackend *backend{async_backend_.exchange(nullptr, std::memory_order_acq_rel)};
+        if (backend != nullptr) {
+            backend->Stop();
+            std::lock_guard<std::mutex> sink_lock{sink_mtx_};
+            backend->Drain(*sink_);
+        }
+    }
+
+    uint64_t LoggerSingleton::DroppedRecords() const noexcept {
+        return async_backend_storage_ == nullptr ? 0 : async_backend_storage_->DroppedRecords();
+    }
+
+    void LoggerSingleton::Write(const LogRecord &record) noexcept {
+        AsyncLogBackend *backend{async_backend_.load(std::memory_order_acquire)};
+        if ((backend != nullptr) && (record.level != Logger::LogLevel::FATAL)) {
+            backend->Push(record);
+            return;
+        }
+
+        std::lock_guard<std::mutex> lock{sink_mtx_};
+        if (backend != nullptr) {
+            backend->Drain(*sink_);
+        }
+        sink_->Write(record);
+        sink_->Flush();
+    }
+
     Logger &CreateLogger(const char *ctx_id, const char *ctx_description) {
         return LoggerSingleton::getInstance()->CreateLogger(ctx_id, ctx_description);
     }
 
-} // namespace vaf
\ No newline at end of file
+} // namespace vaf
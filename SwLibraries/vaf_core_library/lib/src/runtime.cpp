@@ -5,9 +5,11 @@ namespace vaf {
 
     Runtime::Runtime() {
         vaf::LoggerSingleton::getInstance()->SetLogLevelVerbose();
+        vaf::LoggerSingleton::getInstance()->StartAsyncLogging();
     }
 
     Runtime::~Runtime() {
+        vaf::LoggerSingleton::getInstance()->StopAsyncLogging();
         vaf::LoggerSingleton::getInstance()->CleanLoggers();
     }
 
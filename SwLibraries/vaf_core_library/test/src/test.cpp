@@ -1,8 +1,10 @@
 #include <iostream>
+#include <vector>
 #include "vaf/future.h"
 #include "vaf/internal/data_ptr_helper.h"
 #include "vaf/result.h"
 #include "vaf/logging.h"
+#include "vaf/sample_pool.h"
 
 int main() {
     vaf::Result<void> r1;
@@ -25,6 +27,56 @@ int main() {
 
     if (test_unique_ptr) std::cout << "3 - The result of test_unique_ptr is: " << *test_unique_ptr << std::endl;
 
+    // An exhausted pool falls back to the heap, released samples return to the pool
+    {
+        vaf::SamplePool<int> pool{2};
+        std::vector<vaf::DataPtr<int>> samples;
+        for (int i{0}; i < 3; ++i) {
+            samples.push_back(pool.Allocate());
+            *samples.back() = i;
+        }
+        if ((pool.HeapAllocations() != 1) || (*samples[0] != 0) || (*samples[2] != 2)) {
+            std::cout << "SamplePool: third sample not allocated from the heap" << std::endl;
+            return 1;
+        }
+
+        {
+            vaf::ConstDataPtr<const int> published{vaf::internal::DataPtrHelper<int>::toConstDataPtr(samples[0])};
+            samples.clear();
+            samples.push_back(pool.Allocate());
+            samples.push_back(pool.Allocate());
+            if ((pool.HeapAllocations() != 2) || (*published != 0)) {
+                std::cout << "SamplePool: published sample released to the pool" << std::endl;
+                return 1;
+            }
+        }
+
+        samples.clear();
+        samples.push_back(pool.Allocate());
+        samples.push_back(pool.Allocate());
+        if (pool.HeapAllocations() != 2) {
+            std::cout << "SamplePool: released samples not reused" << std::endl;
+            return 1;
+        }
+        if ((*samples[0] != 0) || (*samples[1] != 0)) {
+            std::cout << "SamplePool: reused int sample not reset" << std::endl;
+            return 1;
+        }
+    }
+
+    {
+        vaf::SamplePool<std::vector<int>> pool{1};
+        {
+            vaf::DataPtr<std::vector<int>> sample{pool.Allocate()};
+            sample->assign(100, 7);
+        }
+        vaf::DataPtr<std::vector<int>> sample{pool.Allocate()};
+        if ((pool.HeapAllocations() != 0) || !sample->empty()) {
+            std::cout << "SamplePool: reused vector sample not reset" << std::endl;
+            return 1;
+        }
+    }
+
     vaf::LoggerSingleton::getInstance()->SetLogLevelVerbose();
 
     vaf::Logger &logger_ = vaf::CreateLogger("MyID", "MyLogger");
@@ -4,8 +4,13 @@
 Could be used to define the public interface of the module.
 """
 
+# opt-in profiling has to be installed before any other import, see VAF_PROFILE_IMPORTS
+from vaf.cli_core.common import profiling as _profiling
+
+_profiling.install_profiler()
+
 # TODO: Import modules and objects that belong to the public interface  # pylint: disable=W0511
-from vaf.cli_core.common.exceptions import VafProjectTemplateError
+from vaf.cli_core.common.exceptions import VafProjectTemplateError  # pylint: disable=wrong-import-position
 
 # VAFPY is accessable through VAFCLI
-from vaf.vafpy import *  # noqa: F403
+from vaf.vafpy import *  # noqa: F403  # pylint: disable=wrong-import-position
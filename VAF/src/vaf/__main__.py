@@ -11,17 +11,8 @@ from importlib import metadata
 import click
 
 # Internal imports
-from vaf.cli_core.bootstrap.cli_subcommands.project_subcmd import project_init
-from vaf.cli_core.bootstrap.cli_subcommands.workspace_subcmd import workspace_init
-from vaf.cli_core.common.click_help import CLICK_CONTEXT_SETTINGS, CustomHelpGroup, simple_user_warning
-from vaf.cli_core.main.cli_subcommands.make_subcmd import make_build, make_clean, make_install, make_preset
-from vaf.cli_core.main.cli_subcommands.model_subcmd import model_generate, model_import, model_update
-from vaf.cli_core.main.cli_subcommands.project_subcmd import (
-    project_create,
-    project_generate,
-    project_import,
-    project_remove,
-)
+# Subcommands are imported lazily, so help & shell completion don't pay for the heavy imports of the commands.
+from vaf.cli_core.common.click_help import CLICK_CONTEXT_SETTINGS, CustomHelpGroup, LazyGroup, simple_user_warning
 
 # Define pip package name
 PACKAGE_NAME = "vaf"
@@ -51,63 +42,110 @@ def cli() -> None:
     """This function is the entrypoint for the click arguments cli."""
 
 
+BOOTSTRAP_SUBCMD = "vaf.cli_core.bootstrap.cli_subcommands"
+MAIN_SUBCMD = "vaf.cli_core.main.cli_subcommands"
+
+
 # Command 'project'
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        # vaf project init #
+        "init": (
+            f"{BOOTSTRAP_SUBCMD}.project_subcmd:project_init",
+            "Initiate a project of chosen VAF project type and template.",
+        ),
+        # vaf project create #
+        "create": (
+            f"{MAIN_SUBCMD}.project_subcmd:project_create",
+            "Create the specified project artifacts inside the given project.",
+        ),
+        # vaf project generate #
+        "generate": (
+            f"{MAIN_SUBCMD}.project_subcmd:project_generate",
+            "Generate the source code of the VAF project based on the configuration and generation mode.",
+        ),
+        # vaf project import #
+        "import": (
+            f"{MAIN_SUBCMD}.project_subcmd:project_import",
+            "Import an interface/app-module project to the given project based on the project type.",
+        ),
+        # vaf project remove #
+        "remove": (
+            f"{MAIN_SUBCMD}.project_subcmd:project_remove",
+            "Remove the specified project artifacts from the given project.",
+        ),
+    },
+)
 def project() -> None:
     """Project-related commands."""
 
 
-# vaf project init #
-project.add_command(name="init", cmd=project_init)
-# vaf project create #
-project.add_command(name="create", cmd=project_create)
-# vaf project generate #
-project.command(name="generate")(project_generate)
-# vaf project import #
-project.command(name="import")(project_import)
-# vaf project remove #
-project.add_command(name="remove", cmd=project_remove)
-
-
 # Command 'model'
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        # vaf model import #
+        "import": (
+            f"{MAIN_SUBCMD}.model_subcmd:model_import",
+            "Import the VAF model from a specified model input file.",
+        ),
+        # vaf model update #
+        "update": (
+            f"{MAIN_SUBCMD}.model_subcmd:model_update",
+            "Update previously imported model or application module artifacts based on the project type.",
+        ),
+        # vaf model generate #
+        "generate": (
+            f"{MAIN_SUBCMD}.model_subcmd:model_generate",
+            "Process the VAF configuration to JSON model exchange format.",
+        ),
+        # vaf model analyze #
+        "analyze": (
+            f"{MAIN_SUBCMD}.model_subcmd:model_analyze",
+            "Analyse the executor load of the executables based on the task periods, offsets & budgets.",
+        ),
+    },
+)
 def model() -> None:
     """Model-related commands."""
 
 
-# vaf model import #
-model.add_command(name="import", cmd=model_import)
-# vaf model update #
-model.command(name="update")(model_update)
-# vaf model generate #
-model.command(name="generate")(model_generate)
-
-
 # Command 'make'
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        # vaf make preset #
+        "preset": (f"{MAIN_SUBCMD}.make_subcmd:make_preset", "Preset build."),
+        # vaf make build #
+        "build": (f"{MAIN_SUBCMD}.make_subcmd:make_build", "Build the project artifacts."),
+        # vaf make install #
+        "install": (
+            f"{MAIN_SUBCMD}.make_subcmd:make_install",
+            "Install the built artifacts to build/<build-type>/install directory.",
+        ),
+        # vaf make clean #
+        "clean": (f"{MAIN_SUBCMD}.make_subcmd:make_clean", "Clean up the project build directory."),
+    },
+)
 def make() -> None:
     """Make-related commands."""
 
 
-# vaf make preset #
-make.command(name="preset")(make_preset)
-# vaf make build #
-make.command(name="build")(make_build)
-# vaf make install #
-make.command(name="install")(make_install)
-# vaf make clean #
-make.command(name="clean")(make_clean)
-
-
 # Command 'workspace'
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        # vaf workspace init #
+        "init": (
+            f"{BOOTSTRAP_SUBCMD}.workspace_subcmd:workspace_init",
+            "Initiate a VAF workspace with devcontainer and VS Code settings.",
+        ),
+    },
+)
 def workspace() -> None:
     """Workspace-related commands."""
 
 
-# vaf project init #
-workspace.command(name="init")(workspace_init)
-
-
 if __name__ == "__main__":  # pragma: no cover
     cli()  # pylint: disable=no-value-for-parameter
@@ -11,9 +11,8 @@ from importlib import metadata
 import click
 
 # Internal imports
-from vaf.cli_core.bootstrap.cli_subcommands.project_subcmd import project_init
-from vaf.cli_core.bootstrap.cli_subcommands.workspace_subcmd import workspace_init
-from vaf.cli_core.common.click_help import CLICK_CONTEXT_SETTINGS, CustomHelpGroup, simple_user_warning
+# Subcommands are imported lazily, so help & shell completion don't pay for the heavy imports of the commands.
+from vaf.cli_core.common.click_help import CLICK_CONTEXT_SETTINGS, CustomHelpGroup, LazyGroup, simple_user_warning
 
 # Define pip package name
 PACKAGE_NAME = "vaf-bootstrap"
@@ -43,25 +42,38 @@ def cli() -> None:
     """This function is the entrypoint for the click arguments cli."""
 
 
+BOOTSTRAP_SUBCMD = "vaf.cli_core.bootstrap.cli_subcommands"
+
+
 # Command 'project'
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        # vaf project init #
+        "init": (
+            f"{BOOTSTRAP_SUBCMD}.project_subcmd:project_init",
+            "Initiate a project of chosen VAF project type and template.",
+        ),
+    },
+)
 def project() -> None:
     """Project-related commands."""
 
 
-# vaf project init #
-project.add_command(name="init", cmd=project_init)
-
-
 # Command 'workspace'
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        # vaf workspace init #
+        "init": (
+            f"{BOOTSTRAP_SUBCMD}.workspace_subcmd:workspace_init",
+            "Initiate a VAF workspace with devcontainer and VS Code settings.",
+        ),
+    },
+)
 def workspace() -> None:
     """Workspace-related commands."""
 
 
-# vaf workspace init #
-workspace.command(name="init")(workspace_init)
-
-
 if __name__ == "__main__":  # pragma: no cover
     cli()  # pylint: disable=no-value-for-parameter
@@ -1,6 +1,12 @@
 """Setup click options to configure the help output of the CLI commands."""
 
+import importlib
+from typing import Any
+
 import click
+from click.shell_completion import CompletionItem
+
+from vaf.cli_core.common.profiling import profile_phase
 
 # Per default, click only displays help for --help option
 # In our tools, we usually display help for both -h and --help
@@ -25,16 +31,108 @@ def simple_user_warning(
     return f"{category.__name__}: {message}\n"
 
 
+class LazyGroup(click.Group):
+    """Click group that imports its subcommands only when they are used.
+    Lazy subcommands are registered with the import path of the command (function) and its short help,
+    so help & shell completion of the group don't import any subcommand module.
+    """
+
+    def __init__(self, *args: Any, lazy_subcommands: dict[str, tuple[str, str]] | None = None, **kwargs: Any) -> None:
+        """
+        Args:
+            *args (Any): Arguments of click.Group
+            lazy_subcommands (dict[str, tuple[str, str]], optional): Subcommands by name with a tuple of
+            ("<module>:<command or function>", short help)
+            **kwargs (Any): Keyword arguments of click.Group
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(list(super().list_commands(ctx)) + list(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self.__load_command(cmd_name), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        with profile_phase(f"dispatch {ctx.command_path}"):
+            return super().resolve_command(ctx, args)
+
+    def get_short_help(self, ctx: click.Context, cmd_name: str, limit: int = 100) -> str | None:
+        """Gets the short help of a subcommand without importing lazy subcommands
+        Args:
+            ctx (click.Context): Click context
+            cmd_name (str): Name of the subcommand
+            limit (int): Maximum length of the short help
+        Returns:
+            Short help of the subcommand or None if the subcommand doesn't exist
+        """
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            # shorten the help the same way as click does for loaded commands
+            return click.Command(cmd_name, help=self.lazy_subcommands[cmd_name][1]).get_short_help_str(limit)
+        cmd = self.get_command(ctx, cmd_name)
+        return cmd.get_short_help_str(limit) if cmd is not None else None
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        cmd_names = [
+            cmd_name
+            for cmd_name in self.list_commands(ctx)
+            if cmd_name in self.lazy_subcommands or not self.commands[cmd_name].hidden
+        ]
+        if cmd_names:
+            # same limit as click.Group.format_commands
+            limit = formatter.width - 6 - max(len(cmd_name) for cmd_name in cmd_names)
+            rows = [(cmd_name, self.get_short_help(ctx, cmd_name, limit) or "") for cmd_name in cmd_names]
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> list[CompletionItem]:
+        results = [
+            CompletionItem(cmd_name, help=self.get_short_help(ctx, cmd_name))
+            for cmd_name in self.list_commands(ctx)
+            if cmd_name.startswith(incomplete)
+            and (cmd_name in self.lazy_subcommands or not self.commands[cmd_name].hidden)
+        ]
+        # complete the options of the group itself
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+    def __load_command(self, cmd_name: str) -> click.Command:
+        """Imports a lazy subcommand
+        Args:
+            cmd_name (str): Name of the subcommand
+        Returns:
+            The subcommand, functions with click parameters are converted to a command
+        """
+        module_name, attr_name = self.lazy_subcommands[cmd_name][0].split(":")
+        cmd = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(cmd, click.Command):
+            cmd = click.command(name=cmd_name)(cmd)
+        return cmd
+
+
 class CustomHelpGroup(click.Group):
     """Custom click group to modify the CLI help output."""
 
+    def main(self, *args: Any, **kwargs: Any) -> Any:
+        with profile_phase("cli"):
+            return super().main(*args, **kwargs)
+
     def _format_subcommands(self, cmd: click.Group, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         with formatter.indentation():
             sub_commands = cmd.list_commands(ctx)
             for index, sub_cmd_name in enumerate(sub_commands):
-                sub_cmd = cmd.get_command(ctx, sub_cmd_name)
-                if sub_cmd is not None:
-                    formatter.write_text(f"{sub_cmd_name}: {sub_cmd.get_short_help_str(100)}")
+                if isinstance(cmd, LazyGroup):
+                    short_help = cmd.get_short_help(ctx, sub_cmd_name)
+                else:
+                    sub_cmd = cmd.get_command(ctx, sub_cmd_name)
+                    short_help = sub_cmd.get_short_help_str(100) if sub_cmd is not None else None
+                if short_help is not None:
+                    formatter.write_text(f"{sub_cmd_name}: {short_help}")
                     if index == len(sub_commands) - 1:
                         # Add newline after last subcommand
                         formatter.write_paragraph()
@@ -0,0 +1,97 @@
+"""Polling based watcher for the model files of VAF projects"""
+
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+Snapshot = Dict[Path, Tuple[int, int]]
+
+
+class FileWatcher:
+    """Watches files and directories for changes by polling their modification times
+    Polling only needs the standard library and works the same on all platforms & file systems.
+    """
+
+    def __init__(self, paths: List[Path], suffixes: Tuple[str, ...] = (".py", ".json"), interval: float = 0.5) -> None:
+        """
+        Args:
+            paths (List[Path]): Files and directories to watch, directories are watched recursively
+            suffixes (Tuple[str, ...]): Suffixes of the files to watch in directories
+            interval (float): Polling interval in seconds
+        """
+        self.paths = paths
+        self.suffixes = suffixes
+        self.interval = interval
+        self._snapshot: Snapshot = {}
+
+    def take_snapshot(self) -> Snapshot:
+        """Gets the modification time & size of all watched files
+        Returns:
+            Snapshot: Modification time & size by file path
+        """
+        snapshot: Snapshot = {}
+        for path in self.paths:
+            if path.is_dir():
+                for root, dirs, files in os.walk(path):
+                    dirs[:] = [d for d in dirs if d != "__pycache__" and not d.startswith(".")]
+                    for file_name in files:
+                        if file_name.endswith(self.suffixes):
+                            self.__add_to_snapshot(snapshot, Path(root) / file_name)
+            else:
+                self.__add_to_snapshot(snapshot, path)
+        return snapshot
+
+    @staticmethod
+    def __add_to_snapshot(snapshot: Snapshot, file_path: Path) -> None:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+        snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+
+    def reset(self) -> None:
+        """Takes the current state of the watched files as reference for the next changes"""
+        self._snapshot = self.take_snapshot()
+
+    def wait_for_changes(self) -> List[Path]:
+        """Blocks until watched files are added, changed or removed
+        The changes are only reported once the files are stable for one polling interval.
+        Returns:
+            List[Path]: Sorted paths of the changed files
+        """
+        while True:
+            time.sleep(self.interval)
+            snapshot = self.take_snapshot()
+            if snapshot == self._snapshot:
+                continue
+            # wait until e.g. editors or CaC scripts finished writing
+            while True:
+                time.sleep(self.interval)
+                stable_snapshot = self.take_snapshot()
+                if stable_snapshot == snapshot:
+                    break
+                snapshot = stable_snapshot
+            changed = {
+                path
+                for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return sorted(changed)
+
+    def watch(self, callback: Callable[[List[Path]], None]) -> None:
+        """Calls the callback on every change of the watched files until interrupted
+        Files changed by the callback itself don't trigger the next call.
+        Args:
+            callback (Callable[[List[Path]], None]): Function called with the changed files
+        """
+        self.reset()
+        try:
+            while True:
+                changed = self.wait_for_changes()
+                callback(changed)
+                self.reset()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,174 @@
+"""Opt-in instrumentation of the import times and command phases of the vaf package
+
+Set the environment variable VAF_PROFILE_IMPORTS to enable it:
+    VAF_PROFILE_IMPORTS=1            Print the report to stderr at exit
+    VAF_PROFILE_IMPORTS=<file.json>  Write the report to the given file at exit
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, ContextManager, Dict, Iterator, List, Sequence
+
+PROFILE_ENV_VAR = "VAF_PROFILE_IMPORTS"
+
+
+def _us_since(start: int) -> int:
+    return (time.perf_counter_ns() - start) // 1000
+
+
+class _ImportTimer(MetaPathFinder):
+    """Meta path finder that times the execution of all modules loaded by the other finders
+    Self & cumulative times correspond to the data of `python -X importtime`.
+    """
+
+    def __init__(self, profiler: "Profiler") -> None:
+        self._profiler = profiler
+        self._stack: List[List[int]] = []
+
+    def find_spec(
+        self, fullname: str, path: Sequence[str] | None, target: ModuleType | None = None
+    ) -> ModuleSpec | None:
+        """Finds the spec with the remaining finders and wraps the execution of its loader
+        Args:
+            fullname (str): Full name of the module
+            path (Sequence[str], optional): Search path of the parent package
+            target (ModuleType, optional): Module to reload
+        Returns:
+            The spec of the module or None if no finder found it
+        """
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                # builtin & frozen importers are shared classes, only module specific loaders are wrapped
+                if (
+                    spec.loader is not None
+                    and not isinstance(spec.loader, type)
+                    and hasattr(spec.loader, "exec_module")
+                ):
+                    self.__wrap_loader(fullname, spec.loader)
+                return spec
+        return None
+
+    def __wrap_loader(self, fullname: str, loader: Any) -> None:
+        """Overrides exec_module of a loader instance to measure the module execution
+        Args:
+            fullname (str): Full name of the module
+            loader (Any): Loader of the module
+        """
+        exec_module = loader.exec_module
+
+        def timed_exec_module(module: ModuleType) -> None:
+            start = time.perf_counter_ns()
+            # second entry collects the cumulative time of nested imports
+            self._stack.append([start, 0])
+            try:
+                exec_module(module)
+            finally:
+                _, nested = self._stack.pop()
+                cumulative = _us_since(start)
+                if self._stack:
+                    self._stack[-1][1] += cumulative
+                self._profiler.imports.append(
+                    {"Module": fullname, "Self": cumulative - nested, "Cumulative": cumulative}
+                )
+
+        loader.exec_module = timed_exec_module
+
+
+class Profiler:
+    """Collects import times and phase timings and emits them as one structured report"""
+
+    def __init__(self, target: str) -> None:
+        """
+        Args:
+            target (str): Path of the report file or "1" to print the report to stderr
+        """
+        self.target = target
+        self.start = time.perf_counter_ns()
+        self.imports: List[Dict[str, Any]] = []
+        self.phases: List[Dict[str, Any]] = []
+        self._depth = 0
+
+    def install(self) -> None:
+        """Starts the import timing and registers the report at exit"""
+        sys.meta_path.insert(0, _ImportTimer(self))
+        atexit.register(self.emit_report)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measures a phase
+        Args:
+            name (str): Name of the phase
+        Yields:
+            None
+        """
+        start = time.perf_counter_ns()
+        entry: Dict[str, Any] = {"Name": name, "Depth": self._depth, "Start": (start - self.start) // 1000}
+        self.phases.append(entry)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            entry["Duration"] = _us_since(start)
+
+    def get_report(self) -> Dict[str, Any]:
+        """Gets the report, all times are given in us
+        Returns:
+            Dict with the total time, the phases in start order & the imports sorted by cumulative time
+        """
+        return {
+            "Total": _us_since(self.start),
+            "Phases": self.phases,
+            "Imports": sorted(self.imports, key=lambda entry: entry["Cumulative"], reverse=True),
+        }
+
+    def emit_report(self) -> None:
+        """Prints the report to stderr or writes it to the report file"""
+        # pylint: disable-next=import-outside-toplevel
+        import multiprocessing
+
+        # worker processes inherit the environment, only the main process reports
+        if multiprocessing.parent_process() is not None:
+            return
+        report = json.dumps(self.get_report(), indent=2)
+        if self.target == "1":
+            print(report, file=sys.stderr)
+        else:
+            with open(self.target, "w", encoding="utf-8") as fh:
+                fh.write(report)
+
+
+_PROFILER: Profiler | None = None
+
+
+def install_profiler() -> Profiler | None:
+    """Installs the profiler, if enabled via VAF_PROFILE_IMPORTS
+    Returns:
+        The installed profiler or None if profiling is disabled
+    """
+    global _PROFILER  # pylint: disable=global-statement
+    target = os.environ.get(PROFILE_ENV_VAR, "")
+    if _PROFILER is None and target not in ("", "0"):
+        _PROFILER = Profiler(target)
+        _PROFILER.install()
+    return _PROFILER
+
+
+def profile_phase(name: str) -> ContextManager[None]:
+    """Measures a phase, if profiling is enabled
+    Args:
+        name (str): Name of the phase
+    Returns:
+        Context manager measuring the phase
+    """
+    return _PROFILER.phase(name) if _PROFILER is not None else nullcontext()
@@ -1,11 +1,14 @@
 """Utilities function that are used across components"""
 
+import ast
 import importlib.util
 import json
+import os
 import re
+import time
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
 from vaf.constants import VAF_CFG_FILE
 
@@ -123,6 +126,144 @@ def get_project_type(path: Path | None = None) -> ProjectType:
     return ProjectType.UNKNOWN
 
 
+class ProjectIndex:
+    """Cache of the file system information used to find VAF projects & subprojects
+    Every entry is validated against the modification time of its file or directory,
+    so only the changed parts of a tree are read again.
+    """
+
+    # entries modified within this interval are not cached, as further changes may not update the timestamp
+    RACY_INTERVAL_NS = 2_000_000_000
+
+    def __init__(self) -> None:
+        self._dir_entries: Dict[Path, Tuple[int, List[Tuple[Path, bool, bool]]]] = {}
+        self._project_types: Dict[Path, Tuple[Tuple[int, int], ProjectType]] = {}
+        self._model_paths: Dict[Path, Tuple[Tuple[int, int], str | None]] = {}
+
+    def clear(self) -> None:
+        """Drops all cached entries"""
+        self._dir_entries.clear()
+        self._project_types.clear()
+        self._model_paths.clear()
+
+    def __store(self, cache: Dict[Path, Any], path: Path, entry: Any, mtime: int) -> None:
+        """Stores an entry, if its file or directory wasn't modified recently
+        Args:
+            cache (Dict[Path, Any]): Cache to store the entry in
+            path (Path): Path of the file or directory
+            entry (Any): Entry to store
+            mtime (int): Modification time of the file or directory in ns
+        """
+        if time.time_ns() - mtime > self.RACY_INTERVAL_NS:
+            cache[path] = entry
+        else:
+            cache.pop(path, None)
+
+    def get_dir_entries(self, directory: Path) -> List[Tuple[Path, bool, bool]]:
+        """Gets the entries of a directory
+        Args:
+            directory (Path): Directory to list
+        Returns:
+            List of tuples containing the path of the entry and if it is a directory and a symlink
+        """
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            self._dir_entries.pop(directory, None)
+            return []
+        cached = self._dir_entries.get(directory)
+        if cached is None or cached[0] != mtime:
+            with os.scandir(directory) as it:
+                entries = [(directory / entry.name, entry.is_dir(), entry.is_symlink()) for entry in it]
+            cached = (mtime, entries)
+            self.__store(self._dir_entries, directory, cached, mtime)
+        return cached[1]
+
+    def iter_files(self, directory: Path, pattern: str) -> Iterator[Path]:
+        """Recursively finds files like Path.rglob(), symlinked directories are not followed
+        Args:
+            directory (Path): Directory to search in
+            pattern (str): Glob pattern of the file names
+        Yields:
+            Paths of the matching files
+        """
+        for path, is_dir, is_symlink in self.get_dir_entries(directory):
+            if is_dir:
+                if not is_symlink:
+                    yield from self.iter_files(path, pattern)
+            elif path.match(pattern):
+                yield path
+
+    def get_project_type(self, path: Path) -> ProjectType:
+        """Reads the project type from the VAF_CFG_FILE of a project
+        Args:
+            path (Path): Project path to search for the VAF_CFG_FILE
+        Returns:
+            ProjectType enum representation of the project in the specified path
+        """
+        config_path = path / VAF_CFG_FILE
+        try:
+            stat = config_path.stat()
+        except OSError:
+            self._project_types.pop(config_path, None)
+            return ProjectType.UNKNOWN
+        cached = self._project_types.get(config_path)
+        if cached is None or cached[0] != (stat.st_mtime_ns, stat.st_size):
+            cached = ((stat.st_mtime_ns, stat.st_size), get_project_type(path))
+            self.__store(self._project_types, config_path, cached, stat.st_mtime_ns)
+        return cached[1]
+
+    def get_model_path(self, import_file: Path) -> str | None:
+        """Reads the model_path variable of an import script
+        The value is parsed statically and the script is only executed if it isn't a plain string literal.
+        Args:
+            import_file (Path): Path to the import script
+        Returns:
+            Value of model_path or None if the script doesn't define it
+        """
+        stat = import_file.stat()
+        cached = self._model_paths.get(import_file)
+        if cached is None or cached[0] != (stat.st_mtime_ns, stat.st_size):
+            cached = ((stat.st_mtime_ns, stat.st_size), _read_model_path(import_file))
+            self.__store(self._model_paths, import_file, cached, stat.st_mtime_ns)
+        return cached[1]
+
+
+def _read_model_path(import_file: Path) -> str | None:
+    """Reads the model_path variable of an import script
+    Args:
+        import_file (Path): Path to the import script
+    Returns:
+        Value of model_path or None if the script doesn't define it
+    """
+    with open(import_file, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read(), filename=str(import_file))
+
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(isinstance(target, ast.Name) and target.id == "model_path" for target in node.targets)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        ):
+            return node.value.value
+
+    if not any(isinstance(node, ast.Name) and node.id == "model_path" for node in ast.walk(tree)):
+        return None
+
+    # model_path is computed, execute the script to get the value
+    spec = importlib.util.spec_from_file_location(import_file.stem, import_file)
+    if spec is not None and spec.loader is not None:
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        model_path = getattr(module, "model_path", None)
+        return str(model_path) if model_path is not None else None
+    return None
+
+
+project_index = ProjectIndex()
+
+
 def get_subprojects_in_path(project_type: ProjectType, search_path: Path) -> list[Path]:
     """Function that recursively returns the path of imported vaf subprojects.
 
@@ -142,15 +283,10 @@ def get_subprojects_in_path(project_type: ProjectType, search_path: Path) -> lis
     )
 
     project_paths = []
-    for file_path in search_path.rglob("import_*.py"):
-        spec = importlib.util.spec_from_file_location(file_path.stem, file_path)
-        if spec is not None and spec.loader is not None:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
-            # Check if 'model_path' variable exists in the module
-            if hasattr(module, "model_path"):
-                project_paths.append(resolve_dotdot((file_path.parent / module.model_path)).parent)
+    for file_path in project_index.iter_files(search_path, "import_*.py"):
+        model_path = project_index.get_model_path(file_path)
+        if model_path is not None:
+            project_paths.append(resolve_dotdot((file_path.parent / model_path)).parent)
     return project_paths
 
 
@@ -165,9 +301,9 @@ def get_projects_in_path(search_path: Path) -> list[tuple[Path, ProjectType]]:
     projects = set()
 
     def search_directory(directory: Path) -> None:
-        for path in directory.iterdir():
-            if path.is_dir():
-                project_type = get_project_type(path)
+        for path, is_dir, _ in project_index.get_dir_entries(directory):
+            if is_dir:
+                project_type = project_index.get_project_type(path)
                 if project_type != ProjectType.UNKNOWN:
                     projects.add((path, project_type))
                 else:
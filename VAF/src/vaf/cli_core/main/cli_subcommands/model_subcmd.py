@@ -156,10 +156,71 @@ def model_update(project_dir: str, model_dir: str, app_modules: list[str]) -> No
     default="ALL",
     show_default=True,
 )
-def model_generate(project_dir: str, project_type: ProjectType, model_dir: str, mode: str) -> None:  # pylint: disable=missing-param-doc
+@click.option(
+    "-j",
+    "--jobs",
+    help="Number of parallel processes to execute the CaC of the application module subprojects in mode 'ALL'.",
+    required=False,
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+)
+@click.option("--force", is_flag=True, help="Execute the CaC of all subprojects, even if their inputs are unchanged.")
+def model_generate(  # pylint: disable=missing-param-doc, too-many-arguments, too-many-positional-arguments
+    project_dir: str, project_type: ProjectType, model_dir: str, mode: str, jobs: int = 1, force: bool = False
+) -> None:
     """Process the VAF configuration to JSON model exchange format."""
     if project_type == ProjectType.UNKNOWN:
         click.echo(f"\nNo valid VAF project found in {project_dir}!")
     else:
         cmd = ModelCmd()
-        cmd.generate(project_type, model_dir, mode)
+        cmd.generate(project_type, model_dir, mode, jobs, force)
+
+
+# vaf model analyze #
+@click.option(
+    "-p",
+    "--project-dir",
+    type=click.Path(exists=False, file_okay=False, writable=False),
+    default=".",
+    help="Path to the project root directory",
+    show_default=True,
+)
+@filepath_option(
+    "-i",
+    "--input-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path to the project model JSON file.",
+    default=lambda: str(
+        Path(click.get_current_context().params.get("project_dir", "."))
+        / _get_default_model_path(get_project_type_for_project_dir())
+        / "model.json"
+    ),
+    prompt_required=False,
+)
+@click.option(
+    "--max-utilization",
+    help="Maximum worst-case tick utilization of the executor budgets in percent, the command fails above it.",
+    type=click.FloatRange(min=0),
+    default=100.0,
+    show_default=True,
+)
+@click.option(
+    "--json-output",
+    help="File to write the full report in JSON format to.",
+    type=click.Path(dir_okay=False, writable=True),
+    required=False,
+)
+def model_analyze(  # pylint: disable=missing-param-doc, unused-argument
+    project_dir: str, input_file: str, max_utilization: float, json_output: str | None
+) -> None:
+    """Analyse the executor load of the executables based on the task periods, offsets & budgets.
+    Raises:
+        ClickException: If the worst-case tick utilization of an executable exceeds max_utilization
+    """
+    cmd = ModelCmd()
+    exceeding = cmd.analyze(input_file, max_utilization, json_output)
+    if exceeding:
+        raise click.ClickException(
+            f"Worst-case tick utilization exceeds {max_utilization:g}% for executable(s): {', '.join(exceeding)}"
+        )
@@ -1,7 +1,7 @@
 """Source code for vaf project subcommands"""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import click
 from click.core import ParameterSource
@@ -15,11 +15,14 @@ from vaf.cli_core.common.click_extension import (
     project_generate_common_click_decorators,
     sanatized_str_option,
 )
+from vaf.cli_core.common.file_watcher import FileWatcher
+from vaf.cli_core.common.profiling import profile_phase
 from vaf.cli_core.common.utils import (
     ProjectType,
     _get_default_model_path,
     get_project_type,
     get_projects_in_path,
+    get_subprojects_in_path,
 )
 
 from ..cli_subcommands.make_subcmd import make_preset
@@ -93,6 +96,42 @@ def __update_vaf_model(
     click.echo(f"\nSUCCESS: VAF model generated and stored in {model_dir}")
 
 
+def __watch_project(
+    project_type: ProjectType, input_file: str, skip_model_update: bool, regenerate: Callable[[], None]
+) -> None:
+    """Function to regenerate the project on every change of its model files
+    The process stays alive, so imports, compiled templates & cached CaC exports are reused.
+    Args:
+        project_type: Type of the project
+        input_file: Path to the model.json as string
+        skip_model_update: True if the model.json is not updated via the CaC before generation
+        regenerate: Function generating the project
+    """
+    if skip_model_update:
+        watched_paths = [Path(input_file)]
+    else:
+        model_dir = Path(input_file).parent
+        watched_paths = [model_dir]
+        if project_type == ProjectType.INTEGRATION:
+            # CaC of the application modules
+            watched_paths += [
+                project_path / "model"
+                for project_path in get_subprojects_in_path(ProjectType.APP_MODULE, model_dir / "application_modules")
+            ]
+
+    def __regenerate(changed_files: list[Path]) -> None:
+        click.echo(f"\nChanged: {', '.join(str(file) for file in changed_files)}")
+        try:
+            regenerate()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # keep watching, the user will fix the model
+            click.echo(f"\nERROR: {e}", err=True)
+        click.echo("\nWatching for changes. Press Ctrl+C to stop.")
+
+    click.echo("\nWatching for changes. Press Ctrl+C to stop.")
+    FileWatcher(watched_paths).watch(__regenerate)
+
+
 # vaf project generate #
 @project_generate_common_click_decorators
 @click.option(
@@ -104,7 +143,12 @@ def __update_vaf_model(
     default="PRJ",
     show_default=True,
 )
-# pylint: disable=missing-param-doc, missing-raises-doc, line-too-long, too-many-arguments, too-many-positional-arguments, too-many-locals
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running and regenerate the project whenever the model files change. Stop with Ctrl+C.",
+)
+# pylint: disable=missing-param-doc, missing-raises-doc, line-too-long, too-many-arguments, too-many-positional-arguments, too-many-locals, too-many-branches
 def project_generate(
     ctx: click.Context,
     project_dir: str,
@@ -115,6 +159,7 @@ def project_generate(
     verbose: bool = False,
     skip_model_update: bool = False,
     skip_make_preset: bool = False,
+    watch: bool = False,
 ) -> None:
     """Generate the source code of the VAF project based on the configuration and generation mode."""
 
@@ -150,40 +195,65 @@ def project_generate(
         if project_type == ProjectType.INTEGRATION:
             if not skip_model_update:
                 click.echo("Updating integration project model before generation.")
-                __update_vaf_model(ctx, project_type, project_dir, input_file, mode)
+                with profile_phase("project generate: model update"):
+                    __update_vaf_model(ctx, project_type, project_dir, input_file, mode)
             click.echo(f"Generating integration project for {mode} based on model in {input_file}")
-            cmd.generate_integration(
-                input_file,
-                project_dir,
-                mode,
-                manual_merge,
-            )
+            with profile_phase("project generate: generation"):
+                cmd.generate_integration(
+                    input_file,
+                    project_dir,
+                    mode,
+                    manual_merge,
+                )
             if not skip_make_preset:
-                if mode == "ALL":
-                    # Execute cmake preset for all included app-module projects
-                    for pr_path, _ in get_projects_in_path(Path(project_dir)):
-                        __run_make_preset_debug(project_dir=pr_path)
-                        __run_make_preset_release(project_dir=pr_path)
-                __run_make_preset_debug()
-                __run_make_preset_release()
+                with profile_phase("project generate: make preset"):
+                    if mode == "ALL":
+                        # Execute cmake preset for all included app-module projects
+                        for pr_path, _ in get_projects_in_path(Path(project_dir)):
+                            __run_make_preset_debug(project_dir=pr_path)
+                            __run_make_preset_release(project_dir=pr_path)
+                    __run_make_preset_debug()
+                    __run_make_preset_release()
 
         elif project_type == ProjectType.APP_MODULE:
             click.echo("\nSkipping generation mode selection as the project is not an integration project.")
 
             if not skip_model_update:
                 click.echo("Updating integration project model before generation.")
-                __update_vaf_model(ctx, project_type, project_dir, input_file, "PRJ")
+                with profile_phase("project generate: model update"):
+                    __update_vaf_model(ctx, project_type, project_dir, input_file, "PRJ")
             click.echo(f"\nGenerating application module based on model in {input_file}")
-            cmd.generate_app_module(
-                input_file,
-                project_dir,
-                manual_merge,
-            )
+            with profile_phase("project generate: generation"):
+                cmd.generate_app_module(
+                    input_file,
+                    project_dir,
+                    manual_merge,
+                )
             if not skip_make_preset:
-                __run_make_preset_debug()
-                __run_make_preset_release()
+                with profile_phase("project generate: make preset"):
+                    __run_make_preset_debug()
+                    __run_make_preset_release()
         else:
             click.echo("\nInvalid VAF project for project generate command.")
+            return
+
+        if watch:
+            __watch_project(
+                project_type,
+                input_file,
+                skip_model_update,
+                lambda: ctx.invoke(
+                    project_generate,
+                    project_dir=project_dir,
+                    input_file=input_file,
+                    build_dir=build_dir,
+                    mode=mode,
+                    manual_merge=manual_merge,
+                    verbose=verbose,
+                    skip_model_update=skip_model_update,
+                    skip_make_preset=skip_make_preset,
+                ),
+            )
 
 
 # vaf project import #
@@ -1,6 +1,7 @@
 """Implements the functionality of model related commands"""
 
 import gc
+import hashlib
 import importlib.util
 import inspect
 import json
@@ -8,26 +9,129 @@ import os
 import pkgutil
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
 from pathlib import Path
 from typing import Any
 
 from copier import run_copy
 
+from vaf import vafmodel
 from vaf.cli_core.common.exceptions import VafProjectGenerationError
+from vaf.cli_core.common.profiling import profile_phase
 from vaf.cli_core.common.utils import (
     ProjectType,
     get_subprojects_in_path,
     to_snake_case,
 )
 from vaf.cli_core.main.project_cmd import ProjectCmd
-from vaf.constants import VAF_CFG_FILE
-from vaf.vafgeneration import generate_cac_support
+from vaf.constants import VAF_CAC_FINGERPRINT_FILE, VAF_CFG_FILE
+from vaf.vafgeneration import generate_cac_support, schedule_analysis
 from vaf.vafpy.model_runtime import model_runtime
 from vaf.vafvssimport import vss_import
 
 # pylint: disable=duplicate-code
 
 
+def _run_cac(model_file: Path) -> None:
+    """Executes the CaC script of a (sub-) project and exports its model
+    Args:
+        model_file (Path): Path to the CaC script
+    Raises:
+        ValueError: If the CaC script can't be executed
+    """
+    print(f"Executing CaC for {model_file}")
+    # Reset runtime, remove previously loaded model, for the model-import to be triggered again
+    model_runtime.reset()
+    loaded_modules_before_cac = list(sys.modules)
+
+    spec = importlib.util.spec_from_file_location(model_file.stem, model_file, submodule_search_locations=[])
+    if spec is not None:
+        module = importlib.util.module_from_spec(spec)
+        if spec.loader is not None:
+            # temporarily add model_dir to sys.path to support local imports
+            sys.path.insert(0, model_file.parent.as_posix())
+            try:
+                sys.modules[model_file.stem] = module
+                spec.loader.exec_module(module)
+                module.export_model()
+            except Exception as e:
+                raise ValueError(f"CaC cannot be executed: {model_file}:\n{str(e)}") from e
+            finally:
+                sys.path.pop(0)
+
+    # unload all modules loaded during CaC execution
+    modules_to_unload = [mod for mod in sys.modules if mod not in loaded_modules_before_cac]
+    for mod in modules_to_unload:
+        del sys.modules[mod]
+    gc.collect()
+
+
+def _get_cac_fingerprint(project_path: Path) -> dict[str, str]:
+    """Calculates the fingerprint of the CaC inputs & the export of a subproject
+    Inputs are all python & json files of the model directory, including the imported models, and the vaf version.
+    Args:
+        project_path (Path): Path of the subproject
+    Returns:
+        dict[str, str]: Hashes of the CaC inputs and of the exported model.json
+    """
+    model_dir = project_path / "model"
+    export_path = model_dir / "model.json"
+
+    inputs_hash = hashlib.sha256()
+    try:
+        inputs_hash.update(metadata.version("vaf").encode())
+    except metadata.PackageNotFoundError:
+        pass
+    for input_file in sorted(model_dir.rglob("*")):
+        if (
+            input_file.suffix in (".py", ".json")
+            and input_file != export_path
+            and "__pycache__" not in input_file.parts
+            and input_file.is_file()
+        ):
+            inputs_hash.update(input_file.relative_to(model_dir).as_posix().encode())
+            inputs_hash.update(input_file.read_bytes())
+
+    return {
+        "Inputs": inputs_hash.hexdigest(),
+        "Export": hashlib.sha256(export_path.read_bytes()).hexdigest() if export_path.is_file() else "",
+    }
+
+
+def _is_cac_up_to_date(project_path: Path) -> bool:
+    """Checks if the exported model of a subproject matches the fingerprint of its last CaC execution
+    Args:
+        project_path (Path): Path of the subproject
+    Returns:
+        bool: True if neither the CaC inputs nor the exported model changed since the last CaC execution
+    """
+    fingerprint_path = project_path / VAF_CAC_FINGERPRINT_FILE
+    if not fingerprint_path.is_file():
+        return False
+    try:
+        with open(fingerprint_path, encoding="utf-8") as fh:
+            fingerprint = json.load(fh)
+    except (OSError, ValueError):
+        return False
+    return bool(fingerprint.get("Export")) and bool(fingerprint == _get_cac_fingerprint(project_path))
+
+
+def _run_subproject_cac(project_path: Path) -> None:
+    """Executes the CaC script of a subproject and stores the fingerprint of its inputs & export
+    Args:
+        project_path (Path): Path of the subproject
+    Raises:
+        ValueError: If the CaC script can't be executed
+    """
+    fingerprint_path = project_path / VAF_CAC_FINGERPRINT_FILE
+    fingerprint_path.unlink(missing_ok=True)
+    _run_cac(project_path / "model" / "model.py")
+    fingerprint_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(fingerprint_path, "w", encoding="utf-8") as fh:
+        json.dump(_get_cac_fingerprint(project_path), fh, indent=2)
+
+
 class ModelCmd:  # pylint: disable=too-few-public-methods
     """Class implementing the platform-related commands"""
 
@@ -273,55 +377,84 @@ class ModelCmd:  # pylint: disable=too-few-public-methods
                 Path.cwd(), app_modules_dir=model_dir / "application_modules", rel_pre_path=rel_pre_path
             )
 
-    def generate(self, project_type: ProjectType, model_dir: str, mode: str) -> None:
+    @staticmethod
+    def __run_subproject_cacs(subprojects: list[Path], jobs: int) -> None:
+        """Executes the CaC scripts of the subprojects in a process pool
+           Each worker process has its own model runtime, so the subprojects don't influence each other.
+        Args:
+            subprojects (list[Path]): Paths of the subprojects
+            jobs (int): Number of worker processes
+        Raises:
+            ValueError: If the CaC script of any subproject can't be executed, listing all failed subprojects
+        """
+        errors: list[str] = []
+        with ProcessPoolExecutor(max_workers=min(jobs, len(subprojects))) as executor:
+            futures = {project_path: executor.submit(_run_subproject_cac, project_path) for project_path in subprojects}
+            for project_path, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    errors.append(f"{project_path}: {str(e)}")
+
+        if errors:
+            raise ValueError(f"CaC failed for {len(errors)} subproject(s):\n" + "\n".join(errors))
+
+    def generate(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self, project_type: ProjectType, model_dir: str, mode: str, jobs: int = 1, force: bool = False
+    ) -> None:
         """Calls the associated generates to generate the project.
         Args:
             project_type (ProjectType): VAF project type
             model_dir (str): Path to the directory of the VAF model.
             mode (str): Generate for PRJ or ALL projects
+            jobs (int): Number of parallel processes for the CaC of the subprojects in mode ALL
+            force (bool): Execute the CaC of all subprojects, even if their inputs are unchanged
         Raises:
             ValueError: If the CaC script of a (sub-) project can't be found / executed
             VafProjectGenerationError: If the app-module_import script generation fails
         """
 
-        def _run_cac(model_file: Path) -> None:
-            print(f"Executing CaC for {model_file}")
-            # Reset runtime, remove previously loaded model, for the model-import to be triggered again
-            model_runtime.reset()
-            loaded_modules_before_cac = list(sys.modules)
-
-            spec = importlib.util.spec_from_file_location(model_file.stem, model_file, submodule_search_locations=[])
-            if spec is not None:
-                module = importlib.util.module_from_spec(spec)
-                if spec.loader is not None:
-                    # temporarily add model_dir to sys.path to support local imports
-                    sys.path.insert(0, model_file.parent.as_posix())
-                    try:
-                        sys.modules[model_file.stem] = module
-                        spec.loader.exec_module(module)
-                        module.export_model()
-                    except Exception as e:
-                        raise ValueError(f"CaC cannot be executed: {model_file}:\n{str(e)}") from e
-                    finally:
-                        sys.path.pop(0)
-
-            # unload all modules loaded during CaC execution
-            modules_to_unload = [mod for mod in sys.modules if mod not in loaded_modules_before_cac]
-            for mod in modules_to_unload:
-                del sys.modules[mod]
-            gc.collect()
-
         if "ALL" == mode and project_type == ProjectType.INTEGRATION:
             # find all subprojects
             app_modules_dir = Path(model_dir) / "application_modules"
             subprojects = get_subprojects_in_path(ProjectType.APP_MODULE, app_modules_dir)
 
-            for project_path in subprojects:
-                model_path = project_path / "model" / "model.py"
-                _run_cac(model_path)
+            with profile_phase("model generate: subproject cac"):
+                # reuse the previous export of subprojects with unchanged CaC inputs
+                changed_subprojects = []
+                for project_path in subprojects:
+                    if not force and _is_cac_up_to_date(project_path):
+                        print(f"Skipping CaC for {project_path / 'model' / 'model.py'}: inputs unchanged")
+                    else:
+                        changed_subprojects.append(project_path)
+
+                if jobs > 1 and len(changed_subprojects) > 1:
+                    self.__run_subproject_cacs(changed_subprojects, jobs)
+                else:
+                    for project_path in changed_subprojects:
+                        _run_subproject_cac(project_path)
 
             # call import generation
-            self.update_app_modules(model_dir=Path(model_dir), app_modules=subprojects)
+            with profile_phase("model generate: update app modules"):
+                self.update_app_modules(model_dir=Path(model_dir), app_modules=subprojects)
 
         # call local cac
-        _run_cac(Path(model_dir) / "model.py")
+        with profile_phase("model generate: cac"):
+            _run_cac(Path(model_dir) / "model.py")
+
+    @staticmethod
+    def analyze(input_file: str, max_utilization: float, json_output: str | None = None) -> list[str]:
+        """Analyses the executor load of all executables of a model.
+        Args:
+            input_file (str): Path to the model JSON file
+            max_utilization (float): Maximum allowed worst-case tick utilization in percent
+            json_output (str | None): Path to write the full report in JSON format to
+        Returns:
+            list[str]: Names of the executables exceeding max_utilization
+        """
+        reports = schedule_analysis.analyze_model(vafmodel.load_json(input_file))
+        print(schedule_analysis.format_report(reports))
+        if json_output is not None:
+            with open(json_output, "w", encoding="utf-8") as fh:
+                json.dump(reports, fh, indent=2)
+        return [report["Executable"] for report in reports if report["WorstCaseUtilization"] > max_utilization]
@@ -12,3 +12,5 @@ class TruthyEnum(Enum):
 
 
 VAF_CFG_FILE = ".vafconfig.json"
+VAF_CAC_FINGERPRINT_FILE = ".cache/vaf_cac_fingerprint.json"
+VAF_PRISTINE_STORE_DIR = ".cache/vaf_pristine"
@@ -1,6 +1,7 @@
 """Common generator functionality"""
 
 import filecmp
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -451,16 +452,26 @@ def split_full_type(full_type: str) -> tuple[str, str]:
     return full_type[separator + 2 :], full_type[0:separator]
 
 
+@cache
+def _get_environment() -> Environment:
+    """Gets the jinja environment shared by all generators, so every template is only compiled once per process
+
+    Returns:
+        Environment: The jinja environment
+    """
+    return Environment(
+        loader=PackageLoader("vaf.vafgeneration"),
+        autoescape=select_autoescape(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
 class Generator:
     """Class for generating files."""
 
     def __init__(self) -> None:
-        self.env = Environment(
-            loader=PackageLoader("vaf.vafgeneration"),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.env = _get_environment()
         self.base_directory = Path.cwd()
 
     def set_base_directory(self, new_dir: Path) -> None:
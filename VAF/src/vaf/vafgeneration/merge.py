@@ -0,0 +1,615 @@
+"""In-process three-way merge of text files
+
+The merge follows the algorithm of git's xdiff library (Myers diff, change compaction, zealous conflict
+refinement), so the results are compatible with the output of `git merge-file -p`.
+"""
+
+import re
+from typing import List, Tuple
+
+# number of equal lines that define a "multi match" line, see xdiff XDL_MAX_EQLIMIT
+_MAX_EQLIMIT = 1024
+# window of the scan for runs of discarded lines, see xdiff XDL_SIMSCAN_WINDOW
+_SIMSCAN_WINDOW = 100
+# ratio of multi match lines in runs of discarded lines, see xdiff XDL_KPDIS_RUN
+_KPDIS_RUN = 4
+# length of the conflict markers
+_MARKER_SIZE = 7
+
+_ALNUM = re.compile(rb"[A-Za-z0-9]")
+
+# merge modes: conflict, changed in ours, changed in theirs, identical change in both
+_CONFLICT = 0
+_OURS = 1
+_THEIRS = 2
+_IDENTICAL = 4
+
+
+def split_lines(content: bytes) -> List[bytes]:
+    """Splits content into lines, every line keeps its line feed
+
+    Args:
+        content (bytes): The content to split
+
+    Returns:
+        List[bytes]: The lines
+    """
+    lines = content.split(b"\n")
+    last = lines.pop()
+    lines = [line + b"\n" for line in lines]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _bogosqrt(n: int) -> int:
+    """Integer square root approximation of xdiff"""
+    i = 1
+    while n > 0:
+        n >>= 2
+        i <<= 1
+    return i
+
+
+def _clean_mmatch(dis: List[int], i: int, start: int, end: int) -> bool:
+    """Checks if a multi match line is part of a run of discarded lines and should be discarded as well"""
+    start = max(start, i - _SIMSCAN_WINDOW)
+    end = min(end, i + _SIMSCAN_WINDOW)
+
+    rdis0, rpdis0 = 0, 1
+    r = 1
+    while i - r >= start:
+        if not dis[i - r]:
+            rdis0 += 1
+        elif dis[i - r] == 2:
+            rpdis0 += 1
+        else:
+            break
+        r += 1
+    if rdis0 == 0:
+        return False
+
+    rdis1, rpdis1 = 0, 1
+    r = 1
+    while i + r <= end:
+        if not dis[i + r]:
+            rdis1 += 1
+        elif dis[i + r] == 2:
+            rpdis1 += 1
+        else:
+            break
+        r += 1
+    if rdis1 == 0:
+        return False
+
+    rdis1 += rdis0
+    rpdis1 += rpdis0
+    return rpdis1 * _KPDIS_RUN < rpdis1 + rdis1
+
+
+class _DiffFile:  # pylint: disable=too-few-public-methods
+    """Lines of one side of a diff with the change marks
+    rchg has a sentinel entry at both ends, so rchg[i + 1] is the mark of line i.
+    """
+
+    def __init__(self, lines: List[bytes]) -> None:
+        self.lines = lines
+        self.nrec = len(lines)
+        self.rchg = [0] * (self.nrec + 2)
+
+    def changed(self, i: int) -> int:
+        """Gets the change mark of a line
+
+        Args:
+            i (int): Index of the line, -1 and nrec are sentinels
+
+        Returns:
+            int: 1 if the line is changed, else 0
+        """
+        return self.rchg[i + 1]
+
+    def mark(self, i: int, value: int) -> None:
+        """Sets the change mark of a line
+
+        Args:
+            i (int): Index of the line
+            value (int): 1 if the line is changed, else 0
+        """
+        self.rchg[i + 1] = value
+
+
+def _split(  # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals, too-many-branches
+    ha1: List[int], off1: int, lim1: int, ha2: List[int], off2: int, lim2: int
+) -> Tuple[int, int]:
+    """Finds the middle snake of the shortest edit script, see xdiff xdl_split"""
+    dmin, dmax = off1 - lim2, lim1 - off2
+    fmid, bmid = off1 - off2, lim1 - lim2
+    odd = (fmid - bmid) & 1
+    fmin = fmax = fmid
+    bmin = bmax = bmid
+    kvdf = {fmid: off1}
+    kvdb = {bmid: lim1}
+    line_max = lim1 + lim2 + 1
+
+    while True:
+        if fmin > dmin:
+            fmin -= 1
+            kvdf[fmin - 1] = -1
+        else:
+            fmin += 1
+        if fmax < dmax:
+            fmax += 1
+            kvdf[fmax + 1] = -1
+        else:
+            fmax -= 1
+
+        for d in range(fmax, fmin - 1, -2):
+            if kvdf.get(d - 1, -1) >= kvdf.get(d + 1, -1):
+                i1 = kvdf[d - 1] + 1
+            else:
+                i1 = kvdf[d + 1]
+            i2 = i1 - d
+            while i1 < lim1 and i2 < lim2 and ha1[i1] == ha2[i2]:
+                i1 += 1
+                i2 += 1
+            kvdf[d] = i1
+            if odd and bmin <= d <= bmax and kvdb[d] <= i1:
+                return i1, i2
+
+        if bmin > dmin:
+            bmin -= 1
+            kvdb[bmin - 1] = line_max
+        else:
+            bmin += 1
+        if bmax < dmax:
+            bmax += 1
+            kvdb[bmax + 1] = line_max
+        else:
+            bmax -= 1
+
+        for d in range(bmax, bmin - 1, -2):
+            if kvdb.get(d - 1, line_max) < kvdb.get(d + 1, line_max):
+                i1 = kvdb[d - 1]
+            else:
+                i1 = kvdb[d + 1] - 1
+            i2 = i1 - d
+            while i1 > off1 and i2 > off2 and ha1[i1 - 1] == ha2[i2 - 1]:
+                i1 -= 1
+                i2 -= 1
+            kvdb[d] = i1
+            if not odd and fmin <= d <= fmax and i1 <= kvdf[d]:
+                return i1, i2
+
+
+def _recs_cmp(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    ha1: List[int],
+    rindex1: List[int],
+    off1: int,
+    lim1: int,
+    file1: _DiffFile,
+    ha2: List[int],
+    rindex2: List[int],
+    off2: int,
+    lim2: int,
+    file2: _DiffFile,
+) -> None:
+    """Marks the changed lines by divide & conquer of the middle snakes, see xdiff xdl_recs_cmp"""
+    stack = [(off1, lim1, off2, lim2)]
+    while stack:
+        off1, lim1, off2, lim2 = stack.pop()
+        while off1 < lim1 and off2 < lim2 and ha1[off1] == ha2[off2]:
+            off1 += 1
+            off2 += 1
+        while off1 < lim1 and off2 < lim2 and ha1[lim1 - 1] == ha2[lim2 - 1]:
+            lim1 -= 1
+            lim2 -= 1
+
+        if off1 == lim1:
+            for i in range(off2, lim2):
+                file2.mark(rindex2[i], 1)
+        elif off2 == lim2:
+            for i in range(off1, lim1):
+                file1.mark(rindex1[i], 1)
+        else:
+            split1, split2 = _split(ha1, off1, lim1, ha2, off2, lim2)
+            stack.append((split1, lim1, split2, lim2))
+            stack.append((off1, split1, off2, split2))
+
+
+def _cleanup_records(
+    file: _DiffFile, ha: List[int], other_count: List[int], dstart: int, dend: int
+) -> Tuple[List[int], List[int]]:
+    """Marks the lines without match in the other file as changed, see xdiff xdl_cleanup_records
+
+    Args:
+        file (_DiffFile): The file to clean up
+        ha (List[int]): Line classes of the file
+        other_count (List[int]): Number of lines per line class in the other file
+        dstart (int): First line after the common head
+        dend (int): Last line before the common tail
+
+    Returns:
+        Tuple[List[int], List[int]]: Line classes & line indices of the remaining lines
+    """
+    mlim = min(_bogosqrt(file.nrec), _MAX_EQLIMIT)
+    dis = [0] * (file.nrec + 1)
+    for i in range(dstart, dend + 1):
+        matches = other_count[ha[i]]
+        dis[i] = 0 if matches == 0 else 2 if matches >= mlim else 1
+    rindex: List[int] = []
+    for i in range(dstart, dend + 1):
+        if dis[i] == 1 or (dis[i] == 2 and not _clean_mmatch(dis, i, dstart, dend)):
+            rindex.append(i)
+        else:
+            file.mark(i, 1)
+    return [ha[i] for i in rindex], rindex
+
+
+def _classify_lines(lines1: List[bytes], lines2: List[bytes]) -> Tuple[List[int], List[int], List[int], List[int]]:
+    """Assigns a class to every distinct line of both files, see xdiff xdl_prepare_env
+
+    Args:
+        lines1 (List[bytes]): Lines of the first file
+        lines2 (List[bytes]): Lines of the second file
+
+    Returns:
+        Tuple[List[int], List[int], List[int], List[int]]: Line classes of both files & number of lines per line
+            class in both files
+    """
+    classes: dict[bytes, int] = {}
+    ha1 = [classes.setdefault(line, len(classes)) for line in lines1]
+    ha2 = [classes.setdefault(line, len(classes)) for line in lines2]
+    count1 = [0] * len(classes)
+    count2 = [0] * len(classes)
+    for ha in ha1:
+        count1[ha] += 1
+    for ha in ha2:
+        count2[ha] += 1
+    return ha1, ha2, count1, count2
+
+
+def _trim_common(ha1: List[int], ha2: List[int]) -> Tuple[int, int, int]:
+    """Finds the common head & tail of two files, see xdiff xdl_trim_ends
+
+    Args:
+        ha1 (List[int]): Line classes of the first file
+        ha2 (List[int]): Line classes of the second file
+
+    Returns:
+        Tuple[int, int, int]: First line after the common head & last lines before the common tail of both files
+    """
+    limit = min(len(ha1), len(ha2))
+    dstart = 0
+    while dstart < limit and ha1[dstart] == ha2[dstart]:
+        dstart += 1
+    tail = 0
+    while tail < limit - dstart and ha1[len(ha1) - 1 - tail] == ha2[len(ha2) - 1 - tail]:
+        tail += 1
+    return dstart, len(ha1) - tail - 1, len(ha2) - tail - 1
+
+
+def _do_diff(lines1: List[bytes], lines2: List[bytes]) -> Tuple[_DiffFile, _DiffFile]:
+    """Marks the changed lines of two files, see xdiff xdl_do_diff
+
+    Args:
+        lines1 (List[bytes]): Lines of the first file
+        lines2 (List[bytes]): Lines of the second file
+
+    Returns:
+        Tuple[_DiffFile, _DiffFile]: Both files with the marks of the changed lines
+    """
+    file1, file2 = _DiffFile(lines1), _DiffFile(lines2)
+    ha1, ha2, count1, count2 = _classify_lines(lines1, lines2)
+    dstart, dend1, dend2 = _trim_common(ha1, ha2)
+
+    # discard lines without any match in the other file, they are changed for sure
+    rha1, rindex1 = _cleanup_records(file1, ha1, count2, dstart, dend1)
+    rha2, rindex2 = _cleanup_records(file2, ha2, count1, dstart, dend2)
+    _recs_cmp(rha1, rindex1, 0, len(rha1), file1, rha2, rindex2, 0, len(rha2), file2)
+    return file1, file2
+
+
+class _Group:  # pylint: disable=too-few-public-methods
+    """Group of changed lines [start, end) of a diff file, see xdiff struct xdlgroup"""
+
+    def __init__(self, file: _DiffFile) -> None:
+        self.file = file
+        self.start = 0
+        self.end = 0
+        while file.changed(self.end):
+            self.end += 1
+
+    def next(self) -> bool:
+        """Moves to the next group, returns False at the end of the file"""
+        if self.end == self.file.nrec:
+            return False
+        self.start = self.end + 1
+        self.end = self.start
+        while self.file.changed(self.end):
+            self.end += 1
+        return True
+
+    def previous(self) -> bool:
+        """Moves to the previous group, returns False at the start of the file"""
+        if self.start == 0:
+            return False
+        self.end = self.start - 1
+        self.start = self.end
+        while self.file.changed(self.start - 1):
+            self.start -= 1
+        return True
+
+    def slide_down(self) -> bool:
+        """Moves the group one line down, if the lines allow it"""
+        lines = self.file.lines
+        if self.end < self.file.nrec and lines[self.start] == lines[self.end]:
+            self.file.mark(self.start, 0)
+            self.file.mark(self.end, 1)
+            self.start += 1
+            self.end += 1
+            while self.file.changed(self.end):
+                self.end += 1
+            return True
+        return False
+
+    def slide_up(self) -> bool:
+        """Moves the group one line up, if the lines allow it"""
+        lines = self.file.lines
+        if self.start > 0 and lines[self.start - 1] == lines[self.end - 1]:
+            self.start -= 1
+            self.end -= 1
+            self.file.mark(self.start, 1)
+            self.file.mark(self.end, 0)
+            while self.file.changed(self.start - 1):
+                self.start -= 1
+            return True
+        return False
+
+
+def _change_compact(file: _DiffFile, other: _DiffFile) -> None:
+    """Moves ambiguous groups of changes down, unless they can line up with changes of the other file
+    see xdiff xdl_change_compact without indent heuristic
+    """
+    g = _Group(file)
+    go = _Group(other)
+
+    while True:
+        if g.end != g.start:
+            while True:
+                groupsize = g.end - g.start
+                end_matching_other = -1
+
+                while g.slide_up():
+                    go.previous()
+                earliest_end = g.end
+                if go.end > go.start:
+                    end_matching_other = g.end
+
+                while g.slide_down():
+                    go.next()
+                    if go.end > go.start:
+                        end_matching_other = g.end
+
+                if groupsize == g.end - g.start:
+                    break
+
+            if g.end != earliest_end and end_matching_other != -1:
+                while go.end == go.start:
+                    g.slide_up()
+                    go.previous()
+
+        if not g.next():
+            break
+        go.next()
+
+
+def _diff(lines1: List[bytes], lines2: List[bytes]) -> List[Tuple[int, int, int, int]]:
+    """Calculates the hunks to change lines1 into lines2
+
+    Args:
+        lines1 (List[bytes]): Lines of the first file
+        lines2 (List[bytes]): Lines of the second file
+
+    Returns:
+        List[Tuple[int, int, int, int]]: Hunks as (start in lines1, count in lines1, start in lines2, count in lines2)
+    """
+    file1, file2 = _do_diff(lines1, lines2)
+    _change_compact(file1, file2)
+    _change_compact(file2, file1)
+
+    hunks: List[Tuple[int, int, int, int]] = []
+    i1, i2 = file1.nrec, file2.nrec
+    while i1 >= 0 or i2 >= 0:
+        if file1.changed(i1 - 1) or file2.changed(i2 - 1):
+            l1, l2 = i1, i2
+            while file1.changed(i1 - 1):
+                i1 -= 1
+            while file2.changed(i2 - 1):
+                i2 -= 1
+            hunks.append((i1, l1 - i1, i2, l2 - i2))
+        i1 -= 1
+        i2 -= 1
+    hunks.reverse()
+    return hunks
+
+
+class _Merge:  # pylint: disable=too-few-public-methods
+    """Merge region, see xdiff struct s_xdmerge"""
+
+    def __init__(self, mode: int, i1: int, chg1: int, i2: int, chg2: int) -> None:
+        self.mode = mode
+        self.i1 = i1
+        self.chg1 = chg1
+        self.i2 = i2
+        self.chg2 = chg2
+
+
+def _append_merge(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    merges: List[_Merge], mode: int, i1: int, chg1: int, i2: int, chg2: int
+) -> None:
+    """Appends a merge region or extends the last one, if they overlap"""
+    if merges and (i1 <= merges[-1].i1 + merges[-1].chg1 or i2 <= merges[-1].i2 + merges[-1].chg2):
+        last = merges[-1]
+        if mode != last.mode:
+            last.mode = _CONFLICT
+        last.chg1 = i1 + chg1 - last.i1
+        last.chg2 = i2 + chg2 - last.i2
+    else:
+        merges.append(_Merge(mode, i1, chg1, i2, chg2))
+
+
+def _refine_conflicts(ours: List[bytes], theirs: List[bytes], merges: List[_Merge]) -> List[_Merge]:
+    """Splits conflicts into the really differing parts of both sides, see xdiff xdl_refine_conflicts"""
+    refined: List[_Merge] = []
+    for m in merges:
+        if m.mode != _CONFLICT or m.chg1 == 0 or m.chg2 == 0:
+            refined.append(m)
+            continue
+        hunks = _diff(ours[m.i1 : m.i1 + m.chg1], theirs[m.i2 : m.i2 + m.chg2])
+        if not hunks:
+            m.mode = _IDENTICAL
+            refined.append(m)
+            continue
+        refined += [_Merge(_CONFLICT, m.i1 + h1, c1, m.i2 + h2, c2) for h1, c1, h2, c2 in hunks]
+    return refined
+
+
+def _simplify_non_conflicts(ours: List[bytes], merges: List[_Merge]) -> List[_Merge]:
+    """Joins conflicts which are only separated by few or uninteresting lines, see xdiff xdl_simplify_non_conflicts"""
+    simplified: List[_Merge] = []
+    for m in merges:
+        if simplified:
+            last = simplified[-1]
+            begin = last.i1 + last.chg1
+            end = m.i1
+            if (
+                last.mode == _CONFLICT
+                and m.mode == _CONFLICT
+                and (end - begin <= 3 or not any(_ALNUM.search(line) for line in ours[begin:end]))
+            ):
+                last.chg1 = m.i1 + m.chg1 - last.i1
+                last.chg2 = m.i2 + m.chg2 - last.i2
+                continue
+        simplified.append(m)
+    return simplified
+
+
+def _is_eol_crlf(lines: List[bytes], i: int) -> int:
+    """Checks the end of line style of line i: 1 for CRLF, 0 for LF, -1 if unknown"""
+    if i < len(lines) - 1:
+        return int(lines[i].endswith(b"\r\n"))
+    if not lines:
+        return -1
+    if lines[i].endswith(b"\n"):
+        return int(lines[i].endswith(b"\r\n"))
+    if i == 0:
+        return -1
+    return int(lines[i - 1].endswith(b"\r\n"))
+
+
+def _is_cr_needed(base: List[bytes], ours: List[bytes], theirs: List[bytes], m: _Merge) -> bool:
+    """Checks if the conflict markers need a CR to match the end of line style of the files"""
+    needs_cr = _is_eol_crlf(ours, m.i1 - 1 if m.i1 else 0)
+    if needs_cr:
+        needs_cr = _is_eol_crlf(theirs, m.i2 - 1 if m.i2 else 0)
+    if needs_cr:
+        needs_cr = _is_eol_crlf(base, 0)
+    return needs_cr > 0
+
+
+def _copy_lines(lines: List[bytes], needs_cr: bool, add_nl: bool) -> bytes:
+    """Joins lines and adds a missing line feed to the last line, if requested"""
+    content = b"".join(lines)
+    if add_nl and lines and not content.endswith(b"\n"):
+        content += b"\r\n" if needs_cr else b"\n"
+    return content
+
+
+def merge_three_way(  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
+    ours: bytes, base: bytes, theirs: bytes, label_ours: str = "", label_theirs: str = ""
+) -> Tuple[bytes, int]:
+    """Merges the changes from base to theirs into ours
+
+    Args:
+        ours (bytes): Content of our file
+        base (bytes): Content of the common ancestor
+        theirs (bytes): Content of their file
+        label_ours (str): Label of our side in conflict markers
+        label_theirs (str): Label of their side in conflict markers
+
+    Returns:
+        Tuple[bytes, int]: The merge result and the number of conflicts
+    """
+    base_lines, ours_lines, theirs_lines = split_lines(base), split_lines(ours), split_lines(theirs)
+    hunks_ours = _diff(base_lines, ours_lines)
+    if not hunks_ours:
+        return theirs, 0
+    hunks_theirs = _diff(base_lines, theirs_lines)
+    if not hunks_theirs:
+        return ours, 0
+
+    merges: List[_Merge] = []
+    x1, x2 = 0, 0
+    while x1 < len(hunks_ours) and x2 < len(hunks_theirs):
+        o_i0, o_chg0, o_i, o_chg = hunks_ours[x1]
+        t_i0, t_chg0, t_i, t_chg = hunks_theirs[x2]
+        if o_i0 + o_chg0 < t_i0:
+            _append_merge(merges, _OURS, o_i, o_chg, t_i - t_i0 + o_i0, o_chg0)
+            x1 += 1
+            continue
+        if t_i0 + t_chg0 < o_i0:
+            _append_merge(merges, _THEIRS, o_i - o_i0 + t_i0, t_chg0, t_i, t_chg)
+            x2 += 1
+            continue
+        if o_i0 != t_i0 or o_chg0 != t_chg0 or ours_lines[o_i : o_i + o_chg] != theirs_lines[t_i : t_i + t_chg]:
+            off = o_i0 - t_i0
+            ffo = off + o_chg0 - t_chg0
+            i1, i2 = o_i, t_i
+            if off > 0:
+                i1 -= off
+            else:
+                i2 += off
+            chg1 = o_i + o_chg - i1
+            chg2 = t_i + t_chg - i2
+            if ffo < 0:
+                chg1 -= ffo
+            else:
+                chg2 += ffo
+            _append_merge(merges, _CONFLICT, i1, chg1, i2, chg2)
+
+        end_ours = o_i0 + o_chg0
+        end_theirs = t_i0 + t_chg0
+        if end_ours >= end_theirs:
+            x2 += 1
+        if end_theirs >= end_ours:
+            x1 += 1
+    for o_i0, o_chg0, o_i, o_chg in hunks_ours[x1:]:
+        _append_merge(merges, _OURS, o_i, o_chg, o_i0 + len(theirs_lines) - len(base_lines), o_chg0)
+    for t_i0, t_chg0, t_i, t_chg in hunks_theirs[x2:]:
+        _append_merge(merges, _THEIRS, t_i0 + len(ours_lines) - len(base_lines), t_chg0, t_i, t_chg)
+
+    merges = _simplify_non_conflicts(ours_lines, _refine_conflicts(ours_lines, theirs_lines, merges))
+
+    result: List[bytes] = []
+    conflicts = 0
+    i = 0
+    for m in merges:
+        if m.mode == _IDENTICAL:
+            continue
+        result.append(b"".join(ours_lines[i : m.i1]))
+        if m.mode == _CONFLICT:
+            conflicts += 1
+            needs_cr = _is_cr_needed(base_lines, ours_lines, theirs_lines, m)
+            eol = b"\r\n" if needs_cr else b"\n"
+            result.append(b"<" * _MARKER_SIZE + (b" " + label_ours.encode() if label_ours else b"") + eol)
+            result.append(_copy_lines(ours_lines[m.i1 : m.i1 + m.chg1], needs_cr, True))
+            result.append(b"=" * _MARKER_SIZE + eol)
+            result.append(_copy_lines(theirs_lines[m.i2 : m.i2 + m.chg2], needs_cr, True))
+            result.append(b">" * _MARKER_SIZE + (b" " + label_theirs.encode() if label_theirs else b"") + eol)
+        elif m.mode == _OURS:
+            result.append(b"".join(ours_lines[m.i1 : m.i1 + m.chg1]))
+        else:
+            result.append(b"".join(theirs_lines[m.i2 : m.i2 + m.chg2]))
+        i = m.i1 + m.chg1
+    result.append(b"".join(ours_lines[i:]))
+    return b"".join(result), conflicts
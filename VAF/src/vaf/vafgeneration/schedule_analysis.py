@@ -0,0 +1,332 @@
+"""Static schedulability analysis of the executables
+Simulates one hyperperiod of the tick loop of vaf::Executor, which executes a task in tick `counter` if
+`counter >= offset` and `(counter - offset) % (period / executor period) == 0`.
+"""
+
+import math
+from typing import Any, Dict, List, Tuple
+
+from vaf import vafmodel
+
+from .generation import time_str_to_milliseconds, time_str_to_nanoseconds
+
+# longer hyperperiods are not simulated, their tick load arrays get too big
+MAX_HYPERPERIOD_TICKS = 100_000
+
+
+class ScheduledTask:  # pylint: disable=too-few-public-methods, too-many-instance-attributes
+    """Task as scheduled by the executor of an executable"""
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        app_module: str,
+        name: str,
+        period_ticks: int,
+        offset: int,
+        budget: int,
+        is_offset_fixed: bool,
+        run_after: List[str],
+    ) -> None:
+        """
+        Args:
+            app_module (str): Full name of the application module
+            name (str): Name of the task
+            period_ticks (int): Period in executor ticks
+            offset (int): Offset in executor ticks
+            budget (int): Budget in ns, 0 if not given
+            is_offset_fixed (bool): True if the offset is given by the task mapping or the preferred offset
+            run_after (List[str]): Names of the tasks of the same application module that run before this task
+        """
+        self.app_module = app_module
+        self.name = name
+        self.period_ticks = period_ticks
+        self.offset = offset
+        self.budget = budget
+        self.is_offset_fixed = is_offset_fixed
+        self.run_after = run_after
+
+
+def get_scheduled_tasks(executable: vafmodel.Executable) -> List[ScheduledTask]:
+    """Gets the tasks of all application modules of an executable
+
+    Args:
+        executable (vafmodel.Executable): The executable
+
+    Raises:
+        ValueError: If a task period is shorter than the executor period
+
+    Returns:
+        List[ScheduledTask]: The tasks in the order of the application modules
+    """
+    executor_period = time_str_to_milliseconds(executable.ExecutorPeriod)
+    tasks: List[ScheduledTask] = []
+    for am in executable.ApplicationModules:
+        app_module = f"{am.ApplicationModuleRef.Namespace}::{am.ApplicationModuleRef.Name}"
+        mappings = {mapping.TaskName: mapping for mapping in am.TaskMapping}
+        for task in am.ApplicationModuleRef.Tasks:
+            # same integer division as the executor
+            period_ticks = time_str_to_milliseconds(task.Period) // executor_period
+            if period_ticks == 0:
+                raise ValueError(
+                    f"Period {task.Period} of task {app_module}::{task.Name} is shorter than the "
+                    f"executor period {executable.ExecutorPeriod} of executable {executable.Name}"
+                )
+            mapping = mappings.get(task.Name)
+            offset: int | None = task.PreferredOffset
+            budget = 0
+            if mapping is not None:
+                if mapping.Offset is not None:
+                    offset = mapping.Offset
+                if mapping.Budget is not None:
+                    budget = time_str_to_nanoseconds(mapping.Budget)
+            tasks.append(
+                ScheduledTask(
+                    app_module,
+                    task.Name,
+                    period_ticks,
+                    offset if offset is not None else 0,
+                    budget,
+                    offset is not None,
+                    list(task.RunAfter),
+                )
+            )
+    return tasks
+
+
+def get_hyperperiod(tasks: List[ScheduledTask]) -> int:
+    """Gets the hyperperiod of tasks
+
+    Args:
+        tasks (List[ScheduledTask]): The tasks
+
+    Raises:
+        ValueError: If the hyperperiod is longer than MAX_HYPERPERIOD_TICKS
+
+    Returns:
+        int: The least common multiple of all task periods in executor ticks
+    """
+    hyperperiod = math.lcm(*[task.period_ticks for task in tasks]) if tasks else 1
+    if hyperperiod > MAX_HYPERPERIOD_TICKS:
+        raise ValueError(f"Hyperperiod of {hyperperiod} ticks exceeds the limit of {MAX_HYPERPERIOD_TICKS} ticks")
+    return hyperperiod
+
+
+def get_tick_loads(tasks: List[ScheduledTask], hyperperiod: int, offsets: Dict[int, int] | None = None) -> List[int]:
+    """Simulates one hyperperiod of the executor in steady state
+
+    Args:
+        tasks (List[ScheduledTask]): The tasks
+        hyperperiod (int): The hyperperiod in executor ticks
+        offsets (Dict[int, int], optional): Offsets to use instead of the task offsets by task index
+
+    Returns:
+        List[int]: Summed budgets in ns per tick of the hyperperiod
+    """
+    loads = [0] * hyperperiod
+    for i, task in enumerate(tasks):
+        offset = offsets.get(i, task.offset) if offsets is not None else task.offset
+        for tick in range(offset % task.period_ticks, hyperperiod, task.period_ticks):
+            loads[tick] += task.budget
+    return loads
+
+
+def get_run_after_groups(tasks: List[ScheduledTask]) -> List[List[int]]:
+    """Groups the tasks connected via RunAfter, they need to stay in the same tick to keep their order
+
+    Args:
+        tasks (List[ScheduledTask]): The tasks
+
+    Returns:
+        List[List[int]]: Task indices per group in the order of the tasks
+    """
+    parents = list(range(len(tasks)))
+
+    def find(i: int) -> int:
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    indices = {(task.app_module, task.name): i for i, task in enumerate(tasks)}
+    for i, task in enumerate(tasks):
+        for run_after in task.run_after:
+            j = indices.get((task.app_module, run_after))
+            if j is not None:
+                parents[find(i)] = find(j)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(tasks)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
+def __get_group_placement(
+    tasks: List[ScheduledTask], group: List[int], loads: List[int], offset: int
+) -> Tuple[int, int, Dict[int, int]]:
+    """Evaluates an offset for a group of tasks
+
+    Args:
+        tasks (List[ScheduledTask]): The tasks
+        group (List[int]): Task indices of the group
+        loads (List[int]): Tick loads of the already placed tasks
+        offset (int): The offset to evaluate
+
+    Returns:
+        Tuple[int, int, Dict[int, int]]: Peak load & overlap with the placed load of the hit ticks, added load per tick
+    """
+    added: Dict[int, int] = {}
+    for i in group:
+        task = tasks[i]
+        for tick in range(offset % task.period_ticks, len(loads), task.period_ticks):
+            added[tick] = added.get(tick, 0) + task.budget
+    peak = max((loads[tick] + load for tick, load in added.items()), default=0)
+    overlap = sum(loads[tick] * load for tick, load in added.items())
+    return peak, overlap, added
+
+
+def suggest_offsets(tasks: List[ScheduledTask], hyperperiod: int) -> Dict[int, int]:  # pylint: disable=too-many-locals
+    """Chooses offsets for the tasks without fixed offset, that minimise the peak tick load
+    Tasks with fixed offsets are kept. Tasks connected via RunAfter get the same offset, the offset of a fixed
+    group member if any. The remaining groups are placed greedily by descending utilisation, each at the offset
+    below its shortest period with the lowest peak & overlap with the already placed load.
+
+    Args:
+        tasks (List[ScheduledTask]): The tasks
+        hyperperiod (int): The hyperperiod in executor ticks
+
+    Returns:
+        Dict[int, int]: Offset by task index for all tasks
+    """
+    offsets: Dict[int, int] = {}
+    free_groups: List[List[int]] = []
+    for group in get_run_after_groups(tasks):
+        fixed = [i for i in group if tasks[i].is_offset_fixed]
+        if fixed:
+            for i in group:
+                offsets[i] = tasks[i].offset if tasks[i].is_offset_fixed else tasks[fixed[0]].offset
+        else:
+            free_groups.append(group)
+
+    loads = get_tick_loads([tasks[i] for i in offsets], hyperperiod, dict(enumerate(offsets.values())))
+    free_groups.sort(key=lambda group: -sum(tasks[i].budget / tasks[i].period_ticks for i in group))
+    for group in free_groups:
+        best: Tuple[int, int, int] | None = None
+        best_added: Dict[int, int] = {}
+        for offset in range(min(tasks[i].period_ticks for i in group)):
+            peak, overlap, added = __get_group_placement(tasks, group, loads, offset)
+            if best is None or (peak, overlap, offset) < best:
+                best = (peak, overlap, offset)
+                best_added = added
+        assert best is not None
+        for i in group:
+            offsets[i] = best[2]
+        for tick, load in best_added.items():
+            loads[tick] += load
+    return offsets
+
+
+def get_balanced_task_offsets(executable: vafmodel.Executable) -> Dict[Tuple[str, str], int]:
+    """Chooses the offsets of the tasks of an executable without fixed offset, see suggest_offsets
+
+    Args:
+        executable (vafmodel.Executable): The executable
+
+    Returns:
+        Dict[Tuple[str, str], int]: Offset by full application module name & task name of the tasks without fixed offset
+    """
+    tasks = get_scheduled_tasks(executable)
+    offsets = suggest_offsets(tasks, get_hyperperiod(tasks))
+    return {(task.app_module, task.name): offsets[i] for i, task in enumerate(tasks) if not task.is_offset_fixed}
+
+
+def __get_load_summary(loads: List[int], executor_period: int) -> Dict[str, Any]:
+    peak_tick = max(range(len(loads)), key=lambda tick: loads[tick])
+    return {
+        "WorstCaseTick": peak_tick,
+        "WorstCaseTickLoad": loads[peak_tick],
+        "WorstCaseUtilization": round(100 * loads[peak_tick] / executor_period, 2),
+        "AverageUtilization": round(100 * sum(loads) / len(loads) / executor_period, 2),
+    }
+
+
+def analyze_executable(executable: vafmodel.Executable) -> Dict[str, Any]:
+    """Analyses the executor load of an executable, all budgets & loads are given in ns
+
+    Args:
+        executable (vafmodel.Executable): The executable
+
+    Returns:
+        Dict[str, Any]: Report with the load per tick & its summary for the current and the suggested offsets
+    """
+    executor_period = time_str_to_nanoseconds(executable.ExecutorPeriod)
+    tasks = get_scheduled_tasks(executable)
+    hyperperiod = get_hyperperiod(tasks)
+    loads = get_tick_loads(tasks, hyperperiod)
+    offsets = suggest_offsets(tasks, hyperperiod)
+    suggested_loads = get_tick_loads(tasks, hyperperiod, offsets)
+    return {
+        "Executable": executable.Name,
+        "ExecutorPeriod": executor_period,
+        "HyperperiodTicks": hyperperiod,
+        "Tasks": [
+            {
+                "ApplicationModule": task.app_module,
+                "Task": task.name,
+                "PeriodTicks": task.period_ticks,
+                "Offset": task.offset,
+                "FixedOffset": task.is_offset_fixed,
+                "SuggestedOffset": offsets[i],
+                "Budget": task.budget,
+            }
+            for i, task in enumerate(tasks)
+        ],
+        "TasksWithoutBudget": [f"{task.app_module}::{task.name}" for task in tasks if task.budget == 0],
+        "TickLoad": loads,
+        **__get_load_summary(loads, executor_period),
+        "Suggested": {"TickLoad": suggested_loads, **__get_load_summary(suggested_loads, executor_period)},
+    }
+
+
+def analyze_model(model: vafmodel.MainModel) -> List[Dict[str, Any]]:
+    """Analyses the executor load of all executables
+
+    Args:
+        model (vafmodel.MainModel): The main model
+
+    Returns:
+        List[Dict[str, Any]]: Report per executable, see analyze_executable
+    """
+    return [analyze_executable(executable) for executable in model.Executables]
+
+
+def format_report(reports: List[Dict[str, Any]]) -> str:
+    """Formats the reports of analyze_model for the console
+
+    Args:
+        reports (List[Dict[str, Any]]): The reports
+
+    Returns:
+        str: The formatted reports
+    """
+    lines: List[str] = []
+    for report in reports:
+        suggested = report["Suggested"]
+        lines += [
+            f"Executable {report['Executable']}:",
+            f"  Executor period: {report['ExecutorPeriod'] / 1_000_000:g}ms, "
+            f"hyperperiod: {report['HyperperiodTicks']} ticks",
+            f"  Worst-case tick utilization: {report['WorstCaseUtilization']}% "
+            f"(tick {report['WorstCaseTick']}, {report['WorstCaseTickLoad']}ns)",
+            f"  Average utilization: {report['AverageUtilization']}%",
+            f"  Worst-case tick utilization with suggested offsets: {suggested['WorstCaseUtilization']}%",
+        ]
+        changed_offsets = [task for task in report["Tasks"] if task["SuggestedOffset"] != task["Offset"]]
+        if changed_offsets:
+            lines.append("  Suggested offsets:")
+            lines += [
+                f"    {task['ApplicationModule']}::{task['Task']}: {task['Offset']} -> {task['SuggestedOffset']}"
+                for task in changed_offsets
+            ]
+        if report["TasksWithoutBudget"]:
+            lines.append(f"  Tasks without budget: {', '.join(report['TasksWithoutBudget'])}")
+    return "\n".join(lines)
@@ -15,6 +15,7 @@ from vaf import vafmodel
 from vaf.cli_core.common.utils import to_snake_case
 from vaf.vafgeneration.vaf_generate_common import get_ancestor_file_suffix
 
+from . import schedule_analysis
 from .generation import (
     FileHelper,
     Generator,
@@ -23,11 +24,251 @@ from .generation import (
 )
 
 
-def _is_vsf_platform_module(executable: vafmodel.Executable, module: vafmodel.PlatformModule) -> bool:
-    for m in executable.InternalCommunicationModules:
+def _find_module(modules: dict[tuple[str, str], list[vafmodel.PlatformModule]], module: vafmodel.PlatformModule) -> int:
+    """Finds a platform module in modules indexed by namespace & name
+
+    Args:
+        modules (dict[tuple[str, str], list[vafmodel.PlatformModule]]): The indexed modules
+        module (vafmodel.PlatformModule): The module to find
+
+    Returns:
+        int: Position of the module in its bucket or -1 if not found
+    """
+    bucket = modules.get((module.Namespace, module.Name), [])
+    # identity first, the pydantic comparison walks the whole module interface
+    for i, m in enumerate(bucket):
+        if m is module:
+            return i
+    for i, m in enumerate(bucket):
         if m == module:
-            return True
-    return False
+            return i
+    return -1
+
+
+class ApplicationModuleWiring:
+    """Precomputed connections of an application module mapping"""
+
+    def __init__(self, eamm: vafmodel.ExecutableApplicationModuleMapping) -> None:
+        """
+        Args:
+            eamm (vafmodel.ExecutableApplicationModuleMapping): The application module mapping
+        """
+        self.eamm = eamm
+        am = eamm.ApplicationModuleRef
+        self.consumed_interfaces: dict[str, vafmodel.ApplicationModuleConsumedInterface] = {}
+        for ci in am.ConsumedInterfaces:
+            self.consumed_interfaces.setdefault(ci.InstanceName, ci)
+        self.provided_instances = {pi.InstanceName for pi in am.ProvidedInterfaces}
+        self.mappings_by_instance: dict[str, list[vafmodel.InterfaceInstanceToModuleMapping]] = {}
+        # consumed modules with the consumed interface of their first mapping
+        self.consumed_modules: dict[tuple[str, str], list[vafmodel.PlatformModule]] = {}
+        self.consumed_module_interfaces: dict[tuple[str, str], list[vafmodel.ApplicationModuleConsumedInterface]] = {}
+        for mapping in eamm.InterfaceInstanceToModuleMappings:
+            self.mappings_by_instance.setdefault(mapping.InstanceName, []).append(mapping)
+            consumed_interface = self.consumed_interfaces.get(mapping.InstanceName)
+            if consumed_interface is not None and _find_module(self.consumed_modules, mapping.ModuleRef) == -1:
+                key = (mapping.ModuleRef.Namespace, mapping.ModuleRef.Name)
+                self.consumed_modules.setdefault(key, []).append(mapping.ModuleRef)
+                self.consumed_module_interfaces.setdefault(key, []).append(consumed_interface)
+
+    def __get_modules(self, instance_names: list[str]) -> list[vafmodel.PlatformModule]:
+        modules: list[vafmodel.PlatformModule] = []
+        am = self.eamm.ApplicationModuleRef
+        for instance_name in instance_names:
+            found_iitmm = self.mappings_by_instance.get(instance_name, [])
+            if len(found_iitmm) == 1:
+                modules.append(found_iitmm[0].ModuleRef)
+            else:
+                raise ValueError(
+                    f"Error: The application module interface instance: {instance_name}"
+                    f" defined for application module: {am.Namespace}::{am.Name} is not mapped/connected."
+                    "Consider using the 'connect_interfaces()' method to connect the interfaces internally."
+                )
+        return modules
+
+    def get_provided_modules(self) -> list[vafmodel.PlatformModule]:
+        """Gets the platform modules connected to the provided interfaces
+
+        Raises:
+            ValueError: If a provided interface is not mapped exactly once
+
+        Returns:
+            list[vafmodel.PlatformModule]: The modules in the order of the provided interfaces
+        """
+        return self.__get_modules([pi.InstanceName for pi in self.eamm.ApplicationModuleRef.ProvidedInterfaces])
+
+    def get_consumed_modules(self) -> list[vafmodel.PlatformModule]:
+        """Gets the platform modules connected to the consumed interfaces
+
+        Raises:
+            ValueError: If a consumed interface is not mapped exactly once
+
+        Returns:
+            list[vafmodel.PlatformModule]: The modules in the order of the consumed interfaces
+        """
+        return self.__get_modules([ci.InstanceName for ci in self.eamm.ApplicationModuleRef.ConsumedInterfaces])
+
+    def get_consumed_interface(self, m: vafmodel.PlatformModule) -> vafmodel.ApplicationModuleConsumedInterface:
+        """Gets the consumed interface a platform module is connected to
+
+        Args:
+            m (vafmodel.PlatformModule): The platform module
+
+        Raises:
+            ValueError: If the module is not connected to a consumed interface
+
+        Returns:
+            vafmodel.ApplicationModuleConsumedInterface: The consumed interface of the first mapping of the module
+        """
+        i = _find_module(self.consumed_modules, m)
+        if i == -1:
+            raise ValueError(f"Error: could not find consumed interface of platform module {m.Namespace}::{m.Name}")
+        return self.consumed_module_interfaces[(m.Namespace, m.Name)][i]
+
+
+class ExecutableWiring:
+    """Precomputed wiring of an executable
+    Built once per executable, so the generation looks up internal modules & connections in constant time
+    instead of rescanning the interface mappings for every module.
+    """
+
+    def __init__(self, executable: vafmodel.Executable) -> None:
+        """
+        Args:
+            executable (vafmodel.Executable): The executable
+        """
+        self.executable = executable
+        self.internal_modules: dict[tuple[str, str], list[vafmodel.PlatformModule]] = {}
+        for m in executable.InternalCommunicationModules:
+            self.internal_modules.setdefault((m.Namespace, m.Name), []).append(m)
+        self.application_modules: dict[int, ApplicationModuleWiring] = {}
+        self.dependencies: dict[int, tuple[list[str], list[str]]] = {}
+        self.internal_providers: dict[tuple[str, str], list[str]] | None = None
+
+    def is_internal(self, module: vafmodel.PlatformModule) -> bool:
+        """Checks if a platform module is an internal communication module of the executable
+
+        Args:
+            module (vafmodel.PlatformModule): The platform module
+
+        Returns:
+            bool: True if internal communication module
+        """
+        return _find_module(self.internal_modules, module) != -1
+
+    def get_application_module(self, eamm: vafmodel.ExecutableApplicationModuleMapping) -> ApplicationModuleWiring:
+        """Gets the connections of an application module mapping
+
+        Args:
+            eamm (vafmodel.ExecutableApplicationModuleMapping): The application module mapping
+
+        Returns:
+            ApplicationModuleWiring: The connections of the application module
+        """
+        if id(eamm) not in self.application_modules:
+            self.application_modules[id(eamm)] = ApplicationModuleWiring(eamm)
+        return self.application_modules[id(eamm)]
+
+    def get_communication_modules(self) -> tuple[list[vafmodel.PlatformModule], list[vafmodel.PlatformModule]]:
+        """Gets the platform modules connected to the application modules
+
+        Raises:
+            ValueError: If a mapped interface instance is not found in its application module
+
+        Returns:
+            tuple[list[vafmodel.PlatformModule], list[vafmodel.PlatformModule]]:
+                The consumed modules without the internal ones & the provided modules
+        """
+        provided_modules: list[vafmodel.PlatformModule] = []
+        consumed_modules: list[vafmodel.PlatformModule] = []
+        for am in self.executable.ApplicationModules:
+            wiring = self.get_application_module(am)
+            for mapping in am.InterfaceInstanceToModuleMappings:
+                if mapping.InstanceName in wiring.consumed_interfaces:
+                    if not self.is_internal(mapping.ModuleRef):
+                        consumed_modules.append(mapping.ModuleRef)
+                elif mapping.InstanceName in wiring.provided_instances:
+                    provided_modules.append(mapping.ModuleRef)
+                else:
+                    raise ValueError(
+                        f"Mapped interface instance {mapping.InstanceName} not found in application module: "
+                    )
+        return consumed_modules, provided_modules
+
+    def get_module_ids(self, communication_modules: list[vafmodel.PlatformModule]) -> dict[str, int]:
+        """Assigns the ids of the executable controller registry in the order of registration
+
+        Args:
+            communication_modules (list[vafmodel.PlatformModule]): The platform modules registered before the
+                application modules
+
+        Returns:
+            dict[str, int]: The module ids by module name
+        """
+        module_ids: dict[str, int] = {}
+        names = [m.Name for m in communication_modules] + [
+            am.ApplicationModuleRef.Name for am in self.executable.ApplicationModules
+        ]
+        for name in names:
+            module_ids.setdefault(name, len(module_ids))
+        return module_ids
+
+    def get_dependencies(self, am: vafmodel.ExecutableApplicationModuleMapping) -> tuple[list[str], list[str]]:
+        """Gets the execution and module dependencies of a application module by its mapping
+
+        Args:
+            am (vafmodel.ExecutableApplicationModuleMapping): The application module mapping
+
+        Returns:
+            tuple[list[str], list[str]]: The execution and module dependencies
+        """
+        if id(am) not in self.dependencies:
+            wiring = self.get_application_module(am)
+            execution_dependencies: list[str] = []
+            module_dependencies_c: list[str] = []
+            module_dependencies_p: list[str] = []
+
+            for m in wiring.get_provided_modules():
+                module_dependencies_p.append(m.Name)
+                if not self.is_internal(m):
+                    execution_dependencies.append(m.Name)
+
+            for m in wiring.get_consumed_modules():
+                module_dependencies_c.append(m.Name)
+
+                if not wiring.get_consumed_interface(m).IsOptional:
+                    execution_dependencies.append(m.Name)
+
+            self.dependencies[id(am)] = (execution_dependencies, module_dependencies_c + module_dependencies_p)
+        return self.dependencies[id(am)]
+
+    def get_run_after(self, am: vafmodel.ExecutableApplicationModuleMapping) -> list[str]:
+        """Gets the modules the runnables of an application module run after
+        Besides the execution dependencies, these are the application modules providing the internal communication
+        modules it consumes. The executor never runs them in parallel, as their samples & handlers are shared.
+
+        Args:
+            am (vafmodel.ExecutableApplicationModuleMapping): The application module mapping
+
+        Returns:
+            list[str]: The names of the modules to run after
+        """
+        if self.internal_providers is None:
+            self.internal_providers = {}
+            for provider in self.executable.ApplicationModules:
+                for m in self.get_application_module(provider).get_provided_modules():
+                    if self.is_internal(m):
+                        self.internal_providers.setdefault((m.Namespace, m.Name), []).append(
+                            provider.ApplicationModuleRef.Name
+                        )
+
+        run_after = list(self.get_dependencies(am)[0])
+        for m in self.get_application_module(am).get_consumed_modules():
+            if self.is_internal(m):
+                for provider_name in self.internal_providers.get((m.Namespace, m.Name), []):
+                    if provider_name != am.ApplicationModuleRef.Name and provider_name not in run_after:
+                        run_after.append(provider_name)
+        return run_after
 
 
 def get_full_type_of_application_module(
@@ -99,59 +340,9 @@ def is_internal_communication_module(exe: vafmodel.Executable, sm: vafmodel.Plat
     Returns:
         bool: True if internal communication module
     """
-    if not _is_vsf_platform_module(exe, sm):
-        return False
-    return True
-
-
-def _get_provided_modules_of_application_module(
-    eamm: vafmodel.ExecutableApplicationModuleMapping,
-) -> list[vafmodel.PlatformModule]:
-    modules: list[vafmodel.PlatformModule] = []
-    am = eamm.ApplicationModuleRef
-    for ami in am.ProvidedInterfaces:
-        found_iitmm = [iitm for iitm in eamm.InterfaceInstanceToModuleMappings if iitm.InstanceName == ami.InstanceName]
-        if len(found_iitmm) == 1:
-            modules.append(found_iitmm[0].ModuleRef)
-        else:
-            raise ValueError(
-                f"Error: The application module interface instance: {ami.InstanceName}"
-                f" defined for application module: {am.Namespace}::{am.Name} is not mapped/connected."
-                "Consider using the 'connect_interfaces()' method to connect the interfaces internally."
-            )
-    return modules
-
-
-def _get_consumed_modules_of_application_module(
-    eamm: vafmodel.ExecutableApplicationModuleMapping,
-) -> list[vafmodel.PlatformModule]:
-    modules: list[vafmodel.PlatformModule] = []
-    am = eamm.ApplicationModuleRef
-    for ami in am.ConsumedInterfaces:
-        found_iitmm = [iitm for iitm in eamm.InterfaceInstanceToModuleMappings if iitm.InstanceName == ami.InstanceName]
-        if len(found_iitmm) == 1:
-            modules.append(found_iitmm[0].ModuleRef)
-        else:
-            raise ValueError(
-                f"Error: The application module interface instance: {ami.InstanceName}"
-                f" defined for application module: {am.Namespace}::{am.Name} is not mapped/connected."
-                "Consider using the 'connect_interfaces()' method to connect the interfaces internally."
-            )
-    return modules
-
-
-def _get_consumed_interface(
-    am: vafmodel.ExecutableApplicationModuleMapping, m: vafmodel.PlatformModule
-) -> vafmodel.ApplicationModuleConsumedInterface:
-    for iitmm in am.InterfaceInstanceToModuleMappings:
-        if iitmm.ModuleRef == m:
-            for ci in am.ApplicationModuleRef.ConsumedInterfaces:
-                if ci.InstanceName == iitmm.InstanceName:
-                    return ci
-    raise ValueError(f"Error: could not find consumed interface of platform module {m.Namespace}::{m.Name}")
+    return ExecutableWiring(exe).is_internal(sm)
 
 
-# pylint: disable=too-many-branches
 def get_dependencies_of_application_module(
     exe: vafmodel.Executable,
     am: vafmodel.ExecutableApplicationModuleMapping,
@@ -165,38 +356,21 @@ def get_dependencies_of_application_module(
     Returns:
         tuple[list[str], list[str]]: The execution and module dependencies
     """
-    execution_dependencies: list[str] = []
-    module_dependencies_c: list[str] = []
-    module_dependencies_p: list[str] = []
-
-    provided_modules = _get_provided_modules_of_application_module(am)
-    for m in provided_modules:
-        module_dependencies_p.append(m.Name)
-        if not _is_vsf_platform_module(exe, m):
-            execution_dependencies.append(m.Name)
-
-    consumed_modules = _get_consumed_modules_of_application_module(am)
-    for m in consumed_modules:
-        module_dependencies_c.append(m.Name)
-
-        if not _get_consumed_interface(am, m).IsOptional:
-            execution_dependencies.append(m.Name)
-
-    return (execution_dependencies, module_dependencies_c + module_dependencies_p)
-
-
-# pylint: enable=too-many-branches
+    return ExecutableWiring(exe).get_dependencies(am)
 
 
 def get_task_mapping(
     mapping: vafmodel.ExecutableTaskMapping,
     am: vafmodel.ExecutableApplicationModuleMapping,
+    balanced_offsets: dict[tuple[str, str], int] | None = None,
 ) -> tuple[int, int]:
     """Gets the offset and budget of a task by its mapping
 
     Args:
         mapping (vafmodel.ExecutableTaskMapping): The task mapping
         am (vafmodel.ExecutableApplicationModuleMapping): The application module the task is mapped to
+        balanced_offsets (dict[tuple[str, str], int], optional): Generated offsets of the tasks without offset and
+            preferred offset by full application module name & task name
 
     Raises:
         ValueError: If the mapped task is not found in the application module
@@ -220,6 +394,10 @@ def get_task_mapping(
             offset = preferred_offset
         elif mapping.Offset != preferred_offset:
             print(f"Warning: offset for task {mapping.TaskName} is different then its preferred offset")
+    elif mapping.Offset is None and balanced_offsets is not None:
+        offset = balanced_offsets.get(
+            (f"{am.ApplicationModuleRef.Namespace}::{am.ApplicationModuleRef.Name}", mapping.TaskName), offset
+        )
 
     return (offset, budget)
 
@@ -248,57 +426,27 @@ def generate(  # pylint: disable=too-many-locals, too-many-branches, too-many-st
 
     for e in model.Executables:  # pylint: disable=too-many-branches, too-many-nested-blocks
         output_path = output_dir / "src-gen/executables"
-        provided_modules: list[vafmodel.PlatformModule] = []
-        consumed_modules: list[vafmodel.PlatformModule] = []
-
-        for am in e.ApplicationModules:
-            for mapping in am.InterfaceInstanceToModuleMappings:
-                if (
-                    len(
-                        [
-                            ci
-                            for ci in am.ApplicationModuleRef.ConsumedInterfaces
-                            if ci.InstanceName == mapping.InstanceName
-                        ]
-                    )
-                    > 0
-                ):
-                    if not _is_vsf_platform_module(e, mapping.ModuleRef):
-                        consumed_modules.append(mapping.ModuleRef)
-                elif (
-                    len(
-                        [
-                            ci
-                            for ci in am.ApplicationModuleRef.ProvidedInterfaces
-                            if ci.InstanceName == mapping.InstanceName
-                        ]
-                    )
-                    > 0
-                ):
-                    provided_modules.append(mapping.ModuleRef)
-
-                else:
-                    raise ValueError(
-                        f"Mapped interface instance {mapping.InstanceName} not found in application module: "
-                    )
+        wiring = ExecutableWiring(e)
+        consumed_modules, provided_modules = wiring.get_communication_modules()
 
         folder_name = to_snake_case(e.Name)
         generator.set_base_directory(output_path / folder_name)
 
         exe_controller_file = FileHelper("ExecutableController", "executable_controller")
         if not is_ancestor:
+            balanced_offsets = schedule_analysis.get_balanced_task_offsets(e) if e.BalanceTaskOffsets else None
             generator.generate_to_file(exe_controller_file, ".h", "vaf_controller/executable_controller_h.jinja")
             generator.generate_to_file(
                 exe_controller_file,
                 ".cpp",
                 "vaf_controller/executable_controller_cpp.jinja",
                 get_full_type_of_application_module=get_full_type_of_application_module,
-                get_dependencies_of_application_module=get_dependencies_of_application_module,
                 get_includes_of_platform_modules=get_includes_of_platform_modules,
                 get_full_type_of_platform_module=get_full_type_of_platform_module,
-                is_internal_communication_module=is_internal_communication_module,
+                wiring=wiring,
                 get_include_of_application_module=get_include_of_application_module,
                 get_task_mapping=get_task_mapping,
+                balanced_offsets=balanced_offsets,
                 executable=e,
                 communication_modules=consumed_modules + provided_modules,
                 vafmodel=vafmodel,
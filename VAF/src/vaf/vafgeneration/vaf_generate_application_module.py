@@ -6,6 +6,7 @@ from typing import List
 
 from vaf import vafmodel
 from vaf.cli_core.common.exceptions import VafProjectGenerationError
+from vaf.cli_core.common.profiling import profile_phase
 from vaf.vafpy import import_model
 from vaf.vafpy.model_runtime import model_runtime
 
@@ -17,7 +18,7 @@ from .vaf_application_module import generate_app_module_project_files
 # Build system files generators
 from .vaf_cmake_common import generate as generate_cmake_common
 from .vaf_conan import generate as generate_conan_deps
-from .vaf_generate_common import get_ancestor_model, merge_after_regeneration
+from .vaf_generate_common import PristineStore, get_ancestor_model, merge_after_regeneration
 
 # VAF generators
 from .vaf_interface import generate_module_interfaces as generate_interface
@@ -73,7 +74,8 @@ def generate_application_module(  # pylint: disable=too-many-arguments, too-many
     # clean model runtime before every run
     model_runtime.reset()
     # import json as model_runtime
-    import_model(model_file)
+    with profile_phase("import model"):
+        import_model(model_file)
     main_model = model_runtime.main_model
     path_output_dir = Path(project_dir)
     if len(main_model.ApplicationModules) != 1:
@@ -111,8 +113,10 @@ def generate_application_module(  # pylint: disable=too-many-arguments, too-many
         main_model.ApplicationModules[0], path_output_dir, is_ancestor=False, verbose_mode=verbose_mode
     )
     print("SUCCESS: Source files generated!")
-    # check for "ancestor" model.json (model.json~)
-    ancestor_model = get_ancestor_model(model_file) if execute_merge else None
+    # ancestors are taken from the pristine store of the last generation,
+    # check for "ancestor" model.json (model.json~) only for projects without store
+    pristine_store = PristineStore(path_output_dir)
+    ancestor_model = get_ancestor_model(model_file) if execute_merge and not pristine_store.is_available() else None
     # generate ancestor files if this exists and merge will be performed
     if ancestor_model is not None:
         if verbose_mode:
@@ -137,9 +141,14 @@ def generate_application_module(  # pylint: disable=too-many-arguments, too-many
     )
     print("SUCCESS: Datatypes generated!")
 
+    if execute_merge:
+        pristine_store.write_ancestors(list_merge_relevant_files)
+    pristine_store.update(list_merge_relevant_files)
+
     # execute merge if list of user files are not empty
     if execute_merge and list_merge_relevant_files:
         _print_info("VAF GENERATE APP-MODULE: STEP 4", "Merging existing source files with results from step 1")
         # solve conflicts for user files
-        merge_after_regeneration(path_output_dir, list_merge_relevant_files, verbose_mode)
+        with profile_phase("merge"):
+            merge_after_regeneration(path_output_dir, list_merge_relevant_files, verbose_mode)
         _print_info("SUCCESS: MERGE EXECUTED!")
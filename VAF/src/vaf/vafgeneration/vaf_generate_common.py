@@ -1,9 +1,13 @@
 """Generator library for generating the complete VAF project"""
 
+import hashlib
+import json
 import shutil
 import subprocess
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 from vaf import vafmodel
 
@@ -11,10 +15,13 @@ from vaf import vafmodel
 from vaf.cli_core.common.utils import (
     concat_str_to_path,
 )
+from vaf.constants import VAF_PRISTINE_STORE_DIR
 
 # suffix for ancestor of model.json
 from vaf.vafpy.runtime import old_json_suffix
 
+from .merge import merge_three_way
+
 # suffix for old source file
 suffix_old_source = "~"
 ancestor_file_suffix = "~ancestor"
@@ -75,19 +82,17 @@ def __get_backup_file_path(real_file_rel_path: str | Path) -> str | Path:
     )
 
 
-def __merge_files(
-    newly_generated_file: Path,
-    patched_file_path: Path,
-    common_ancestor_file_path: Path,
-    verbose_mode: bool = False,
-) -> None:
-    """Function to perform three-way files merge through subprocess
+def __merge_with_git(
+    newly_generated_file: Path, patched_file_path: Path, common_ancestor_file_path: Path
+) -> Tuple[bytes | None, int, str]:
+    """Function to perform three-way files merge through git subprocess
     Documentation for git merge-file: https://git-scm.com/docs/git-merge-file
     Args:
         newly_generated_file: path to the newly generated file (ends w/ .new~)
         patched_file_path: path to the patched file (older generated file + patch)
         common_ancestor_file_path: path to the common ancestor of current & patched (older generated file)
-        verbose_mode (bool): Flag to enable verbose mode
+    Returns:
+        merge result (None if the merge failed), number of conflicts & error message
     """
     # build cmd to perform git merge-file:
     # merge newly generated file to current file (patched_file)
@@ -99,14 +104,57 @@ def __merge_files(
         str(common_ancestor_file_path),
         str(newly_generated_file),
     ]
-    # run the cmd
-    merge = subprocess.run(args, capture_output=True, text=True, check=False)
+    try:
+        merge = subprocess.run(args, capture_output=True, check=False)
+    except OSError as err:
+        return None, 0, str(err)
+    # git merge-file returns the number of conflicts or a negative value on errors
+    if 0 <= merge.returncode < 128:
+        return merge.stdout, merge.returncode, ""
+    return None, 0, merge.stderr.decode(errors="replace")
+
+
+def __merge_files(
+    newly_generated_file: Path,
+    patched_file_path: Path,
+    common_ancestor_file_path: Path,
+    verbose_mode: bool = False,
+) -> List[str]:
+    """Function to perform three-way files merge
+    The merge runs in-process and produces the same result as `git merge-file -p`,
+    git is only used as fallback if the in-process merge fails.
+    Args:
+        newly_generated_file: path to the newly generated file (ends w/ .new~)
+        patched_file_path: path to the patched file (older generated file + patch)
+        common_ancestor_file_path: path to the common ancestor of current & patched (older generated file)
+        verbose_mode (bool): Flag to enable verbose mode
+    Returns:
+        messages for the user
+    """
+    result: bytes | None
+    try:
+        result, conflicts = merge_three_way(
+            patched_file_path.read_bytes(),
+            common_ancestor_file_path.read_bytes(),
+            newly_generated_file.read_bytes(),
+            str(patched_file_path),
+            str(newly_generated_file),
+        )
+        error = ""
+    except Exception:  # pylint: disable=broad-exception-caught
+        result, conflicts, error = __merge_with_git(newly_generated_file, patched_file_path, common_ancestor_file_path)
+
+    # results with more than one conflict are not applied, like for the exit code of git merge-file
+    if result is None or conflicts > 1:
+        # Inform user if merge fails: Don't abort the whole workflow!
+        reason = error if result is None else f"{conflicts} conflicts"
+        return [f"Auto file mechanism for file {patched_file_path} failed! Reason: {reason}"]
 
     old_file_path = concat_str_to_path(patched_file_path, suffix_old_source)
 
     # check if merge results has conflicts
     msg_list = []
-    if merge.returncode == 0:
+    if conflicts == 0:
         msg_list += (
             [
                 "\nMERGE INFO",
@@ -116,7 +164,7 @@ def __merge_files(
             if verbose_mode
             else []
         )
-    elif merge.returncode == 1:
+    else:
         msg_list += [
             "\nMERGE WARNING:",
             f"    Merge of {newly_generated_file} with {patched_file_path} has conflicts!",
@@ -131,78 +179,93 @@ def __merge_files(
         else []
     )
 
-    if merge.returncode in (0, 1):
-        print("\n".join(msg_list))
-        # save merge results
-        with open(patched_file_path, "w", encoding="utf-8") as out_file:
-            out_file.write(merge.stdout)
-    else:
-        # Inform user if merge fails: Don't abort the whole workflow!
-        print(f"Auto file mechanism for file {patched_file_path} failed! Reason: {merge.stderr}")
+    # save merge results
+    patched_file_path.write_bytes(result)
+    return ["\n".join(msg_list)]
 
 
-def merge_after_regeneration(out_dir: Path, list_of_user_files_rel_path: List[str], verbose_mode: bool = False) -> None:
-    """Function to perform three-way files merge after regeneration of app_module
+def __merge_user_file(out_dir: Path, rel_path_to_file: str, verbose_mode: bool) -> List[str]:
+    """Function to perform three-way merge of one user file after regeneration
     Args:
         out_dir: Path to the output directory
-        list_of_user_files_rel_path: List of relative path from out_dir to user files (files that users can edit)
+        rel_path_to_file: relative path from out_dir to the user file
         verbose_mode (bool): Flag to enable verbose mode
+    Returns:
+        messages for the user
     """
-    for rel_path_to_file in list_of_user_files_rel_path:
-        newly_generated_file_path = out_dir / __get_newly_generated_file_path(rel_path_to_file)
-        ancestor_file_path = out_dir / __get_ancestor_file_rel_path(rel_path_to_file)
-        # merge needed if there is a copy of .new~ file is created
-        # merge can only be performed if ancestor exists
-        if newly_generated_file_path.is_file():
-            if ancestor_file_path.is_file():
-                # backup current file
-                current_file = out_dir / rel_path_to_file
-                backup_file = __get_backup_file_path(current_file)
-                # if current file has conflict, then check if backup is valid to be used
-                if __file_has_conflict(current_file):
-                    print(
-                        "\n".join(
-                            [
-                                "WARNING:",
-                                f"  The file {current_file} contains unresolved merge conflicts and will be ignored!",
-                                f"  Using the backup file {backup_file} for the merge instead.",
-                            ]
-                        )
+    messages: List[str] = []
+    newly_generated_file_path = out_dir / __get_newly_generated_file_path(rel_path_to_file)
+    ancestor_file_path = out_dir / __get_ancestor_file_rel_path(rel_path_to_file)
+    # merge needed if there is a copy of .new~ file is created
+    # merge can only be performed if ancestor exists
+    if newly_generated_file_path.is_file():
+        if ancestor_file_path.is_file():
+            # backup current file
+            current_file = out_dir / rel_path_to_file
+            backup_file = __get_backup_file_path(current_file)
+            # if current file has conflict, then check if backup is valid to be used
+            if __file_has_conflict(current_file):
+                messages.append(
+                    "\n".join(
+                        [
+                            "WARNING:",
+                            f"  The file {current_file} contains unresolved merge conflicts and will be ignored!",
+                            f"  Using the backup file {backup_file} for the merge instead.",
+                        ]
                     )
-                    assert isinstance(backup_file, Path)  # Are you satisfied now, mypy?
-                    if backup_file.is_file() and not __file_has_conflict(backup_file):
-                        shutil.copyfile(backup_file, current_file)
-                else:
-                    # current file has no conflict, overwrite backup
-                    shutil.copyfile(out_dir / rel_path_to_file, __get_backup_file_path(out_dir / rel_path_to_file))
-
-                # perform three way merge
-                __merge_files(
-                    newly_generated_file=newly_generated_file_path,
-                    patched_file_path=out_dir / rel_path_to_file,
-                    common_ancestor_file_path=ancestor_file_path,
-                    verbose_mode=verbose_mode,
                 )
+                assert isinstance(backup_file, Path)  # Are you satisfied now, mypy?
+                if backup_file.is_file() and not __file_has_conflict(backup_file):
+                    shutil.copyfile(backup_file, current_file)
             else:
-                # warning only if newly generated file exists,
-                msg_list = [
-                    "WARNING:",
-                    f"  Cannot merge {newly_generated_file_path} to {out_dir / rel_path_to_file} automatically!",
-                    "  Can't find old model.json~",
-                    (
-                        "  Please merge both files manually. The auto merge will be available "
-                        + "the next time the model is updated."
-                    ),
-                ]
-                print("\n".join(msg_list))
-
-            # remove newly generated file only if merge took place
-            # else no old model.json~ -> new file is identical with current, remove it
-            newly_generated_file_path.unlink()
-
-        # remove ancestor file regardless of the merge
-        if ancestor_file_path.is_file():
-            ancestor_file_path.unlink()
+                # current file has no conflict, overwrite backup
+                shutil.copyfile(out_dir / rel_path_to_file, __get_backup_file_path(out_dir / rel_path_to_file))
+
+            # perform three way merge
+            messages += __merge_files(
+                newly_generated_file=newly_generated_file_path,
+                patched_file_path=out_dir / rel_path_to_file,
+                common_ancestor_file_path=ancestor_file_path,
+                verbose_mode=verbose_mode,
+            )
+        else:
+            # warning only if newly generated file exists,
+            msg_list = [
+                "WARNING:",
+                f"  Cannot merge {newly_generated_file_path} to {out_dir / rel_path_to_file} automatically!",
+                "  Can't find the previously generated version or old model.json~",
+                (
+                    "  Please merge both files manually. The auto merge will be available "
+                    + "the next time the model is updated."
+                ),
+            ]
+            messages.append("\n".join(msg_list))
+
+        # remove newly generated file only if merge took place
+        # else no old model.json~ -> new file is identical with current, remove it
+        newly_generated_file_path.unlink()
+
+    # remove ancestor file regardless of the merge
+    if ancestor_file_path.is_file():
+        ancestor_file_path.unlink()
+
+    return messages
+
+
+def merge_after_regeneration(out_dir: Path, list_of_user_files_rel_path: List[str], verbose_mode: bool = False) -> None:
+    """Function to perform three-way files merge after regeneration of app_module
+    The files are merged in parallel, the messages are printed in the order of the files.
+    Args:
+        out_dir: Path to the output directory
+        list_of_user_files_rel_path: List of relative path from out_dir to user files (files that users can edit)
+        verbose_mode (bool): Flag to enable verbose mode
+    """
+    with ThreadPoolExecutor() as executor:
+        for messages in executor.map(
+            lambda rel_path: __merge_user_file(out_dir, rel_path, verbose_mode), list_of_user_files_rel_path
+        ):
+            for message in messages:
+                print(message)
 
 
 def get_ancestor_file_suffix(is_ancestor: bool) -> str:
@@ -225,3 +288,90 @@ def get_ancestor_model(input_file: str) -> vafmodel.MainModel | None:
     # check for "ancestor" model.json (model.json~)
     ancestor_json = concat_str_to_path(Path(input_file), old_json_suffix)
     return vafmodel.load_json(ancestor_json) if ancestor_json.is_file() else None
+
+
+class PristineStore:
+    """Store of the pristine generated versions of the merge relevant user files
+    The versions of the last generation are the common ancestors for the three-way merge of the next one,
+    so they don't need to be generated again from the old model.json~.
+    The versions are stored zlib compressed under their SHA-256 hash, the index maps the file paths to the hashes.
+    """
+
+    def __init__(self, project_dir: Path) -> None:
+        """
+        Args:
+            project_dir (Path): Path to the project root directory
+        """
+        self.project_dir = project_dir
+        self.store_dir = project_dir / VAF_PRISTINE_STORE_DIR
+        self.index_file = self.store_dir / "index.json"
+        self.index: Dict[str, str] = {}
+        if self.index_file.is_file():
+            try:
+                self.index = json.loads(self.index_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self.index = {}
+
+    def is_available(self) -> bool:
+        """Checks if the store contains the versions of a previous generation
+        Returns:
+            True if the store exists
+        """
+        return self.index_file.is_file()
+
+    def __get_object_path(self, file_hash: str) -> Path:
+        return self.store_dir / "objects" / file_hash
+
+    def get(self, rel_path: str | Path) -> bytes | None:
+        """Gets the stored version of a file
+        Args:
+            rel_path: relative path from the project dir to the file
+        Returns:
+            content of the stored version or None if not stored
+        """
+        file_hash = self.index.get(Path(rel_path).as_posix())
+        if file_hash is None:
+            return None
+        try:
+            return zlib.decompress(self.__get_object_path(file_hash).read_bytes())
+        except (OSError, zlib.error):
+            return None
+
+    def write_ancestors(self, list_of_user_files_rel_path: List[str]) -> None:
+        """Writes the stored versions as ancestors of the user files, for which a new version was generated
+        Args:
+            list_of_user_files_rel_path: List of relative path from project dir to user files
+        """
+        for rel_path in list_of_user_files_rel_path:
+            if (self.project_dir / (rel_path + new_file_suffix)).is_file():
+                content = self.get(rel_path)
+                if content is not None:
+                    (self.project_dir / (rel_path + ancestor_file_suffix)).write_bytes(content)
+
+    def update(self, list_of_user_files_rel_path: List[str]) -> None:
+        """Stores the pristine versions of the current generation and drops all other versions
+        Must be called before the merge, while the newly generated files (.new~) still exist.
+        Args:
+            list_of_user_files_rel_path: List of relative path from project dir to user files
+        """
+        index: Dict[str, str] = {}
+        (self.store_dir / "objects").mkdir(parents=True, exist_ok=True)
+        for rel_path in list_of_user_files_rel_path:
+            # newly generated file exists only if it differs from the current file
+            pristine_file = self.project_dir / (rel_path + new_file_suffix)
+            if not pristine_file.is_file():
+                pristine_file = self.project_dir / rel_path
+                if not pristine_file.is_file():
+                    continue
+            content = pristine_file.read_bytes()
+            file_hash = hashlib.sha256(content).hexdigest()
+            object_path = self.__get_object_path(file_hash)
+            if not object_path.is_file():
+                object_path.write_bytes(zlib.compress(content))
+            index[Path(rel_path).as_posix()] = file_hash
+
+        for object_path in (self.store_dir / "objects").iterdir():
+            if object_path.name not in index.values():
+                object_path.unlink()
+        self.index_file.write_text(json.dumps(index, indent=2, sort_keys=True), encoding="utf-8")
+        self.index = index
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List
 
 from vaf import vafmodel
+from vaf.cli_core.common.profiling import profile_phase
 from vaf.vafpy import import_model
 from vaf.vafpy.model_runtime import model_runtime
 
@@ -18,7 +19,7 @@ from .vaf_conan import generate as generate_conan_deps
 from .vaf_controller import generate as generate_controller
 
 # VAF generators
-from .vaf_generate_common import get_ancestor_model, merge_after_regeneration
+from .vaf_generate_common import PristineStore, get_ancestor_model, merge_after_regeneration
 from .vaf_interface import generate_module_interfaces as generate_interface
 from .vaf_protobuf_serdes import generate as generate_protobuf_serdes
 from .vaf_silkit import generate as generate_silkit
@@ -86,7 +87,8 @@ def generate_integration_project(
         raise ValueError("Üath to project directory cannot be None!")
 
     path_project_dir = Path(project_dir)
-    import_model(model_file)
+    with profile_phase("import model"):
+        import_model(model_file)
     main_model = model_runtime.main_model
 
     delete_folder_src_gen: Path = path_project_dir / "src-gen"
@@ -112,8 +114,10 @@ def generate_integration_project(
 
     generate_interface(main_model, path_project_dir, verbose_mode)
 
-    # Load "ancestor" model.json if available and 3-way-merge is enabled
-    ancestor_model = get_ancestor_model(model_file) if execute_merge else None
+    # Ancestors of the user files are taken from the pristine store of the last generation,
+    # only projects without store generate them from the "ancestor" model.json if 3-way-merge is enabled
+    pristine_store = PristineStore(path_project_dir)
+    ancestor_model = get_ancestor_model(model_file) if execute_merge and not pristine_store.is_available() else None
     # collect list of merge relevant files
     list_merge_relevant_files: List[str] = []
 
@@ -158,6 +162,11 @@ def generate_integration_project(
             verbose_mode=verbose_mode,
         )
 
+    if execute_merge:
+        pristine_store.write_ancestors(list_merge_relevant_files)
+    pristine_store.update(list_merge_relevant_files)
+
     if execute_merge and list_merge_relevant_files:
         # solve conflicts for user files
-        merge_after_regeneration(path_project_dir, list_merge_relevant_files, verbose_mode)
+        with profile_phase("merge"):
+            merge_after_regeneration(path_project_dir, list_merge_relevant_files, verbose_mode)
@@ -215,6 +215,7 @@ class DataElement(VafBaseModel):
     InitialValue: Optional[str] = None
     Min: Optional[float] = None
     Max: Optional[float] = None
+    SamplePoolSize: int = 0
     _validate_TypeRef = field_validator("TypeRef", mode="before")(validate_type_ref)
 
 
@@ -670,6 +671,9 @@ class Executable(VafBaseModel):
     ExecutorPeriod: str
     InternalCommunicationModules: list[PlatformModule] = []
     ApplicationModules: list[ExecutableApplicationModuleMapping]
+    BalanceTaskOffsets: bool = False
+    ExecutorThreads: int = 1
+    ExecutorStatistics: bool = False
 
 
 # all model element that have namespace & name
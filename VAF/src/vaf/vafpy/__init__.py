@@ -14,7 +14,13 @@ from .elements import (
     PlatformProviderModule,
 )
 from .executable import Executable
-from .runtime import import_model, save_main_model, save_part_of_main_model
+from .runtime import (
+    enable_incremental_validation,
+    get_validation_findings,
+    import_model,
+    save_main_model,
+    save_part_of_main_model,
+)
 from .task import Task
 
 __all__ = [
@@ -39,6 +45,8 @@ __all__ = [
     "save_main_model",
     "save_part_of_main_model",
     "import_model",
+    "enable_incremental_validation",
+    "get_validation_findings",
     # task
     "Task",
 ]
@@ -1,5 +1,9 @@
 """Module providing config as code for VAF projects."""
 
+import operator
+from collections.abc import Hashable
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
 from vaf import vafmodel
 
 # pylint: disable=too-few-public-methods
@@ -12,6 +16,62 @@ class ModelError(Exception):
         super().__init__(message)
 
 
+T = TypeVar("T")
+
+
+class ListIndex(Generic[T]):
+    """Hashed index of the items of a model list to replace linear searches
+    The index follows items appended to the list and is rebuilt if the list is replaced or shrinks.
+    Hits are verified against the list and the key. On a mismatch, or on a miss after items were replaced in place
+    or removed & appended, the index is rebuilt as well.
+    """
+
+    def __init__(self, key: Callable[[T], Hashable]) -> None:
+        """
+        Args:
+            key: function to get the key of an item
+        """
+        self.__key = key
+        self.__items: Optional[List[T]] = None
+        self.__indexed: List[T] = []
+        self.__index: Dict[Hashable, List[int]] = {}
+
+    def __rebuild(self, items: List[T]) -> None:
+        self.__items = items
+        self.__indexed = []
+        self.__index = {}
+
+    def __lookup(self, items: List[T], key: Hashable) -> Optional[List[T]]:
+        found: List[T] = []
+        for position in self.__index.get(key, []):
+            item = items[position]
+            if item is not self.__indexed[position] or self.__key(item) != key:
+                return None
+            found.append(item)
+        return found
+
+    def find(self, items: List[T], key: Hashable) -> List[T]:
+        """Method to find all items with the given key
+        Args:
+            items: indexed list
+            key: key to look for
+        Returns:
+            List of found items in order of the indexed list
+        """
+        for attempt in range(2):
+            if attempt > 0 or items is not self.__items or len(items) < len(self.__indexed):
+                self.__rebuild(items)
+            for position in range(len(self.__indexed), len(items)):
+                self.__index.setdefault(self.__key(items[position]), []).append(position)
+            self.__indexed.extend(items[len(self.__indexed) :])
+
+            found = self.__lookup(items, key)
+            # identity comparison of the whole list only on a miss, it is cheap but not constant
+            if found is not None and (len(found) > 0 or all(map(operator.is_, items, self.__indexed))):
+                return found
+        return []
+
+
 class BaseTypesWrapper:
     """Wrapper for std types"""
 
@@ -1,14 +1,15 @@
 """Abstraction layer for vafmodel.ModuleInterfaces in Config as Code"""
 
 from copy import deepcopy
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
+from pydantic import PrivateAttr
 from typing_extensions import Self
 
 from vaf import vafmodel
 from vaf.cli_core.common.utils import create_name_namespace_full_name
 
-from .core import ModelError
+from .core import ListIndex, ModelError
 from .datatypes import VafpyAbstractDatatypeTyperef, VafpyDataTypeRef
 from .factory import VafpyAbstractElement
 from .model_runtime import model_runtime
@@ -45,12 +46,14 @@ class ModuleInterface(vafmodel.ModuleInterface, VafpyAbstractElement):
     def __init__(self, name: str, namespace: str, operation_output_namespace: Optional[str] = None) -> None:
         self._build_instance(self, Name=name, Namespace=namespace, OperationOutputNamespace=operation_output_namespace)
 
-    def add_data_element(self, name: str, datatype: VafpyDataTypeRef) -> None:
+    def add_data_element(self, name: str, datatype: VafpyDataTypeRef, sample_pool_size: int = 0) -> None:
         """Add a data element to the module interface
 
         Args:
             name (str): Unique name for the data element
             datatype (VafpyDataTypeRef): VAF Datatype of the element
+            sample_pool_size (int): Number of preallocated samples in internal communication modules,
+            0 allocates every sample from the heap. Defaults to 0.
 
         Raises:
             ModelError: If a data element with the same name already exists.
@@ -63,6 +66,7 @@ class ModuleInterface(vafmodel.ModuleInterface, VafpyAbstractElement):
             vafmodel.DataElement(
                 Name=name,
                 TypeRef=datatype._get_type_ref(),
+                SamplePoolSize=sample_pool_size,
             )
         )
 
@@ -72,6 +76,7 @@ class ModuleInterface(vafmodel.ModuleInterface, VafpyAbstractElement):
         model_runtime.used_module_interfaces[create_name_namespace_full_name(self.Name, self.Namespace)].append(
             create_name_namespace_full_name(datatype.Name, datatype.Namespace)
         )
+        model_runtime.update_validation_state("ModuleInterfaces", self)
 
     def add_operation(
         self,
@@ -117,11 +122,19 @@ class ModuleInterface(vafmodel.ModuleInterface, VafpyAbstractElement):
                 VafpyAbstractDatatypeTyperef._check_typeref(datatype)
 
         self.Operations.append(vafmodel.Operation(Name=name, Parameters=function_parameters))
+        model_runtime.update_validation_state("ModuleInterfaces", self)
 
 
 class ApplicationModule(vafmodel.ApplicationModule, VafpyAbstractElement):
     """Represents a VAF application module"""
 
+    # indexes of the consumed & provided interfaces by instance name
+    _interface_index: Dict[str, ListIndex[Any]] = PrivateAttr(
+        default_factory=lambda: {
+            interface_type: ListIndex(lambda mi: mi.InstanceName) for interface_type in ["consumed", "provided"]
+        }
+    )
+
     # pylint: disable-next=too-many-positional-arguments,too-many-arguments
     def __init__(
         self,
@@ -157,8 +170,7 @@ class ApplicationModule(vafmodel.ApplicationModule, VafpyAbstractElement):
         """
         vafmodel_interfaces = getattr(self, f"{interface_type.capitalize()}Interfaces")
         assert isinstance(vafmodel_interfaces, List)
-        mi_names = [mi.InstanceName for mi in vafmodel_interfaces]
-        if instance_name in mi_names:
+        if self._find_interface(interface_type, instance_name):
             raise ModelError(
                 f"Duplicated {interface_type} interface {instance_name}for AppModule {self.Namespace}::{self.Name}."
             )
@@ -173,6 +185,23 @@ class ApplicationModule(vafmodel.ApplicationModule, VafpyAbstractElement):
             )
         )
         model_runtime.add_used_module_interfaces(interface)
+        model_runtime.update_validation_state("ApplicationModules", self)
+
+    def _find_interface(
+        self, interface_type: str, instance_name: str
+    ) -> List[vafmodel.ApplicationModuleConsumedInterface] | List[vafmodel.ApplicationModuleProvidedInterface]:
+        """Find the consumed/provided interfaces with an instance name
+
+        Args:
+            interface_type (str): consumed/provided
+            instance_name (str): Name of the interface instance
+
+        Returns:
+            List of found interfaces
+        """
+        return self._interface_index[interface_type].find(
+            getattr(self, f"{interface_type.capitalize()}Interfaces"), instance_name
+        )
 
     def add_consumed_interface(self, instance_name: str, interface: ModuleInterface, is_optional: bool = False) -> None:
         """Add a consumed interface to the AppModule
@@ -219,6 +248,7 @@ class ApplicationModule(vafmodel.ApplicationModule, VafpyAbstractElement):
             raise ModelError(f"Duplicated task {task_ref.Name} for AppModule {self.Namespace}::{self.Name}.")
 
         self.Tasks.append(task_ref)
+        model_runtime.update_validation_state("ApplicationModules", self)
 
     def add_task_chain(
         self,
@@ -261,6 +291,8 @@ class ApplicationModule(vafmodel.ApplicationModule, VafpyAbstractElement):
             last_name = task_ref.Name
             task_names.append(task_ref.Name)
 
+        model_runtime.update_validation_state("ApplicationModules", self)
+
 
 # pylint: disable = too-many-ancestors
 class PlatformConsumerModule(vafmodel.PlatformModule, VafpyAbstractElement):
@@ -4,10 +4,14 @@
 # marked with # pylint-bug (29.01.25, lwiesner)
 
 from datetime import timedelta
+from typing import Dict
+
+from pydantic import PrivateAttr
 
 from vaf import vafmodel
+from vaf.cli_core.common.utils import create_name_namespace_full_name
 
-from .core import ModelError
+from .core import ListIndex, ModelError
 from .elements import ApplicationModule
 from .model_runtime import model_runtime
 
@@ -15,17 +19,46 @@ from .model_runtime import model_runtime
 class Executable(vafmodel.Executable):
     """Represents a VAF executable"""
 
-    def __init__(self, name: str, executor_period: timedelta | None = None) -> None:
+    # index of the application module mappings by application module identifier
+    _app_module_index: ListIndex[vafmodel.ExecutableApplicationModuleMapping] = PrivateAttr(
+        default_factory=lambda: ListIndex(
+            lambda am: create_name_namespace_full_name(am.ApplicationModuleRef.Name, am.ApplicationModuleRef.Namespace)
+        )
+    )
+    # indexes of the interface instance mappings by instance name per application module identifier
+    _instance_index: Dict[str, ListIndex[vafmodel.InterfaceInstanceToModuleMapping]] = PrivateAttr(default_factory=dict)
+
+    def __init__(
+        self,
+        name: str,
+        executor_period: timedelta | None = None,
+        balance_task_offsets: bool = False,
+        executor_threads: int = 1,
+        executor_statistics: bool = False,
+    ) -> None:
         """Initialize an Executable with an optional executor_period
 
         Args:
             name (str): Executable name
             executor_period (datetime.timedelta, optional): Executor period. Defaults to an ideal value calculated using
             the tasks of all AppModules.
+            balance_task_offsets (bool, optional): Let the generator choose the offsets of tasks mapped without offset
+            and preferred offset, so that the budgets per executor tick are balanced. Defaults to False.
+            executor_threads (int, optional): Number of threads executing the tasks of an executor tick. Tasks of the
+            same module and of modules depending on each other keep their order. Defaults to 1.
+            executor_statistics (bool, optional): Measure the execution times of the tasks and the timing of the
+            executor ticks, see vaf::GetExecutor(). Defaults to False.
         """
         period_str = f"{int(executor_period.total_seconds() * 1000)}ms" if executor_period else "Default"
 
-        super().__init__(Name=name, ExecutorPeriod=period_str, ApplicationModules=[])
+        super().__init__(
+            Name=name,
+            ExecutorPeriod=period_str,
+            ApplicationModules=[],
+            BalanceTaskOffsets=balance_task_offsets,
+            ExecutorThreads=executor_threads,
+            ExecutorStatistics=executor_statistics,
+        )
 
         model_runtime.main_model.Executables.append(self)
 
@@ -39,37 +72,93 @@ class Executable(vafmodel.Executable):
     def add_application_module(
         self,
         module: ApplicationModule,
-        task_mapping_info: list[tuple[str, timedelta, int]],
+        task_mapping_info: list[tuple[str, timedelta, int | None]],
     ) -> None:
         """Add an application module to the executable
 
         Args:
             module (vafpy.ApplicationModule): Application module instance to add
-            task_mapping_info (list[tuple[str, timedelta, int]]): Mapping info for tasks a list of tuples with
-            (task_name, budget, offset)
+            task_mapping_info (list[tuple[str, timedelta, int | None]]): Mapping info for tasks a list of tuples with
+            (task_name, budget, offset). An offset of None uses the preferred offset of the task or, with
+            balance_task_offsets, a generated one.
+        """
+        self.add_application_modules([(module, task_mapping_info)])
+
+    def __find_app_module_mapping(self, module: ApplicationModule) -> vafmodel.ExecutableApplicationModuleMapping:
+        """Find the mapping of an application module in this executable
+
+        Args:
+            module (vafpy.ApplicationModule): The application module
+
+        Raises:
+            ModelError: If the module is not mapped exactly once to the executable
+
+        Returns:
+            vafmodel.ExecutableApplicationModuleMapping: The found mapping
         """
-        task_mappings: list[vafmodel.ExecutableTaskMapping] = []
-        for r in task_mapping_info:
-            budget_str = f"{int(r[1].total_seconds() * 1000)}ms"
-            task_mappings.append(vafmodel.ExecutableTaskMapping(TaskName=r[0], Offset=r[2], Budget=budget_str))
-        self.ApplicationModules.append(
+        found_am = self._app_module_index.find(
+            self.ApplicationModules, create_name_namespace_full_name(module.Name, module.Namespace)
+        )
+        if len(found_am) != 1:
+            raise ModelError("Could not find application module " + module.Name + " mapped on executable")
+        return found_am[0]
+
+    def __find_instance_mappings(
+        self, app_module_mapping: vafmodel.ExecutableApplicationModuleMapping, instance_name: str
+    ) -> list[vafmodel.InterfaceInstanceToModuleMapping]:
+        """Find the interface instance mappings of an application module in this executable
+
+        Args:
+            app_module_mapping (vafmodel.ExecutableApplicationModuleMapping): The application module mapping
+            instance_name (str): The interface instance name
+
+        Returns:
+            list[vafmodel.InterfaceInstanceToModuleMapping]: The found mappings
+        """
+        app_module_id = create_name_namespace_full_name(
+            app_module_mapping.ApplicationModuleRef.Name, app_module_mapping.ApplicationModuleRef.Namespace
+        )
+        if app_module_id not in self._instance_index:
+            self._instance_index[app_module_id] = ListIndex(lambda mapping: mapping.InstanceName)
+        return self._instance_index[app_module_id].find(
+            app_module_mapping.InterfaceInstanceToModuleMappings, instance_name
+        )
+
+    def add_application_modules(
+        self, modules: list[tuple[ApplicationModule, list[tuple[str, timedelta, int | None]]]]
+    ) -> None:
+        """Add multiple application modules to the executable
+
+        Args:
+            modules (list[tuple[vafpy.ApplicationModule, list[tuple[str, timedelta, int | None]]]]): List of tuples with
+            (application module instance, task mapping info), see add_application_module
+        """
+        self.ApplicationModules.extend(
             vafmodel.ExecutableApplicationModuleMapping(
                 ApplicationModuleRef=module,
                 InterfaceInstanceToModuleMappings=[],
-                TaskMapping=task_mappings,
+                TaskMapping=[
+                    vafmodel.ExecutableTaskMapping(
+                        TaskName=r[0], Offset=r[2], Budget=f"{int(r[1].total_seconds() * 1000)}ms"
+                    )
+                    for r in task_mapping_info
+                ],
             )
+            for module, task_mapping_info in modules
         )
 
-    # FIXME(virmlj) refactor
-    # pylint: disable-next=too-many-locals, too-many-branches
-    def connect_interfaces(
+    def __check_connection(
         self,
         module_a: ApplicationModule,
         instance_name_a: str,
         module_b: ApplicationModule,
         instance_name_b: str,
-    ) -> None:
-        """Connects two interfaces of two application modules in this executable
+    ) -> tuple[
+        vafmodel.ModuleInterface,
+        vafmodel.ExecutableApplicationModuleMapping,
+        vafmodel.ExecutableApplicationModuleMapping,
+    ]:
+        """Checks a connection of two interfaces of two application modules in this executable
 
         Args:
             module_a (vafpy.ApplicationModule): The provider application module
@@ -81,9 +170,14 @@ class Executable(vafmodel.Executable):
             ModelError: If any of the modules are not mapped to the executable,
                         if any of the instances names is not found
                         or if the interfaces are not compatible
+
+        Returns:
+            tuple[vafmodel.ModuleInterface, vafmodel.ExecutableApplicationModuleMapping,
+            vafmodel.ExecutableApplicationModuleMapping]: The connected module interface and the mappings of the
+            provider and the consumer module
         """
-        found_pi = [pi for pi in module_a.ProvidedInterfaces if pi.InstanceName == instance_name_a]
-        found_ci = [ci for ci in module_b.ConsumedInterfaces if ci.InstanceName == instance_name_b]
+        found_pi = module_a._find_interface("provided", instance_name_a)  # pylint: disable=protected-access
+        found_ci = module_b._find_interface("consumed", instance_name_b)  # pylint: disable=protected-access
 
         if len(found_pi) != 1:
             raise ModelError(
@@ -101,7 +195,11 @@ class Executable(vafmodel.Executable):
                 + module_b.Name
             )
 
-        if found_pi[0].ModuleInterfaceRef != found_ci[0].ModuleInterfaceRef:
+        # identity check first to skip the field-wise comparison of the module interfaces
+        if (
+            found_pi[0].ModuleInterfaceRef is not found_ci[0].ModuleInterfaceRef
+            and found_pi[0].ModuleInterfaceRef != found_ci[0].ModuleInterfaceRef
+        ):
             raise ModelError(
                 "Interfaces do not match: "
                 + found_pi[0].ModuleInterfaceRef.Namespace
@@ -113,46 +211,134 @@ class Executable(vafmodel.Executable):
                 + found_ci[0].ModuleInterfaceRef.Name
             )
 
-        found_am_a = [
-            a
-            for a in self.ApplicationModules
-            if a.ApplicationModuleRef.Name == module_a.Name and a.ApplicationModuleRef.Namespace == module_a.Namespace
-        ]
-        found_am_b = [
-            a
-            for a in self.ApplicationModules
-            if a.ApplicationModuleRef.Name == module_b.Name and a.ApplicationModuleRef.Namespace == module_b.Namespace
+        return (
+            found_pi[0].ModuleInterfaceRef,
+            self.__find_app_module_mapping(module_a),
+            self.__find_app_module_mapping(module_b),
+        )
+
+    def __check_connections(
+        self, connections: list[tuple[ApplicationModule, str, ApplicationModule, str]]
+    ) -> list[
+        tuple[
+            vafmodel.ModuleInterface,
+            vafmodel.ExecutableApplicationModuleMapping,
+            vafmodel.ExecutableApplicationModuleMapping,
         ]
+    ]:
+        """Checks all connections of a connection table, see __check_connection
 
-        if len(found_am_a) != 1:
-            raise ModelError("Could not find application module " + module_a.Name + " mapped on executable")
+        Args:
+            connections (list[tuple[vafpy.ApplicationModule, str, vafpy.ApplicationModule, str]]): Connection table
+            with tuples of (provider module, provided instance name, consumer module, consumed instance name)
 
-        if len(found_am_b) != 1:
-            raise ModelError("Could not find application module " + module_b.Name + " mapped on executable")
+        Raises:
+            ModelError: With the errors of all invalid connections
 
-        already_mapped_on_provider = False
-        for instance in found_am_a[0].InterfaceInstanceToModuleMappings:
-            if instance.InstanceName == instance_name_a:
-                already_mapped_on_provider = True
-                sm = instance.ModuleRef
+        Returns:
+            list[tuple[vafmodel.ModuleInterface, vafmodel.ExecutableApplicationModuleMapping,
+            vafmodel.ExecutableApplicationModuleMapping]]: The results of __check_connection in order of the table
+        """
+        errors: list[str] = []
+        checked_connections: list[
+            tuple[
+                vafmodel.ModuleInterface,
+                vafmodel.ExecutableApplicationModuleMapping,
+                vafmodel.ExecutableApplicationModuleMapping,
+            ]
+        ] = []
+        for connection in connections:
+            try:
+                checked_connections.append(self.__check_connection(*connection))
+            except ModelError as err:
+                errors.append(str(err))
+        if errors:
+            raise ModelError("\n".join(errors))
+        return checked_connections
 
-        if not already_mapped_on_provider:
-            sm = vafmodel.PlatformModule(
-                Name=found_pi[0].ModuleInterfaceRef.Name + "Module",
-                Namespace="application_communication",
-                ModuleInterfaceRef=found_pi[0].ModuleInterfaceRef,
+    def connect_interfaces(
+        self,
+        module_a: ApplicationModule,
+        instance_name_a: str,
+        module_b: ApplicationModule,
+        instance_name_b: str,
+    ) -> None:
+        """Connects two interfaces of two application modules in this executable
+
+        Args:
+            module_a (vafpy.ApplicationModule): The provider application module
+            instance_name_a (str): The instance name of the provided interface
+            module_b (vafpy.ApplicationModule): The consumer application module
+            instance_name_b (str): The instance name of the consumed interface
+
+        Raises:
+            ModelError: If any of the modules are not mapped to the executable,
+                        if any of the instances names is not found
+                        or if the interfaces are not compatible
+        """
+        self.connect_many([(module_a, instance_name_a, module_b, instance_name_b)])
+
+    def connect_many(self, connections: list[tuple[ApplicationModule, str, ApplicationModule, str]]) -> None:
+        """Connects multiple pairs of interfaces of application modules in this executable
+           All connections are checked before the model is changed, so the model stays untouched on errors.
+           Consumers of the same provided interface instance share one internal communication module.
+
+        Args:
+            connections (list[tuple[vafpy.ApplicationModule, str, vafpy.ApplicationModule, str]]): Connection table
+            with tuples of (provider module, provided instance name, consumer module, consumed instance name)
+
+        Raises:
+            ModelError: If any of the modules are not mapped to the executable,
+                        if any of the instances names is not found
+                        or if the interfaces are not compatible
+        """
+        checked_connections = self.__check_connections(connections)
+
+        for (_, instance_name_a, _, instance_name_b), (module_interface, found_am_a, found_am_b) in zip(
+            connections, checked_connections
+        ):
+            found_instances = self.__find_instance_mappings(found_am_a, instance_name_a)
+            if found_instances:
+                sm = found_instances[-1].ModuleRef
+            else:
+                # module & mappings are built from checked model elements, so no further model validation is needed
+                sm = vafmodel.PlatformModule.model_construct(
+                    Name=module_interface.Name + "Module",
+                    Namespace="application_communication",
+                    ModuleInterfaceRef=module_interface,
+                )
+                self.InternalCommunicationModules.append(sm)
+                found_am_a.InterfaceInstanceToModuleMappings.append(
+                    vafmodel.InterfaceInstanceToModuleMapping.model_construct(
+                        InstanceName=instance_name_a, ModuleRef=sm
+                    )
+                )
+            found_am_b.InterfaceInstanceToModuleMappings.append(
+                vafmodel.InterfaceInstanceToModuleMapping.model_construct(InstanceName=instance_name_b, ModuleRef=sm)
             )
-            self.InternalCommunicationModules.append(sm)
 
-        mapping_a = vafmodel.InterfaceInstanceToModuleMapping(InstanceName=instance_name_a, ModuleRef=sm)
-        mapping_b = vafmodel.InterfaceInstanceToModuleMapping(InstanceName=instance_name_b, ModuleRef=sm)
+        self.__add_connected_interfaces(connections)
 
-        if not already_mapped_on_provider:
-            found_am_a[0].InterfaceInstanceToModuleMappings.append(mapping_a)
-        found_am_b[0].InterfaceInstanceToModuleMappings.append(mapping_b)
+    @staticmethod
+    def __add_connected_interfaces(connections: list[tuple[ApplicationModule, str, ApplicationModule, str]]) -> None:
+        """Adds the interfaces of a connection table to the connected interfaces of the model runtime
 
-        model_runtime.connected_interfaces[f"{module_a.Namespace}::{module_a.Name}"].append(found_pi[0].InstanceName)
-        model_runtime.connected_interfaces[f"{module_b.Namespace}::{module_b.Name}"].append(found_ci[0].InstanceName)
+        Args:
+            connections (list[tuple[vafpy.ApplicationModule, str, vafpy.ApplicationModule, str]]): Connection table
+            with tuples of (provider module, provided instance name, consumer module, consumed instance name)
+        """
+        connected_interfaces: Dict[str, list[str]] = {}
+        connected_modules: Dict[str, ApplicationModule] = {}
+        for module_a, instance_name_a, module_b, instance_name_b in connections:
+            for module, instance_name in [(module_a, instance_name_a), (module_b, instance_name_b)]:
+                module_str = f"{module.Namespace}::{module.Name}"
+                connected_interfaces.setdefault(module_str, []).append(instance_name)
+                connected_modules[module_str] = module
+
+        # the validation state is updated once per module
+        for module_str, instance_names in connected_interfaces.items():
+            model_runtime.connected_interfaces[module_str].extend(instance_names)
+            model_runtime.update_validation_state("ApplicationModules", connected_modules[module_str])
 
     def __connect_interface_to_silkit(  # pylint: disable=too-many-arguments, too-many-positional-arguments
         self,
@@ -179,22 +365,12 @@ class Executable(vafmodel.Executable):
                         or if the interfaces do not match
         """
         # found the corresponding app module
-        found_am = [
-            a
-            for a in self.ApplicationModules
-            if a.ApplicationModuleRef.Name == app_module.Name
-            and a.ApplicationModuleRef.Namespace == app_module.Namespace
-        ]
-
-        if len(found_am) != 1:
-            raise ModelError("Could not find application module " + app_module.Name + " mapped on executable")
+        found_am = self.__find_app_module_mapping(app_module)
 
         # get interface type: "Consumed"/"Provided" from Platform<type>rModule
         assert interface_type in ("Consumed", "Provided")
         #  check if interfaces are the same
-        found_interface = [
-            pi for pi in getattr(app_module, f"{interface_type}Interfaces") if pi.InstanceName == instance_name
-        ]
+        found_interface = app_module._find_interface(interface_type.lower(), instance_name)  # pylint: disable=protected-access
         if len(found_interface) != 1:
             raise ModelError(f"No {interface_type}Interface with instance {instance_name} in Module {app_module.Name}")
 
@@ -207,10 +383,17 @@ class Executable(vafmodel.Executable):
         # check the found consumer/provider modules
         found_module = [
             interface_module
-            for interface_module in getattr(model_runtime.main_model, f"Platform{interface_type}Modules")
-            if interface_module.ModuleInterfaceRef == found_interface[0].ModuleInterfaceRef
-            and isinstance(interface_module.ConnectionPointRef, vafmodel.SILKITConnectionPoint)
-            and interface_module.ConnectionPointRef.ServiceInterfaceName == silkit_address_instance_name
+            for interface_module in model_runtime.silkit_module_index[f"Platform{interface_type}Modules"].find(
+                getattr(model_runtime.main_model, f"Platform{interface_type}Modules"),
+                (
+                    create_name_namespace_full_name(
+                        found_interface[0].ModuleInterfaceRef.Name, found_interface[0].ModuleInterfaceRef.Namespace
+                    ),
+                    silkit_address_instance_name,
+                ),
+            )
+            if interface_module.ModuleInterfaceRef is found_interface[0].ModuleInterfaceRef
+            or interface_module.ModuleInterfaceRef == found_interface[0].ModuleInterfaceRef
         ]
 
         if len(found_module) > 1:
@@ -250,8 +433,9 @@ class Executable(vafmodel.Executable):
 
         # add the mapping
         mapping = vafmodel.InterfaceInstanceToModuleMapping(InstanceName=instance_name, ModuleRef=module)
-        found_am[0].InterfaceInstanceToModuleMappings.append(mapping)
+        found_am.InterfaceInstanceToModuleMappings.append(mapping)
         model_runtime.connected_interfaces[f"{app_module.Namespace}::{app_module.Name}"].append(instance_name)
+        model_runtime.update_validation_state("ApplicationModules", app_module)
 
     def connect_consumed_interface_to_silkit(
         self,
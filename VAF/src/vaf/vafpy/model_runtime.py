@@ -1,12 +1,27 @@
 """Runtime for building a complete model with config as code"""
 
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from vaf import vafmodel
 from vaf.cli_core.common.utils import create_name_namespace_full_name
 
-from .core import ModelError, VafpyAbstractBase
+from .core import ListIndex, ModelError, VafpyAbstractBase
+
+
+def get_silkit_module_key(module: vafmodel.PlatformModule) -> Optional[Tuple[str, str]]:
+    """Function to get the lookup key of a SIL Kit platform module
+    Args:
+        module: platform module
+    Returns:
+        Tuple of module interface identifier and SIL Kit service interface name or None for non SIL Kit modules
+    """
+    if isinstance(module.ConnectionPointRef, vafmodel.SILKITConnectionPoint):
+        return (
+            create_name_namespace_full_name(module.ModuleInterfaceRef.Name, module.ModuleInterfaceRef.Namespace),
+            module.ConnectionPointRef.ServiceInterfaceName,
+        )
+    return None
 
 
 class ModelRuntime:
@@ -24,6 +39,17 @@ class ModelRuntime:
     # CaC and some generations are namespace-based: One can access the model
     # by calling <vafpy_element>.vafmodel
     element_by_namespace: Dict[str, Dict[str, Dict[str, VafpyAbstractBase]]] = {}
+    # per-element validation state for incremental validation:
+    # id of the element -> (element, errors & warnings of each cacheable validation rule by rule name)
+    # the element is stored to keep its id unique as long as it's recorded
+    validation_state: Dict[int, Tuple[Any, Dict[str, Tuple[List[str], List[str]]]]] = {}
+    # index of platform consumer/provider modules of the main model by their SIL Kit connection
+    silkit_module_index: Dict[str, ListIndex[vafmodel.PlatformModule]] = {
+        element_type: ListIndex(get_silkit_module_key)
+        for element_type in ["PlatformConsumerModules", "PlatformProviderModules"]
+    }
+    # function that checks a single element by its element type, only set if incremental validation is enabled
+    element_checker: Optional[Callable[[str, Any], Dict[str, Tuple[List[str], List[str]]]]] = None
 
     def __init__(self) -> None:
         self.main_model = vafmodel.MainModel()
@@ -35,6 +61,7 @@ class ModelRuntime:
         self.internal_interfaces.clear()
         self.connected_interfaces.clear()
         self.element_by_namespace.clear()
+        self.validation_state.clear()
 
     @staticmethod
     def __get_element_type(vaf_model_obj: VafpyAbstractBase) -> str:
@@ -72,7 +99,8 @@ class ModelRuntime:
             name, namespace, element_type = self.__get_element_data(element)
 
             # add to main model if not yet recorded
-            if self.element_by_namespace.get(namespace, {}).get(element_type, {}).get(name, None) is None:
+            recorded = self.element_by_namespace.get(namespace, {}).get(element_type, {}).get(name, None) is not None
+            if not recorded:
                 getattr(
                     self.main_model.DataTypeDefinitions if element_type in vafmodel.data_types else self.main_model,
                     element_type,
@@ -113,6 +141,9 @@ class ModelRuntime:
                         [mi.ModuleInterfaceRef for mi in element.ConsumedInterfaces + element.ProvidedInterfaces]
                     )
 
+            if not recorded:
+                self.update_validation_state(element_type, element)
+
     def remove_element(self, element: VafpyAbstractBase) -> None:
         """Remove an element from the model
         Args:
@@ -129,6 +160,7 @@ class ModelRuntime:
                     self.main_model.DataTypeDefinitions if element_type in vafmodel.data_types else self.main_model,
                     element_type,
                 ).remove(self.element_by_namespace[namespace][element_type][name])
+                self.validation_state.pop(id(self.element_by_namespace[namespace][element_type][name]), None)
                 # remove element from internal lookup
                 del self.element_by_namespace[namespace][element_type][name]
 
@@ -158,7 +190,9 @@ class ModelRuntime:
             # replace element from model by namespace
             name, namespace, element_type = self.__get_element_data(element)
             if name in self.element_by_namespace[namespace][element_type]:
+                self.validation_state.pop(id(self.element_by_namespace[namespace][element_type][name]), None)
                 self.element_by_namespace[namespace][element_type][name] = element
+                self.update_validation_state(element_type, element)
                 # replace in main model
                 element_list = getattr(
                     self.main_model.DataTypeDefinitions if element_type in vafmodel.data_types else self.main_model,
@@ -169,6 +203,16 @@ class ModelRuntime:
                         element_list[idx] = element
                         break
 
+    def update_validation_state(self, element_type: str, element: Any) -> None:
+        """Updates the validation state of an element if incremental validation is enabled
+        Must be called whenever an element is changed via vafpy
+        Args:
+            element_type: type of the element in plural (e.g. ApplicationModules)
+            element: element whose validation state is to be updated
+        """
+        if self.element_checker is not None:
+            self.validation_state[id(element)] = (element, self.element_checker(element_type, element))
+
     def add_used_module_interfaces(
         self, module_interfaces: List[vafmodel.ModuleInterface] | vafmodel.ModuleInterface
     ) -> None:
@@ -19,7 +19,7 @@ from .elements import (
     PlatformProviderModule,
 )
 from .model_runtime import ModelRuntime, model_runtime
-from .validator import Validator
+from .validator import ElementChecker, Validator, traversal_order
 
 # List of data types for cleanups
 ## Special: Structs & Maps
@@ -374,6 +374,39 @@ def save_part_of_main_model(path: Path, keys: list[str], project_type: ProjectTy
     __save_model_artifacts(path, project_type, keys=keys, cleanup=cleanup)
 
 
+def enable_incremental_validation(enabled: bool = True) -> None:
+    """Enables incremental validation of the model
+    Elements are validated while they are built via vafpy, so saving the model only finalises the validation.
+
+    Args:
+        enabled (bool): Flag to enable or disable the incremental validation
+    """
+    model_runtime.validation_state.clear()
+    model_runtime.element_checker = ElementChecker(model_runtime) if enabled else None
+    # validate the elements that are already part of the model
+    for element_kind in traversal_order:
+        for element in getattr(model_runtime.main_model, element_kind):
+            model_runtime.update_validation_state(element_kind, element)
+
+
+def get_validation_findings() -> Dict[str, Tuple[List[str], List[str]]]:
+    """Gets the current errors & warnings of all incrementally validated elements
+
+    Returns:
+        Dict[str, Tuple[List[str], List[str]]]: errors & warnings by element identifier
+    """
+    findings: Dict[str, Tuple[List[str], List[str]]] = {}
+    for element, rule_findings in model_runtime.validation_state.values():
+        element_errors = [error for errors, _ in rule_findings.values() for error in errors]
+        element_warnings = [warning for _, warnings in rule_findings.values() for warning in warnings]
+        if element_errors or element_warnings:
+            findings[create_name_namespace_full_name(element.Name, element.Namespace)] = (
+                element_errors,
+                element_warnings,
+            )
+    return findings
+
+
 def __create_vafpy_from_imported_vafmodel(data: vafmodel.ModelElement, element_type: str) -> None:
     # construct vafpy object from vafmodel
     # vafpy.<Element>.(vafmodel.ModelElement)
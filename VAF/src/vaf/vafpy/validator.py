@@ -3,15 +3,23 @@
 import math
 import warnings
 from collections.abc import Hashable
-from typing import Callable, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Set, Tuple
 
 from vaf.cli_core.common.utils import ProjectType as PType
 from vaf.cli_core.common.utils import create_name_namespace_full_name
-from vaf.vafmodel import ApplicationModule, Executable
+from vaf.vafmodel import ApplicationModule, Executable, ModuleInterface
 
 from .core import ModelError
 from .model_runtime import ModelRuntime
 
+# Element kinds visited by the validator in this order
+# Executables come first since they decide which ApplicationModules remain in the model
+traversal_order: List[str] = ["Executables", "ApplicationModules", "ModuleInterfaces"]
+
+# errors & warnings
+Findings = Tuple[List[str], List[str]]
+
 
 def make_list_unique(list_input: List[Hashable] | List[str]) -> List[Hashable] | List[str]:
     """Method to make list unique
@@ -44,6 +52,52 @@ def format_warning(
     return "\n" + str(filename) + ":" + str(lineno) + ": " + category.__name__ + ":\n" + str(message) + "\n"
 
 
+class ValidationRule:
+    """Base class for validation rules
+    A rule registers visitors on element kinds (see traversal_order), gets fed by a single model traversal
+    and reports its errors & warnings in finalize().
+    """
+
+    # project types this rule is executed for
+    project_types: Tuple[PType, ...] = ()
+    # True if the findings of the visitors only depend on the visited element,
+    # so they can be kept in the per-element validation state of incremental validation
+    cacheable: bool = True
+
+    def __init__(self, runtime_model: ModelRuntime) -> None:
+        self.runtime_model = runtime_model
+        self.list_errors: List[str] = []
+        self.list_warnings: List[str] = []
+
+    def visitors(self) -> Dict[str, Callable[[Any], Findings]]:
+        """Method to get the visitors of this rule
+        Returns:
+            Dictionary of element kind to visitor function returning the element's errors & warnings
+        """
+        return {}
+
+    def collect(self, findings: Findings) -> None:
+        """Method to collect the findings of a visited element
+        Args:
+            findings: errors & warnings of the element
+        """
+        self.list_errors += findings[0]
+        self.list_warnings += findings[1]
+
+    def leave(self, element_kind: str) -> None:
+        """Hook called after all elements of a kind were visited
+        Args:
+            element_kind: kind of the elements that were visited
+        """
+
+    def finalize(self) -> Findings:
+        """Method to get the result of this rule
+        Returns:
+            List of errors & warnings
+        """
+        return self.list_errors, self.list_warnings
+
+
 class Validator:
     # pylint: disable=too-few-public-methods
     """Handling Config Validation"""
@@ -53,15 +107,78 @@ class Validator:
         "warning": "Possible {DTD_N} duplicates for {WHAT} Name = {DTD_NAME} with different namespaces {DATA}",
     }
 
-    def __init__(self, project_type: PType) -> None:
-        # List that defines which validation methods will be executed for which project-type
-        self.__executor_manager: List[Tuple[List[PType], Callable[[ModelRuntime], Tuple[List[str], List[str]]]]] = [
-            ([PType.INTEGRATION], self.__validate_executables),
-            ([PType.INTEGRATION], self.__validate_interface_connections),
-            ([PType.INTEGRATION, PType.APP_MODULE], self.__validate_application_module),
-            ([PType.INTEGRATION, PType.APP_MODULE, PType.INTERFACE], self.__validate_interface_definition),
-        ]
+    # List that defines which validation rules will be executed, in order of their reports
+    rules: List[type[ValidationRule]] = []
+
+    def __init__(self, project_type: PType, max_workers: int = 1) -> None:
+        """
+        Args:
+            project_type: type of the project to be validated
+            max_workers: number of threads used to finalize independent rules
+        """
         self.project_type = project_type
+        self.max_workers = max_workers
+
+    @classmethod
+    def register_rule(cls, rule: type[ValidationRule]) -> type[ValidationRule]:
+        """Method to register a validation rule, can be used as class decorator
+        Args:
+            rule: ValidationRule class to be registered
+        Returns:
+            The registered rule
+        """
+        if rule not in cls.rules:
+            cls.rules.append(rule)
+        return rule
+
+    @staticmethod
+    def __traverse(runtime_model: ModelRuntime, active_rules: List[ValidationRule]) -> None:
+        """Method to feed all rules by a single traversal of the model
+        Findings of cacheable rules are taken from the validation state if incremental validation is enabled
+        Args:
+            runtime_model: ModelRuntime to be traversed
+            active_rules: rules to be fed
+        """
+        # collect visitors of all rules per element kind
+        visitors_by_kind: Dict[str, List[Tuple[ValidationRule, Callable[[Any], Findings]]]] = {
+            kind: [] for kind in traversal_order
+        }
+        for rule in active_rules:
+            for element_kind, visitor in rule.visitors().items():
+                visitors_by_kind[element_kind].append((rule, visitor))
+
+        for element_kind in traversal_order:
+            if visitors_by_kind[element_kind]:
+                for element in getattr(runtime_model.main_model, element_kind):
+                    element_state = runtime_model.validation_state.get(id(element), (None, {}))[1]
+                    for rule, visitor in visitors_by_kind[element_kind]:
+                        rule_name = type(rule).__name__
+                        if rule.cacheable and rule_name in element_state:
+                            rule.collect(element_state[rule_name])
+                        else:
+                            rule.collect(visitor(element))
+            for rule in active_rules:
+                rule.leave(element_kind)
+
+    def __finalize(self, active_rules: List[ValidationRule]) -> Findings:
+        """Method to finalize all rules, in parallel if configured
+        Args:
+            active_rules: rules to be finalized
+        Returns:
+            Errors & warnings of all rules in order of the rules
+        """
+        if self.max_workers > 1 and len(active_rules) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(lambda rule: rule.finalize(), active_rules))
+        else:
+            results = [rule.finalize() for rule in active_rules]
+
+        hard_errors: List[str] = []
+        light_warnings: List[str] = []
+        for err, wrn in results:
+            hard_errors += err
+            light_warnings += wrn
+        return hard_errors, light_warnings
 
     def validate_model(self, runtime_model: ModelRuntime) -> ModelRuntime:
         """Method to validate CaC model
@@ -74,14 +191,9 @@ class Validator:
         """
         warnings.formatwarning = format_warning
 
-        hard_errors: List[str] = []
-        light_warnings: List[str] = []
-
-        for project_types, validate_method in self.__executor_manager:
-            if self.project_type in project_types:
-                err, wrn = validate_method(runtime_model)
-                hard_errors += err
-                light_warnings += wrn
+        active_rules = [rule(runtime_model) for rule in self.rules if self.project_type in rule.project_types]
+        self.__traverse(runtime_model, active_rules)
+        hard_errors, light_warnings = self.__finalize(active_rules)
 
         if light_warnings:
             warnings.warn("\n".join(light_warnings))
@@ -91,14 +203,97 @@ class Validator:
         # returns runtime_model so it can be used in one-liner
         return runtime_model
 
-    def __validate_executable_executor_period(self, executable: Executable) -> Tuple[List[str], List[str]]:
-        """Method to validate an executable's executor period
+
+class ElementChecker:
+    # pylint: disable=too-few-public-methods
+    """Checks single elements with all cacheable rules for incremental validation"""
+
+    def __init__(self, runtime_model: ModelRuntime) -> None:
+        self.runtime_model = runtime_model
+        self.__rules: Dict[type[ValidationRule], ValidationRule] = {}
+
+    def __call__(self, element_kind: str, element: Any) -> Dict[str, Findings]:
+        """Method to check an element
+        Args:
+            element_kind: kind of the element
+            element: element to be checked
+        Returns:
+            Errors & warnings of the element by rule name
+        """
+        findings: Dict[str, Findings] = {}
+        for rule_cls in Validator.rules:
+            if rule_cls.cacheable:
+                if rule_cls not in self.__rules:
+                    self.__rules[rule_cls] = rule_cls(self.runtime_model)
+                visitor = self.__rules[rule_cls].visitors().get(element_kind)
+                if visitor is not None:
+                    findings[rule_cls.__name__] = visitor(element)
+        return findings
+
+
+@Validator.register_rule
+class ExecutablesRule(ValidationRule):
+    """Validate model's executables
+    Also: Clean unused application modules from model
+    """
+
+    project_types = (PType.INTEGRATION,)
+    # executables are validated against the tasks of their application modules & each other
+    cacheable = False
+
+    def __init__(self, runtime_model: ModelRuntime) -> None:
+        super().__init__(runtime_model)
+        # placeholder for valid executables
+        self.valid_executables: List[Executable] = []
+        # placeholder for all executables name
+        self.valid_executables_name: Set[str] = set()
+        # placeholder for connected application modules
+        self.connected_app_modules: List[ApplicationModule] = []
+        self.connected_app_modules_id: Set[str] = set()
+
+    def visitors(self) -> Dict[str, Callable[[Any], Findings]]:
+        return {"Executables": self.visit_executable}
+
+    def visit_executable(self, executable: Executable) -> Findings:
+        """Method to validate an executable
         Args:
-            exec: Executable to be validated
+            executable: Executable to be validated
         Returns:
             List of errors & warnings for Executable modelling
         """
         list_errors: List[str] = []
+        # raise error if duplicates are discovered
+        if executable.Name in self.valid_executables_name:
+            list_errors.append(f"Executable {executable.Name} is defined multiple times!")
+
+        # valid executables have at least 1 ApplicationModule
+        if executable.ApplicationModules:
+            # add to valid executables
+            self.valid_executables.append(executable)
+            self.valid_executables_name.add(executable.Name)
+            # add connected app modules
+            for app_module_obj in executable.ApplicationModules:
+                self.connected_app_modules.append(app_module_obj.ApplicationModuleRef)
+                self.connected_app_modules_id.add(
+                    create_name_namespace_full_name(
+                        app_module_obj.ApplicationModuleRef.Name, app_module_obj.ApplicationModuleRef.Namespace
+                    )
+                )
+
+        # verify periodic task
+        list_errors += self.validate_executor_period(executable)
+
+        return list_errors, []
+
+    @staticmethod
+    def validate_executor_period(executable: Executable) -> List[str]:
+        """Method to validate an executable's executor period
+        Args:
+            executable: Executable to be validated
+        Returns:
+            List of errors for Executable modelling
+        """
+        list_errors: List[str] = []
 
         # get all periodic tasks from all app modules belonging to the executable
         periodic_tasks_data = [
@@ -140,140 +335,138 @@ class Validator:
             if error_msg:
                 list_errors.append(error_msg)
 
-        return list_errors, []
+        if executable.ExecutorThreads < 1:
+            list_errors.append(
+                f"Invalid ExecutorThreads of Executable {executable.Name}: {executable.ExecutorThreads}! "
+                "At least one thread is needed."
+            )
 
-    def __validate_executables(self, runtime_model: ModelRuntime) -> Tuple[List[str], List[str]]:
-        """Method to validate model's executables
-        Also: Clean unused application modules from model
-        Args:
-            runtime_model: ModelRuntime to be validated
-        Returns:
-            List of errors & warnings for Executable modelling
-        """
-        # set placeholder to collect all errors & warnings
-        list_errors: List[str] = []
+        return list_errors
+
+    def leave(self, element_kind: str) -> None:
+        if element_kind == "Executables":
+            main_model = self.runtime_model.main_model
+            # replace model.Executables with valid_executables
+            main_model.Executables = self.valid_executables
+
+            # build warnings for unconnected app modules
+            self.list_warnings += [
+                f"App Module '{app_module.Namespace}::{app_module.Name}' is defined, "
+                "but not connected in any Executable"
+                for app_module in main_model.ApplicationModules
+                if create_name_namespace_full_name(app_module.Name, app_module.Namespace)
+                not in self.connected_app_modules_id
+            ]
+            # overwrite model's app modules
+            main_model.ApplicationModules = self.connected_app_modules
 
-        # create placeholder for valid executables
-        valid_executables: List[Executable] = []
-        # create placeholder for all executables name
-        valid_executables_name: List[str] = []
-        # create placeholder for connected application modules
-        connected_app_modules: List[ApplicationModule] = []
-
-        for executable in runtime_model.main_model.Executables:
-            # raise error if duplicates are discovered
-            if executable.Name in valid_executables_name:
-                list_errors.append(f"Executable {executable.Name} is defined multiple times!")
-
-            # valid executables have at least 1 ApplicationModule
-            if executable.ApplicationModules:
-                # add to valid executables
-                valid_executables.append(executable)
-                valid_executables_name.append(executable.Name)
-                # add connected app modules
-                connected_app_modules += [
-                    app_module_obj.ApplicationModuleRef for app_module_obj in executable.ApplicationModules
-                ]
-
-            # verify periodic task
-            exec_periodic_task_err, _ = self.__validate_executable_executor_period(executable)
-            list_errors += exec_periodic_task_err
-
-        # replace model.Executables with valid_executables
-        runtime_model.main_model.Executables = valid_executables
-
-        # get unconnected app modules for warning message
-        unconnected_app_modules: List[ApplicationModule] = [
-            app_module
-            for app_module in runtime_model.main_model.ApplicationModules
-            if app_module not in connected_app_modules
-        ]
-        # overwrite model's app modules
-        runtime_model.main_model.ApplicationModules = connected_app_modules
-
-        # build warnings
-        list_warnings = [
-            f"App Module '{unconnected_am.Namespace}::{unconnected_am.Name}' is defined, "
-            "but not connected in any Executable"
-            for unconnected_am in unconnected_app_modules
-        ]
 
-        return list_errors, list_warnings
+@Validator.register_rule
+class InterfaceConnectionsRule(ValidationRule):
+    """Validate model's interface connections"""
 
-    # pylint: enable=too-many-nested-blocks
+    project_types = (PType.INTEGRATION,)
 
-    @staticmethod
-    def __validate_interface_connections(runtime_model: ModelRuntime) -> Tuple[List[str], List[str]]:
-        """Method to validate model's interface connections
+    def __init__(self, runtime_model: ModelRuntime) -> None:
+        super().__init__(runtime_model)
+        self.unconnected_interfaces: List[str] = []
+
+    def visitors(self) -> Dict[str, Callable[[Any], Findings]]:
+        return {"ApplicationModules": self.visit_application_module}
+
+    def visit_application_module(self, app_module: ApplicationModule) -> Findings:
+        """Method to get unconnected interfaces of an application module
         Args:
-            runtime_model: ModelRuntime to be validated
+            app_module: ApplicationModule to be validated
         Returns:
-            List of list_errors & warnings for unconnected interfaces
+            No errors & the unconnected interfaces as warnings
         """
-        # placeholder for all warnings
-        list_warnings: List[str] = []
-        unconnected_interfaces = []
+        unconnected_interfaces: List[str] = []
+        module_str = f"{app_module.Namespace}::{app_module.Name}"
+        connected = set(self.runtime_model.connected_interfaces.get(module_str, []))
+        for ci in app_module.ConsumedInterfaces:
+            if not ci.IsOptional and ci.InstanceName not in connected:
+                unconnected_interfaces.append(f"{module_str} - {ci.InstanceName}")
+        for pi in app_module.ProvidedInterfaces:
+            if pi.InstanceName not in connected:
+                unconnected_interfaces.append(f"{module_str} - {pi.InstanceName}")
+        return [], unconnected_interfaces
+
+    def collect(self, findings: Findings) -> None:
+        self.unconnected_interfaces += findings[1]
+
+    def finalize(self) -> Findings:
+        if self.unconnected_interfaces:
+            self.list_warnings.append(
+                f"Following interfaces are defined but not connected: {self.unconnected_interfaces}"
+            )
+        return self.list_errors, self.list_warnings
 
-        for app_module in runtime_model.main_model.ApplicationModules:
-            module_str = f"{app_module.Namespace}::{app_module.Name}"
-            for ci in app_module.ConsumedInterfaces:
-                if not ci.IsOptional and ci.InstanceName not in runtime_model.connected_interfaces[module_str]:
-                    unconnected_interfaces.append(f"{module_str} - {ci.InstanceName}")
-            for pi in app_module.ProvidedInterfaces:
-                if pi.InstanceName not in runtime_model.connected_interfaces[module_str]:
-                    unconnected_interfaces.append(f"{module_str} - {pi.InstanceName}")
 
-        if unconnected_interfaces:
-            list_warnings.append(f"Following interfaces are defined but not connected: {unconnected_interfaces}")
+@Validator.register_rule
+class ApplicationModuleRule(ValidationRule):
+    """Validate model's application modules"""
 
-        return [], list_warnings
+    project_types = (PType.INTEGRATION, PType.APP_MODULE)
 
-    @staticmethod
-    def __validate_interface_definition(runtime_model: ModelRuntime) -> Tuple[List[str], List[str]]:
-        """Method to validate model's interface definitions
+    def visitors(self) -> Dict[str, Callable[[Any], Findings]]:
+        return {"ApplicationModules": self.visit_application_module}
+
+    def visit_application_module(self, app_module: ApplicationModule) -> Findings:
+        """Method to validate the tasks of an application module
         Args:
-            runtime_model: ModelRuntime to be validated
+            app_module: ApplicationModule to be validated
         Returns:
-            List of list_errors & warnings for empty interfaces
+            List of errors & warnings for application module modelling
         """
-        # placeholder for all warnings
-        list_warnings: List[str] = []
-        empty_interfaces = []
+        list_errors: List[str] = []
+        all_task_names: Set[str] = set()
+        all_run_afters: Dict[str, None] = {}
+        for task in app_module.Tasks:
+            all_task_names.add(task.Name)
+            all_run_afters.update(dict.fromkeys(task.RunAfter))
+
+        for run_after in all_run_afters:
+            if run_after not in all_task_names:
+                list_errors.append(
+                    f"Task {run_after} is used in as a 'run_after' dependency in ApplicationModule"
+                    f" {app_module.Namespace}::{app_module.Name}, but is not part of it."
+                )
 
-        # use module interface from main model since validation takes place after cleanup
-        for module_interaface in runtime_model.main_model.ModuleInterfaces:
-            if not module_interaface.DataElements and not module_interaface.Operations:
-                empty_interfaces.append(f"{module_interaface.Namespace}::{module_interaface.Name}")
+        return list_errors, []
 
-        if empty_interfaces:
-            list_warnings.append(
-                f"Following interfaces are defined without data elements and operations: {empty_interfaces}"
-            )
 
-        return [], list_warnings
+@Validator.register_rule
+class InterfaceDefinitionRule(ValidationRule):
+    """Validate model's interface definitions"""
 
-    @staticmethod
-    def __validate_application_module(runtime_model: ModelRuntime) -> Tuple[List[str], List[str]]:
-        """Method to validate model's application modules
+    project_types = (PType.INTEGRATION, PType.APP_MODULE, PType.INTERFACE)
+
+    def __init__(self, runtime_model: ModelRuntime) -> None:
+        super().__init__(runtime_model)
+        self.empty_interfaces: List[str] = []
+
+    def visitors(self) -> Dict[str, Callable[[Any], Findings]]:
+        # use module interface from main model since validation takes place after cleanup
+        return {"ModuleInterfaces": self.visit_module_interface}
+
+    def visit_module_interface(self, module_interface: ModuleInterface) -> Findings:
+        """Method to check if a module interface is empty
         Args:
-            runtime_model: ModelRuntime to be validated
+            module_interface: ModuleInterface to be validated
         Returns:
-            List of errors & warnings for application module modelling
+            No errors & the module interface as warning if it's empty
         """
-        # placeholder for all errors
-        list_errors: List[str] = []
-        for app_module in runtime_model.main_model.ApplicationModules:
-            all_task_names: list[str] = []
-            all_run_afters: set[str] = set()
-            for task in app_module.Tasks:
-                all_task_names.append(task.Name)
-                all_run_afters.update(task.RunAfter)
-
-            for run_after in all_run_afters:
-                if run_after not in all_task_names:
-                    list_errors.append(
-                        f"Task {run_after} is used in as a 'run_after' dependency in ApplicationModule"
-                        f" {app_module.Namespace}::{app_module.Name}, but is not part of it."
-                    )
+        if not module_interface.DataElements and not module_interface.Operations:
+            return [], [f"{module_interface.Namespace}::{module_interface.Name}"]
+        return [], []
 
-        return list_errors, []
+    def collect(self, findings: Findings) -> None:
+        self.empty_interfaces += findings[1]
+
+    def finalize(self) -> Findings:
+        if self.empty_interfaces:
+            self.list_warnings.append(
+                f"Following interfaces are defined without data elements and operations: {self.empty_interfaces}"
+            )
+        return self.list_errors, self.list_warnings
@@ -4,9 +4,33 @@ Test cli
 
 # from unittest import mock
 
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import click
 from click.testing import CliRunner
 
 from vaf.__main__ import cli
+from vaf.cli_core.common.click_help import LazyGroup
+
+# Budget for the import time of the CLI on top of the vaf package, relative to the import time of click
+STARTUP_BUDGET_CLICK_RATIO = 1.0
+
+
+def _measure_cli_imports(statements: str) -> tuple[int, int]:
+    """Return the import time of click & of everything imported after the vaf package in us."""
+    script = "import click\nfrom click.testing import CliRunner\nimport vaf\n" + statements
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script], capture_output=True, text=True, check=True
+    )
+    top_level = re.findall(r"^import time:\s*\d+ \|\s*(\d+) \| (\S+)$", result.stderr, re.MULTILINE)
+    names = [name for _, name in top_level]
+    times = [int(cumulative) for cumulative, _ in top_level]
+    return times[names.index("click")], sum(times[names.index("vaf") + 1 :])
 
 
 class TestMain:
@@ -57,6 +81,69 @@ class TestMain:
         result = runner.invoke(cli, ["-"])
         assert result.exit_code == 0, result.output
 
+    def test_lazy_subcommands(self) -> None:
+        """test that help & shell completion don't import the subcommands."""
+        script = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from vaf.__main__ import cli\n"
+            "runner = CliRunner()\n"
+            "assert runner.invoke(cli, ['--help']).exit_code == 0\n"
+            "env = {'_VAF_COMPLETE': 'bash_complete', 'COMP_WORDS': 'vaf project ', 'COMP_CWORD': '2'}\n"
+            "assert 'plain,generate' in runner.invoke(cli, [], prog_name='vaf', env=env).output\n"
+            "print(sorted(m for m in sys.modules if m.startswith('vaf.cli_core') or m in ['copier', 'jinja2']))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+        assert "cli_subcommands" not in result.stdout
+        assert "copier" not in result.stdout
+        assert "jinja2" not in result.stdout
+
+    def test_lazy_subcommands_help(self) -> None:
+        """test that the short help of the lazy subcommands matches the loaded commands."""
+        ctx = click.Context(cli)
+        for group_name in cli.list_commands(ctx):
+            group = cli.get_command(ctx, group_name)
+            assert isinstance(group, LazyGroup)
+            for cmd_name, (_, short_help) in group.lazy_subcommands.items():
+                cmd = group.get_command(ctx, cmd_name)
+                assert cmd is not None
+                assert cmd.get_short_help_str(100) == short_help, f"{group_name} {cmd_name}"
+
+    def test_startup_budget(self) -> None:
+        """test that the import time of the CLI entry point stays in budget."""
+        click_us, cli_us = _measure_cli_imports("import vaf.__main__\n")
+        assert cli_us < STARTUP_BUDGET_CLICK_RATIO * click_us, (cli_us, click_us)
+
+    def test_startup_budget_help(self) -> None:
+        """test that the imports of help & shell completion stay in budget."""
+        click_us, cli_us = _measure_cli_imports(
+            "from vaf.__main__ import cli\n"
+            "runner = CliRunner()\n"
+            "assert runner.invoke(cli, ['--help']).exit_code == 0\n"
+            "assert runner.invoke(cli, ['model', '--help']).exit_code == 0\n"
+            "env = {'_VAF_COMPLETE': 'bash_complete', 'COMP_WORDS': 'vaf project ', 'COMP_CWORD': '2'}\n"
+            "assert 'plain,generate' in runner.invoke(cli, [], prog_name='vaf', env=env).output\n"
+        )
+        assert cli_us < STARTUP_BUDGET_CLICK_RATIO * click_us, (cli_us, click_us)
+
+    def test_profile_imports(self, tmp_path: Path) -> None:
+        """test the import & phase report of VAF_PROFILE_IMPORTS."""
+        report_path = tmp_path / "report.json"
+        subprocess.run(
+            [sys.executable, "-m", "vaf", "model", "generate", "--help"],
+            capture_output=True,
+            check=True,
+            env={**os.environ, "VAF_PROFILE_IMPORTS": str(report_path)},
+        )
+        with open(report_path, encoding="utf-8") as fh:
+            report = json.load(fh)
+
+        assert [phase["Name"] for phase in report["Phases"]][:1] == ["cli"]
+        assert any(phase["Name"].startswith("dispatch") for phase in report["Phases"])
+        imports = {entry["Module"]: entry for entry in report["Imports"]}
+        assert "vaf.cli_core.main.cli_subcommands.model_subcmd" in imports
+        assert 0 <= imports["vaf.vafpy"]["Self"] <= imports["vaf.vafpy"]["Cumulative"] <= report["Total"]
+
     # @mock.patch("vaf.example.greet")
     # def test_execute(self, mocked_example_greet: mock.MagicMock) -> None:
     #     """test execute subcommand.
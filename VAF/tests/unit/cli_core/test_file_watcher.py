@@ -0,0 +1,67 @@
+"""
+file watcher tests
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from vaf.cli_core.common.file_watcher import FileWatcher
+
+
+class TestFileWatcher:
+    """
+    Class docstrings are also parsed
+    """
+
+    def test_wait_for_changes(self, tmp_path: Path) -> None:
+        """Test detection of added, changed & removed files"""
+        (tmp_path / "model.py").write_text("a = 1\n")
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "notes.txt").write_text("ignored\n")
+        watcher = FileWatcher([tmp_path], interval=0.01)
+        watcher.reset()
+
+        def change_files() -> None:
+            time.sleep(0.05)
+            (tmp_path / "__pycache__" / "model.py").write_text("ignored\n")
+            (tmp_path / "notes.txt").write_text("still ignored\n")
+            (tmp_path / "model.py").write_text("a = 22\n")
+            (tmp_path / "model.json").write_text("{}\n")
+
+        thread = threading.Thread(target=change_files)
+        thread.start()
+        changed = watcher.wait_for_changes()
+        thread.join()
+        assert changed == [tmp_path / "model.json", tmp_path / "model.py"]
+
+        (tmp_path / "model.json").unlink()
+        assert watcher.wait_for_changes() == [tmp_path / "model.json"]
+
+    def test_watch(self, tmp_path: Path) -> None:
+        """Test that changes done by the callback don't trigger it again"""
+        model_file = tmp_path / "model.py"
+        model_file.write_text("a = 1\n")
+        watcher = FileWatcher([model_file], interval=0.01)
+        calls: List[List[Path]] = []
+
+        def callback(changed: List[Path]) -> None:
+            calls.append(changed)
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            # simulate a CaC script touching its own inputs
+            model_file.write_text("a = 333\n")
+            threading.Timer(0.05, lambda: model_file.write_text("a = 4444\n")).start()
+
+        threading.Timer(0.05, lambda: model_file.write_text("a = 22\n")).start()
+        watcher.watch(callback)
+        assert calls == [[model_file], [model_file]]
+
+    @pytest.mark.parametrize("missing", ["missing.py", "missing_dir"])
+    def test_missing_paths(self, tmp_path: Path, missing: str) -> None:
+        """Test that missing paths don't break the snapshot"""
+        watcher = FileWatcher([tmp_path / missing], interval=0.01)
+        assert not watcher.take_snapshot()
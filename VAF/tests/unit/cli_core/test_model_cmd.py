@@ -59,12 +59,15 @@ class TestModelCmd:  # pylint: disable=too-few-public-methods
         assert (model_dir / "vss.py").is_file()
 
     # @mock.patch("importlib.import_module", side_effect=mock_importlib_import_module)
+    @pytest.mark.parametrize("jobs", [1, 2])
     def test_ftaf_467(
         self,
+        jobs: int,
         # mocked_importlib: mock.MagicMock,
         tmp_path: Path,
         monkeypatch: pytest.MonkeyPatch,
         recwarn: pytest.WarningsRecorder,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """FTAF-467: Handling of unconnected app-modules in integration project"""
         test_data_dir = Path(__file__).parent / "test_data/ftaf_467"
@@ -111,7 +114,7 @@ class TestModelCmd:  # pylint: disable=too-few-public-methods
 
         monkeypatch.chdir(prj_path)
 
-        model_cmd.generate(ProjectType.INTEGRATION, "model/vaf", "ALL")
+        model_cmd.generate(ProjectType.INTEGRATION, "model/vaf", "ALL", jobs)
 
         # assert only connected app modules are used in model.json
         goal_model = load_json(str(test_data_dir / "goal-model.json"))
@@ -139,6 +142,19 @@ class TestModelCmd:  # pylint: disable=too-few-public-methods
             for unconnected in ["Snuggle::BlueSparkle", "Snuggle::Invisible"]
         ]
 
+        # unchanged subprojects reuse their previous export
+        capsys.readouterr()
+        model_cmd.generate(ProjectType.INTEGRATION, "model/vaf", "ALL", jobs)
+        assert capsys.readouterr().out.count("inputs unchanged") == 4
+        with open(path_to_app_module_prj_model_dir / "invisible.py", "a", encoding="utf-8") as fh:
+            fh.write("# changed\n")
+        model_cmd.generate(ProjectType.INTEGRATION, "model/vaf", "ALL", jobs)
+        output = capsys.readouterr().out
+        assert output.count("inputs unchanged") == 3
+        assert f"Executing CaC for {path_to_app_module_prj_model_dir / 'model.py'}" in output
+        model_cmd.generate(ProjectType.INTEGRATION, "model/vaf", "ALL", jobs, force=True)
+        assert "inputs unchanged" not in capsys.readouterr().out
+
     def test_ftaf_460(
         self,
         tmp_path: Path,
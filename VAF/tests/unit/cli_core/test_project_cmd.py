@@ -13,6 +13,7 @@ from unittest import mock
 import pytest
 
 from vaf.cli_core.bootstrap import project_init_cmd
+from vaf.cli_core.common import utils
 from vaf.cli_core.main import project_cmd
 from vaf.vafpy.elements import ApplicationModule
 
@@ -177,6 +178,36 @@ class TestProjectCmd:  # pylint: disable=too-few-public-methods
         ]
         assert sorted(imported_py_modules) == sorted(goal_py_modules)
 
+    def test_project_index(self, tmp_path: Path) -> None:
+        """
+        Test to verify the subproject search without execution of the import scripts
+        Args:
+            Path tmp_path: Temporary path provided by pytest
+        """
+        pj = project_cmd.ProjectCmd()
+        pj_init = project_init_cmd.ProjectInitCmd()
+
+        pj_init.integration_project_init("ExecuteOrder66", str(tmp_path))
+        prj_path = tmp_path / "ExecuteOrder66"
+        app_modules_dir = prj_path / "model/vaf/application_modules"
+        with mock.patch("importlib.import_module", side_effect=mock_importlib_import_module):
+            pj.create_appmodule("Kackhaus", "Gerberit", str(prj_path), ".", "model/vaf")
+
+        with mock.patch("importlib.util.spec_from_file_location") as mocked_spec:
+            subprojects = utils.get_subprojects_in_path(utils.ProjectType.APP_MODULE, app_modules_dir)
+            mocked_spec.assert_not_called()
+        assert subprojects == [prj_path / "src/application_modules/gerberit"]
+        assert (prj_path, utils.ProjectType.INTEGRATION) in utils.get_projects_in_path(tmp_path)
+
+        # computed model paths are still supported, old files are served from the index
+        for file_path in tmp_path.rglob("*"):
+            os.utime(file_path, (0, 0))
+        (app_modules_dir / "import_computed.py").write_text('model_path = "/".join(["..", "computed", "model"])\n')
+        subprojects = utils.get_subprojects_in_path(utils.ProjectType.APP_MODULE, app_modules_dir)
+        assert sorted(subprojects) == sorted(
+            [prj_path / "src/application_modules/gerberit", prj_path / "model/vaf/computed"]
+        )
+
     def test_remove_appmodule(self, tmp_path: Path) -> None:
         """
         Test to verify create_appmodule, import_appmodule & remove_appmodule
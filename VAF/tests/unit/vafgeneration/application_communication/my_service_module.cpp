@@ -41,126 +41,102 @@ void MyServiceModule::DeInit() noexcept  {
 }
 
 void MyServiceModule::StartEventHandlerForModule(const std::string& module) {
-  for(auto& handler_container : my_data_element1_handlers_) {
-    if(handler_container.owner_ == module) {
-      handler_container.is_active_ = true;
-    }
-  }
-  for(auto& handler_container : my_data_element2_handlers_) {
-    if(handler_container.owner_ == module) {
-      handler_container.is_active_ = true;
-    }
-  }
-
-  active_modules_.push_back(module);
+  my_data_element1_handlers_.Activate(module);
+  my_data_element2_handlers_.Activate(module);
 }
 
 void MyServiceModule::StopEventHandlerForModule(const std::string& module) {
-  for(auto& handler_container : my_data_element1_handlers_) {
-    if(handler_container.owner_ == module) {
-      handler_container.is_active_ = false;
-    }
-  }
-  for(auto& handler_container : my_data_element2_handlers_) {
-    if(handler_container.owner_ == module) {
-      handler_container.is_active_ = false;
-    }
-  }
-
-  static_cast<void>(std::remove(active_modules_.begin(), active_modules_.end(), module));
+  my_data_element1_handlers_.Deactivate(module);
+  my_data_element2_handlers_.Deactivate(module);
 }
 
 
 
 ::vaf::Result<::vaf::ConstDataPtr<const std::uint64_t>> MyServiceModule::GetAllocated_my_data_element1() {
+  const std::lock_guard<std::mutex> lock(my_data_element1_sample_mutex_);
   return vaf::Result<vaf::ConstDataPtr<const std::uint64_t >>::FromValue( my_data_element1_sample_);
 }
 
-std::uint64_t MyServiceModule::Get_my_data_element1() { return *my_data_element1_sample_; }
+std::uint64_t MyServiceModule::Get_my_data_element1() {
+  const std::lock_guard<std::mutex> lock(my_data_element1_sample_mutex_);
+  return *my_data_element1_sample_;
+}
 
 void MyServiceModule::RegisterDataElementHandler_my_data_element1(std::string owner, std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>&& f) {
-  my_data_element1_handlers_.emplace_back(owner, std::move(f));
-  if(std::find(active_modules_.begin(), active_modules_.end(), owner) != active_modules_.end()) {
-    my_data_element1_handlers_.back().is_active_ = true;
-  }
+  my_data_element1_handlers_.Register(std::move(owner), std::move(f));
 }
 
 ::vaf::Result<::vaf::DataPtr<std::uint64_t>> MyServiceModule::Allocate_my_data_element1() {
-  std::unique_ptr< std::uint64_t > ptr{
-      std::make_unique< std::uint64_t >()};
-  return ::vaf::Result<vaf::DataPtr< std::uint64_t >>::FromValue(std::move(ptr));
+  return ::vaf::Result<vaf::DataPtr< std::uint64_t >>::FromValue(vaf::MakeDataPtr< std::uint64_t >());
 }
 
 ::vaf::Result<void> MyServiceModule::SetAllocated_my_data_element1(::vaf::DataPtr<std::uint64_t>&& data) {
-  my_data_element1_sample_ = vaf::ConstDataPtr<const std::uint64_t>{std::move(vaf::internal::DataPtrHelper<std::uint64_t>::getRawPtr(data))};
-
-  for(auto& handler_container : my_data_element1_handlers_) {
-    if(handler_container.is_active_) {
-      handler_container.handler_(my_data_element1_sample_);
-    }
+  vaf::ConstDataPtr<const std::uint64_t> sample{vaf::internal::DataPtrHelper<std::uint64_t>::toConstDataPtr(data)};
+  {
+    const std::lock_guard<std::mutex> lock(my_data_element1_sample_mutex_);
+    my_data_element1_sample_ = sample;
   }
 
+  my_data_element1_handlers_.Dispatch(sample);
+
   return vaf::Result<void>{};
 }
 
 ::vaf::Result<void> MyServiceModule::Set_my_data_element1(const std::uint64_t& data) {
-  std::unique_ptr< std::uint64_t > ptr{
-      std::make_unique< std::uint64_t >(data)};
-  my_data_element1_sample_ = vaf::ConstDataPtr<const std::uint64_t>{std::move(ptr)};
-
-  for(auto& handler_container : my_data_element1_handlers_) {
-    if(handler_container.is_active_) {
-      handler_container.handler_(my_data_element1_sample_);
-    }
+  vaf::ConstDataPtr<const std::uint64_t> sample{vaf::MakeConstDataPtr< std::uint64_t >(data)};
+  {
+    const std::lock_guard<std::mutex> lock(my_data_element1_sample_mutex_);
+    my_data_element1_sample_ = sample;
   }
 
+  my_data_element1_handlers_.Dispatch(sample);
+
   return vaf::Result<void>{};
 }
 
 
 
 ::vaf::Result<::vaf::ConstDataPtr<const std::uint64_t>> MyServiceModule::GetAllocated_my_data_element2() {
+  const std::lock_guard<std::mutex> lock(my_data_element2_sample_mutex_);
   return vaf::Result<vaf::ConstDataPtr<const std::uint64_t >>::FromValue( my_data_element2_sample_);
 }
 
-std::uint64_t MyServiceModule::Get_my_data_element2() { return *my_data_element2_sample_; }
+std::uint64_t MyServiceModule::Get_my_data_element2() {
+  const std::lock_guard<std::mutex> lock(my_data_element2_sample_mutex_);
+  return *my_data_element2_sample_;
+}
 
 void MyServiceModule::RegisterDataElementHandler_my_data_element2(std::string owner, std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>&& f) {
-  my_data_element2_handlers_.emplace_back(owner, std::move(f));
-  if(std::find(active_modules_.begin(), active_modules_.end(), owner) != active_modules_.end()) {
-    my_data_element2_handlers_.back().is_active_ = true;
-  }
+  my_data_element2_handlers_.Register(std::move(owner), std::move(f));
 }
 
 ::vaf::Result<::vaf::DataPtr<std::uint64_t>> MyServiceModule::Allocate_my_data_element2() {
-  std::unique_ptr< std::uint64_t > ptr{
-      std::make_unique< std::uint64_t >()};
-  return ::vaf::Result<vaf::DataPtr< std::uint64_t >>::FromValue(std::move(ptr));
+  return ::vaf::Result<vaf::DataPtr< std::uint64_t >>::FromValue(my_data_element2_pool_.Allocate());
 }
 
 ::vaf::Result<void> MyServiceModule::SetAllocated_my_data_element2(::vaf::DataPtr<std::uint64_t>&& data) {
-  my_data_element2_sample_ = vaf::ConstDataPtr<const std::uint64_t>{std::move(vaf::internal::DataPtrHelper<std::uint64_t>::getRawPtr(data))};
-
-  for(auto& handler_container : my_data_element2_handlers_) {
-    if(handler_container.is_active_) {
-      handler_container.handler_(my_data_element2_sample_);
-    }
+  vaf::ConstDataPtr<const std::uint64_t> sample{vaf::internal::DataPtrHelper<std::uint64_t>::toConstDataPtr(data)};
+  {
+    const std::lock_guard<std::mutex> lock(my_data_element2_sample_mutex_);
+    my_data_element2_sample_ = sample;
   }
 
+  my_data_element2_handlers_.Dispatch(sample);
+
   return vaf::Result<void>{};
 }
 
 ::vaf::Result<void> MyServiceModule::Set_my_data_element2(const std::uint64_t& data) {
-  std::unique_ptr< std::uint64_t > ptr{
-      std::make_unique< std::uint64_t >(data)};
-  my_data_element2_sample_ = vaf::ConstDataPtr<const std::uint64_t>{std::move(ptr)};
-
-  for(auto& handler_container : my_data_element2_handlers_) {
-    if(handler_container.is_active_) {
-      handler_container.handler_(my_data_element2_sample_);
-    }
+  vaf::DataPtr< std::uint64_t > ptr{my_data_element2_pool_.Allocate()};
+  *ptr = data;
+  vaf::ConstDataPtr<const std::uint64_t> sample{vaf::internal::DataPtrHelper<std::uint64_t>::toConstDataPtr(ptr)};
+  {
+    const std::lock_guard<std::mutex> lock(my_data_element2_sample_mutex_);
+    my_data_element2_sample_ = sample;
   }
 
+  my_data_element2_handlers_.Dispatch(sample);
+
   return vaf::Result<void>{};
 }
 
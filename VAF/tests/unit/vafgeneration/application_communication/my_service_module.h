@@ -20,14 +20,16 @@
 #define TEST_MY_SERVICE_MODULE_H
 
 #include <memory>
+#include <mutex>
 #include <string>
 #include <vector>
 
-#include "vaf/receiver_handler_container.h"
+#include "vaf/receiver_handler_list.h"
 #include "vaf/controller_interface.h"
 #include "vaf/data_ptr.h"
 #include "vaf/executable_controller_interface.h"
 #include "vaf/result.h"
+#include "vaf/sample_pool.h"
 
 #include "test/my_interface_consumer.h"
 #include "test/my_interface_provider.h"
@@ -75,12 +77,14 @@ class MyServiceModule
 
  private:
   vaf::ModuleExecutor& executor_;
-  std::vector<std::string> active_modules_;
 
-  vaf::ConstDataPtr<const std::uint64_t> my_data_element1_sample_{std::make_unique<std::uint64_t>()};
-  std::vector<vaf::ReceiverHandlerContainer<std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>>> my_data_element1_handlers_;
-  vaf::ConstDataPtr<const std::uint64_t> my_data_element2_sample_{std::make_unique<std::uint64_t>()};
-  std::vector<vaf::ReceiverHandlerContainer<std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>>> my_data_element2_handlers_;
+  vaf::ConstDataPtr<const std::uint64_t> my_data_element1_sample_{vaf::MakeConstDataPtr<std::uint64_t>()};
+  std::mutex my_data_element1_sample_mutex_;
+  vaf::ReceiverHandlerList<std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>> my_data_element1_handlers_;
+  vaf::SamplePool<std::uint64_t> my_data_element2_pool_{4};
+  vaf::ConstDataPtr<const std::uint64_t> my_data_element2_sample_{vaf::MakeConstDataPtr<std::uint64_t>()};
+  std::mutex my_data_element2_sample_mutex_;
+  vaf::ReceiverHandlerList<std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>> my_data_element2_handlers_;
 
   std::function<void(const std::uint64_t&)> MyVoidOperation_handler_;
   std::function<test::MyOperation::Output(const std::uint64_t&, const std::uint64_t&)> MyOperation_handler_;
@@ -77,15 +77,15 @@ void ExecutableController::DoInitialize() {
     std::chrono::nanoseconds{ 0 }
     });
 
-  RegisterModule(MyModule3);
+  RegisterModule(0, MyModule3, {});
 
-  RegisterModule(MyModule4);
+  RegisterModule(1, MyModule4, {});
 
-  RegisterModule(MyModule1);
+  RegisterModule(2, MyModule1, {});
 
-  RegisterModule(MyModule2);
+  RegisterModule(3, MyModule2, {});
 
-  RegisterModule(MyApp);
+  RegisterModule(4, MyApp, {3, 0});
 
   ExecutableControllerBase::DoInitialize();
 }
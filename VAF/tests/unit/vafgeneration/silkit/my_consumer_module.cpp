@@ -19,14 +19,46 @@
 #include "test/my_consumer_module.h"
 
 #include <chrono>
+#include <cstddef>
+#include <cstdint>
 
 #include "vaf/error_domain.h"
+#include "vaf/internal/data_ptr_helper.h"
+#include "vaf/logging.h"
 #include "protobuf/interface/test/myinterface/protobuf_transformer.h"
 namespace test {
 
+namespace {
+
+// Warnings about dropped messages per second, the logger counts the rate limited ones
+constexpr std::uint32_t kDroppedMessageWarningRate{1};
+
+// SIL Kit SerDes serializes a byte vector as its size (32 bit little endian) followed by the bytes, which are parsed
+// in place instead of copying them out of the received buffer
+template <typename Span>
+bool GetSerializedBytes(const Span& data, const std::uint8_t*& bytes, int& size) {
+  constexpr std::size_t kSizeLength{4};
+  if (data.size() < kSizeLength) {
+    return false;
+  }
+  const std::uint8_t* buffer{data.data()};
+  std::uint32_t length{static_cast<std::uint32_t>(buffer[0]) | (static_cast<std::uint32_t>(buffer[1]) << 8U) |
+                       (static_cast<std::uint32_t>(buffer[2]) << 16U) | (static_cast<std::uint32_t>(buffer[3]) << 24U)};
+  if (length > data.size() - kSizeLength) {
+    return false;
+  }
+  bytes = buffer + kSizeLength;
+  size = static_cast<int>(length);
+  return true;
+}
+
+}  // namespace
+
 MyConsumerModule::MyConsumerModule(::vaf::Executor& executor, std::string name, ::vaf::ExecutableControllerInterface& executable_controller_interface)
   : ::vaf::ControlInterface(std::move(name), {}, executable_controller_interface, executor),
-    executor_{ControlInterface::executor_} {
+    executor_{ControlInterface::executor_},
+    logger_{::vaf::CreateLogger("SK", "MyConsumerModule")} {
+  logger_.SetRateLimit(kDroppedMessageWarningRate);
 }
 
 ::vaf::Result<void> MyConsumerModule::Init() noexcept {
@@ -47,45 +79,49 @@ void MyConsumerModule::Start() noexcept {
 
   SilKit::Services::PubSub::PubSubSpec pubsubspec_test_my_data_element1{"MyInterface_my_data_element1", SilKit::Util::SerDes::MediaTypeData()};
   pubsubspec_test_my_data_element1.AddLabel("Instance", "MyInterface_my_data_element1", SilKit::Services::MatchingLabel::Kind::Mandatory);
-  auto receptionHandler_test_my_data_element1 = [&](auto* subscriber, const auto& dataMessageEvent) {
-    const std::lock_guard<std::mutex> lock(cached_test_my_data_element1_mutex_);
-    SilKit::Util::SerDes::Deserializer deserializer(SilKit::Util::ToStdVector(dataMessageEvent.data));
-    std::vector<std::uint8_t> eventData = deserializer.Deserialize<std::vector<uint8_t>>();
-
-    std::unique_ptr< std::uint64_t > ptr;
-    protobuf::interface::test::MyInterface::my_data_element1  deserialized;
-    deserialized.ParseFromArray( eventData.data(), eventData.size() );
-    ptr = std::make_unique< std::uint64_t >();
-    ::protobuf::interface::test::MyInterface::my_data_element1ProtoToVaf(deserialized,*ptr);
-    this->cached_test_my_data_element1_ = vaf::ConstDataPtr<const std::uint64_t>{std::move(ptr)};
-
-    for(auto& handler_container : registered_test_my_data_element1_event_handlers_) {
-      if(handler_container.is_active_) {
-        handler_container.handler_(cached_test_my_data_element1_);
-      }
+  // SIL Kit calls the reception handler of a subscriber from its I/O worker thread only
+  auto receptionHandler_test_my_data_element1 = [&](auto* /*subscriber*/, const auto& dataMessageEvent) {
+    const std::uint8_t* bytes{nullptr};
+    int size{0};
+    if (!GetSerializedBytes(dataMessageEvent.data, bytes, size) ||
+        !received_test_my_data_element1_.ParseFromArray(bytes, size)) {
+      logger_.LogWarn() << "Dropped a malformed message of my_data_element1 with "
+                        << static_cast<int>(dataMessageEvent.data.size()) << " bytes";
+      return;
+    }
+    ::vaf::DataPtr<std::uint64_t> ptr{::vaf::MakeDataPtr<std::uint64_t>()};
+    ::protobuf::interface::test::MyInterface::my_data_element1ProtoToVaf(received_test_my_data_element1_, *ptr);
+    ::vaf::ConstDataPtr<const std::uint64_t> sample{::vaf::internal::DataPtrHelper<std::uint64_t>::toConstDataPtr(ptr)};
+    {
+      const std::lock_guard<std::mutex> lock(cached_test_my_data_element1_mutex_);
+      cached_test_my_data_element1_ = sample;
     }
+
+    test_my_data_element1_handlers_.Dispatch(sample);
   };
   subscriber_test_my_data_element1_= participant_->CreateDataSubscriber("Subscriber_test_my_data_element1", pubsubspec_test_my_data_element1, receptionHandler_test_my_data_element1);
 
   SilKit::Services::PubSub::PubSubSpec pubsubspec_test_my_data_element2{"MyInterface_my_data_element2", SilKit::Util::SerDes::MediaTypeData()};
   pubsubspec_test_my_data_element2.AddLabel("Instance", "MyInterface_my_data_element2", SilKit::Services::MatchingLabel::Kind::Mandatory);
-  auto receptionHandler_test_my_data_element2 = [&](auto* subscriber, const auto& dataMessageEvent) {
-    const std::lock_guard<std::mutex> lock(cached_test_my_data_element2_mutex_);
-    SilKit::Util::SerDes::Deserializer deserializer(SilKit::Util::ToStdVector(dataMessageEvent.data));
-    std::vector<std::uint8_t> eventData = deserializer.Deserialize<std::vector<uint8_t>>();
-
-    std::unique_ptr< std::uint64_t > ptr;
-    protobuf::interface::test::MyInterface::my_data_element2  deserialized;
-    deserialized.ParseFromArray( eventData.data(), eventData.size() );
-    ptr = std::make_unique< std::uint64_t >();
-    ::protobuf::interface::test::MyInterface::my_data_element2ProtoToVaf(deserialized,*ptr);
-    this->cached_test_my_data_element2_ = vaf::ConstDataPtr<const std::uint64_t>{std::move(ptr)};
-
-    for(auto& handler_container : registered_test_my_data_element2_event_handlers_) {
-      if(handler_container.is_active_) {
-        handler_container.handler_(cached_test_my_data_element2_);
-      }
+  // SIL Kit calls the reception handler of a subscriber from its I/O worker thread only
+  auto receptionHandler_test_my_data_element2 = [&](auto* /*subscriber*/, const auto& dataMessageEvent) {
+    const std::uint8_t* bytes{nullptr};
+    int size{0};
+    if (!GetSerializedBytes(dataMessageEvent.data, bytes, size) ||
+        !received_test_my_data_element2_.ParseFromArray(bytes, size)) {
+      logger_.LogWarn() << "Dropped a malformed message of my_data_element2 with "
+                        << static_cast<int>(dataMessageEvent.data.size()) << " bytes";
+      return;
+    }
+    ::vaf::DataPtr<std::uint64_t> ptr{test_my_data_element2_pool_.Allocate()};
+    ::protobuf::interface::test::MyInterface::my_data_element2ProtoToVaf(received_test_my_data_element2_, *ptr);
+    ::vaf::ConstDataPtr<const std::uint64_t> sample{::vaf::internal::DataPtrHelper<std::uint64_t>::toConstDataPtr(ptr)};
+    {
+      const std::lock_guard<std::mutex> lock(cached_test_my_data_element2_mutex_);
+      cached_test_my_data_element2_ = sample;
     }
+
+    test_my_data_element2_handlers_.Dispatch(sample);
   };
   subscriber_test_my_data_element2_= participant_->CreateDataSubscriber("Subscriber_test_my_data_element2", pubsubspec_test_my_data_element2, receptionHandler_test_my_data_element2);
 
@@ -98,8 +134,6 @@ void MyConsumerModule::Start() noexcept {
           ::vaf::Promise<void>*>(
             event.userContext);
     if (event.callStatus == SilKit::Services::Rpc::RpcCallStatus::Success) {
-      SilKit::Util::SerDes::Deserializer deserializer(SilKit::Util::ToStdVector(event.resultData));
-      std::vector<std::uint8_t> result_vector = deserializer.Deserialize<std::vector<uint8_t>>();
       promise_pointer->set_value();
     } else {
       vaf::Error error_code{::vaf::ErrorCode::kDefaultErrorCode, "Rpc call failed"};
@@ -117,11 +151,13 @@ void MyConsumerModule::Start() noexcept {
           ::vaf::Promise<test::MyOperation::Output>*>(
             event.userContext);
     if (event.callStatus == SilKit::Services::Rpc::RpcCallStatus::Success) {
-      SilKit::Util::SerDes::Deserializer deserializer(SilKit::Util::ToStdVector(event.resultData));
-      std::vector<std::uint8_t> result_vector = deserializer.Deserialize<std::vector<uint8_t>>();
+      const std::uint8_t* bytes{nullptr};
+      int size{0};
       test::MyOperation::Output output;
       protobuf::interface::test::MyInterface::MyOperation_out deserialized;
-      deserialized.ParseFromArray( result_vector.data(), result_vector.size() );
+      if (GetSerializedBytes(event.resultData, bytes, size)) {
+        deserialized.ParseFromArray(bytes, size);
+      }
       ::protobuf::interface::test::MyInterface::MyOperationOutProtoToVaf(deserialized, output);
       promise_pointer->set_value(output);
     } else {
@@ -140,11 +176,13 @@ void MyConsumerModule::Start() noexcept {
           ::vaf::Promise<test::MyGetter::Output>*>(
             event.userContext);
     if (event.callStatus == SilKit::Services::Rpc::RpcCallStatus::Success) {
-      SilKit::Util::SerDes::Deserializer deserializer(SilKit::Util::ToStdVector(event.resultData));
-      std::vector<std::uint8_t> result_vector = deserializer.Deserialize<std::vector<uint8_t>>();
+      const std::uint8_t* bytes{nullptr};
+      int size{0};
       test::MyGetter::Output output;
       protobuf::interface::test::MyInterface::MyGetter_out deserialized;
-      deserialized.ParseFromArray( result_vector.data(), result_vector.size() );
+      if (GetSerializedBytes(event.resultData, bytes, size)) {
+        deserialized.ParseFromArray(bytes, size);
+      }
       ::protobuf::interface::test::MyInterface::MyGetterOutProtoToVaf(deserialized, output);
       promise_pointer->set_value(output);
     } else {
@@ -163,8 +201,6 @@ void MyConsumerModule::Start() noexcept {
           ::vaf::Promise<void>*>(
             event.userContext);
     if (event.callStatus == SilKit::Services::Rpc::RpcCallStatus::Success) {
-      SilKit::Util::SerDes::Deserializer deserializer(SilKit::Util::ToStdVector(event.resultData));
-      std::vector<std::uint8_t> result_vector = deserializer.Deserialize<std::vector<uint8_t>>();
       promise_pointer->set_value();
     } else {
       vaf::Error error_code{::vaf::ErrorCode::kDefaultErrorCode, "Rpc call failed"};
@@ -184,31 +220,13 @@ void MyConsumerModule::DeInit() noexcept {
 }
 
 void MyConsumerModule::StartEventHandlerForModule(const std::string& module) {
-  for(auto& handler_container : registered_test_my_data_element1_event_handlers_) {
-    if(handler_container.owner_ == module) {
-      handler_container.is_active_ = true;
-    }
-  }
-  for(auto& handler_container : registered_test_my_data_element2_event_handlers_) {
-    if(handler_container.owner_ == module) {
-      handler_container.is_active_ = true;
-    }
-  }
-  active_modules_.push_back(module);
+  test_my_data_element1_handlers_.Activate(module);
+  test_my_data_element2_handlers_.Activate(module);
 }
 
 void MyConsumerModule::StopEventHandlerForModule(const std::string& module) {
-  for(auto& handler_container : registered_test_my_data_element1_event_handlers_) {
-    if(handler_container.owner_ == module) {
-      handler_container.is_active_ = false;
-    }
-  }
-  for(auto& handler_container : registered_test_my_data_element2_event_handlers_) {
-    if(handler_container.owner_ == module) {
-      handler_container.is_active_ = false;
-    }
-  }
-  static_cast<void>(std::remove(active_modules_.begin(), active_modules_.end(), module));
+  test_my_data_element1_handlers_.Deactivate(module);
+  test_my_data_element2_handlers_.Deactivate(module);
 }
 
 
@@ -232,10 +250,7 @@ std::uint64_t MyConsumerModule::Get_my_data_element1() {
 }
 
 void MyConsumerModule::RegisterDataElementHandler_my_data_element1(std::string owner, std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>&& f) {
-  registered_test_my_data_element1_event_handlers_.emplace_back(owner, std::move(f));
-  if(std::find(active_modules_.begin(), active_modules_.end(), owner) != active_modules_.end()) {
-    registered_test_my_data_element1_event_handlers_.back().is_active_ = true;
-  }
+  test_my_data_element1_handlers_.Register(std::move(owner), std::move(f));
 }
 
 
@@ -259,10 +274,7 @@ std::uint64_t MyConsumerModule::Get_my_data_element2() {
 }
 
 void MyConsumerModule::RegisterDataElementHandler_my_data_element2(std::string owner, std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>&& f) {
-  registered_test_my_data_element2_event_handlers_.emplace_back(owner, std::move(f));
-  if(std::find(active_modules_.begin(), active_modules_.end(), owner) != active_modules_.end()) {
-    registered_test_my_data_element2_event_handlers_.back().is_active_ = true;
-  }
+  test_my_data_element2_handlers_.Register(std::move(owner), std::move(f));
 }
 
 
@@ -25,11 +25,13 @@
 #include <string>
 #include <vector>
 
-#include "vaf/receiver_handler_container.h"
+#include "vaf/receiver_handler_list.h"
 #include "vaf/controller_interface.h"
 #include "vaf/data_ptr.h"
 #include "vaf/executable_controller_interface.h"
+#include "vaf/logging.h"
 #include "vaf/result.h"
+#include "vaf/sample_pool.h"
 
 #include "silkit/SilKit.hpp"
 #include "silkit/services/all.hpp"
@@ -74,16 +76,21 @@ class MyConsumerModule final : public test::MyInterfaceConsumer, public vaf::Con
 
  private:
   vaf::ModuleExecutor& executor_;
-  std::vector<std::string> active_modules_;
+  vaf::Logger& logger_;
   std::unique_ptr<SilKit::IParticipant> participant_;
 
   ::vaf::ConstDataPtr<const std::uint64_t> cached_test_my_data_element1_{};
-  std::vector<::vaf::ReceiverHandlerContainer<std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>>> registered_test_my_data_element1_event_handlers_{};
+  ::vaf::ReceiverHandlerList<std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>> test_my_data_element1_handlers_;
   std::mutex cached_test_my_data_element1_mutex_;
+  // Reused by every reception of the subscriber
+  protobuf::interface::test::MyInterface::my_data_element1 received_test_my_data_element1_{};
   SilKit::Services::PubSub::IDataSubscriber* subscriber_test_my_data_element1_;
-  ::vaf::ConstDataPtr<const std::uint64_t> cached_test_my_data_element2_{std::make_unique<const std::uint64_t>(std::uint64_t{64})};
-  std::vector<::vaf::ReceiverHandlerContainer<std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>>> registered_test_my_data_element2_event_handlers_{};
+  ::vaf::ConstDataPtr<const std::uint64_t> cached_test_my_data_element2_{::vaf::MakeConstDataPtr<std::uint64_t>(std::uint64_t{64})};
+  ::vaf::ReceiverHandlerList<std::function<void(const ::vaf::ConstDataPtr<const std::uint64_t>)>> test_my_data_element2_handlers_;
   std::mutex cached_test_my_data_element2_mutex_;
+  // Reused by every reception of the subscriber
+  protobuf::interface::test::MyInterface::my_data_element2 received_test_my_data_element2_{};
+  ::vaf::SamplePool<std::uint64_t> test_my_data_element2_pool_{4};
   SilKit::Services::PubSub::IDataSubscriber* subscriber_test_my_data_element2_;
   SilKit::Services::Rpc::IRpcClient* rpc_client_test_MyVoidOperation_;
   SilKit::Services::Rpc::IRpcClient* rpc_client_test_MyOperation_;
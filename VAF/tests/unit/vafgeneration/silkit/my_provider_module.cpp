@@ -169,14 +169,12 @@ void MyProviderModule::DeInit() noexcept {
 }
 
 ::vaf::Result<::vaf::DataPtr<std::uint64_t>> MyProviderModule::Allocate_my_data_element1() {
-  std::unique_ptr< std::uint64_t > ptr{
-      std::make_unique< std::uint64_t >()};
-  return ::vaf::Result<vaf::DataPtr< std::uint64_t >>::FromValue(std::move(ptr));
+  return ::vaf::Result<vaf::DataPtr< std::uint64_t >>::FromValue(vaf::MakeDataPtr< std::uint64_t >());
 }
 
 ::vaf::Result<void> MyProviderModule::SetAllocated_my_data_element1(::vaf::DataPtr<std::uint64_t>&& data) {
   protobuf::interface::test::MyInterface::my_data_element1 request;
-  protobuf::interface::test::MyInterface::my_data_element1VafToProto(*vaf::internal::DataPtrHelper<std::uint64_t>::getRawPtr(data), request);
+  protobuf::interface::test::MyInterface::my_data_element1VafToProto(*data, request);
   size_t nbytes = request.ByteSizeLong();
   std::vector<std::uint8_t> serialized(nbytes);
   if (nbytes) {
@@ -204,14 +202,12 @@ void MyProviderModule::DeInit() noexcept {
   return ::vaf::Result<void>{};
 }
 ::vaf::Result<::vaf::DataPtr<std::uint64_t>> MyProviderModule::Allocate_my_data_element2() {
-  std::unique_ptr< std::uint64_t > ptr{
-      std::make_unique< std::uint64_t >()};
-  return ::vaf::Result<vaf::DataPtr< std::uint64_t >>::FromValue(std::move(ptr));
+  return ::vaf::Result<vaf::DataPtr< std::uint64_t >>::FromValue(vaf::MakeDataPtr< std::uint64_t >());
 }
 
 ::vaf::Result<void> MyProviderModule::SetAllocated_my_data_element2(::vaf::DataPtr<std::uint64_t>&& data) {
   protobuf::interface::test::MyInterface::my_data_element2 request;
-  protobuf::interface::test::MyInterface::my_data_element2VafToProto(*vaf::internal::DataPtrHelper<std::uint64_t>::getRawPtr(data), request);
+  protobuf::interface::test::MyInterface::my_data_element2VafToProto(*data, request);
   size_t nbytes = request.ByteSizeLong();
   std::vector<std::uint8_t> serialized(nbytes);
   if (nbytes) {
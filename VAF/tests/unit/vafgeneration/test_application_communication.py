@@ -36,6 +36,7 @@ class TestIntegration:
             vafmodel.DataElement(
                 Name="my_data_element2",
                 TypeRef=vafmodel.DataType(Name="uint64_t", Namespace=""),
+                SamplePoolSize=4,
             )
         )
 
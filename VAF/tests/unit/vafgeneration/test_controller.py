@@ -7,7 +7,7 @@ import os
 from pathlib import Path
 
 from vaf import vafmodel
-from vaf.vafgeneration import vaf_controller
+from vaf.vafgeneration import schedule_analysis, vaf_controller
 
 # pylint: disable=too-few-public-methods
 # pylint: disable=duplicate-code
@@ -147,3 +147,144 @@ class TestIntegration:
             tmp_path / "src-gen/executables/my_executable/CMakeLists.txt",
             script_dir / "controller/CMakeLists.txt",
         )
+
+    def test_executable_wiring(self) -> None:
+        """Test the precomputed wiring of an executable"""
+        interface = vafmodel.ModuleInterface(Name="MyInterface", Namespace="test")
+        modules = [
+            vafmodel.PlatformModule(Name=f"MyModule{i}", Namespace="test", ModuleInterfaceRef=interface)
+            for i in range(3)
+        ]
+        app_module = vafmodel.ApplicationModule(
+            Name="MyApp",
+            Namespace="test",
+            ConsumedInterfaces=[
+                vafmodel.ApplicationModuleConsumedInterface(InstanceName="consumed", ModuleInterfaceRef=interface),
+                vafmodel.ApplicationModuleConsumedInterface(
+                    InstanceName="optional", ModuleInterfaceRef=interface, IsOptional=True
+                ),
+            ],
+            ProvidedInterfaces=[
+                vafmodel.ApplicationModuleProvidedInterface(InstanceName="provided", ModuleInterfaceRef=interface)
+            ],
+            Tasks=[],
+        )
+        mapping = vafmodel.ExecutableApplicationModuleMapping(
+            ApplicationModuleRef=app_module,
+            InterfaceInstanceToModuleMappings=[
+                vafmodel.InterfaceInstanceToModuleMapping(InstanceName="consumed", ModuleRef=modules[0]),
+                vafmodel.InterfaceInstanceToModuleMapping(InstanceName="optional", ModuleRef=modules[1]),
+                # equal copy instead of the same object
+                vafmodel.InterfaceInstanceToModuleMapping(
+                    InstanceName="provided", ModuleRef=modules[2].model_copy(deep=True)
+                ),
+            ],
+        )
+        consumer_module = vafmodel.ApplicationModule(
+            Name="MyConsumer",
+            Namespace="test",
+            ConsumedInterfaces=[
+                vafmodel.ApplicationModuleConsumedInterface(
+                    InstanceName="consumed", ModuleInterfaceRef=interface, IsOptional=True
+                )
+            ],
+            ProvidedInterfaces=[],
+            Tasks=[],
+        )
+        consumer_mapping = vafmodel.ExecutableApplicationModuleMapping(
+            ApplicationModuleRef=consumer_module,
+            InterfaceInstanceToModuleMappings=[
+                vafmodel.InterfaceInstanceToModuleMapping(InstanceName="consumed", ModuleRef=modules[2])
+            ],
+        )
+        executable = vafmodel.Executable(
+            Name="MyExecutable",
+            ExecutorPeriod="10ms",
+            ApplicationModules=[mapping, consumer_mapping],
+            InternalCommunicationModules=[modules[0], modules[2]],
+        )
+
+        wiring = vaf_controller.ExecutableWiring(executable)
+        assert wiring.is_internal(modules[0])
+        assert not wiring.is_internal(modules[1])
+        assert wiring.is_internal(mapping.InterfaceInstanceToModuleMappings[2].ModuleRef)
+
+        consumed_modules, provided_modules = wiring.get_communication_modules()
+        assert [m.Name for m in consumed_modules] == ["MyModule1"]
+        assert [m.Name for m in provided_modules] == ["MyModule2"]
+
+        assert wiring.get_dependencies(mapping) == (["MyModule0"], ["MyModule0", "MyModule1", "MyModule2"])
+        assert vaf_controller.get_dependencies_of_application_module(executable, mapping) == wiring.get_dependencies(
+            mapping
+        )
+
+        # the consumer of an internal module is never executed in parallel to its provider
+        assert wiring.get_dependencies(consumer_mapping) == ([], ["MyModule2"])
+        assert wiring.get_run_after(consumer_mapping) == ["MyApp"]
+        assert wiring.get_run_after(mapping) == ["MyModule0"]
+
+    def test_balanced_task_offsets(self, tmp_path) -> None:
+        """Test the generated offsets of tasks without offset & preferred offset"""
+        app_module = vafmodel.ApplicationModule(
+            Name="MyApp",
+            Namespace="test",
+            ConsumedInterfaces=[],
+            ProvidedInterfaces=[],
+            Tasks=[
+                vafmodel.ApplicationModuleTasks(Name="R1", Period="20ms"),
+                vafmodel.ApplicationModuleTasks(Name="R2", Period="20ms"),
+                vafmodel.ApplicationModuleTasks(Name="R3", Period="20ms", PreferredOffset=0),
+            ],
+        )
+        mapping = vafmodel.ExecutableApplicationModuleMapping(
+            ApplicationModuleRef=app_module,
+            InterfaceInstanceToModuleMappings=[],
+            TaskMapping=[
+                vafmodel.ExecutableTaskMapping(TaskName="R1", Budget="2ms"),
+                vafmodel.ExecutableTaskMapping(TaskName="R2", Budget="1ms"),
+                vafmodel.ExecutableTaskMapping(TaskName="R3", Budget="1ms"),
+            ],
+        )
+        executable = vafmodel.Executable(
+            Name="MyExecutable", ExecutorPeriod="10ms", ApplicationModules=[mapping], BalanceTaskOffsets=True
+        )
+        m = vafmodel.MainModel(ApplicationModules=[app_module], Executables=[executable])
+
+        balanced_offsets = schedule_analysis.get_balanced_task_offsets(executable)
+        assert balanced_offsets == {("test::MyApp", "R1"): 1, ("test::MyApp", "R2"): 0}
+        assert [vaf_controller.get_task_mapping(r, mapping, balanced_offsets)[0] for r in mapping.TaskMapping] == [
+            1,
+            0,
+            0,
+        ]
+        assert [vaf_controller.get_task_mapping(r, mapping)[0] for r in mapping.TaskMapping] == [0, 0, 0]
+
+        vaf_controller.generate(m, tmp_path)
+        controller = (
+            tmp_path / "src-gen/executables/my_executable/src/executable_controller/executable_controller.cpp"
+        ).read_text()
+        assert (
+            "1,\n    std::chrono::nanoseconds{ 2000000 },\n    0,\n    std::chrono::nanoseconds{ 1000000 }"
+            in controller
+        )
+
+    def test_executor_settings(self, tmp_path) -> None:
+        """Test the thread count & statistics switch of the executor"""
+        executable = vafmodel.Executable(Name="MyExecutable", ExecutorPeriod="10ms", ApplicationModules=[])
+        m = vafmodel.MainModel(Executables=[executable])
+        controller_path = (
+            tmp_path / "src-gen/executables/my_executable/src/executable_controller/executable_controller.cpp"
+        )
+
+        vaf_controller.generate(m, tmp_path)
+        assert "std::make_unique<vaf::Executor>(std::chrono::milliseconds{ 10 });" in controller_path.read_text()
+
+        executable.ExecutorThreads = 4
+        vaf_controller.generate(m, tmp_path)
+        assert "std::make_unique<vaf::Executor>(std::chrono::milliseconds{ 10 }, 4);" in controller_path.read_text()
+
+        executable.ExecutorStatistics = True
+        vaf_controller.generate(m, tmp_path)
+        assert (
+            "std::make_unique<vaf::Executor>(std::chrono::milliseconds{ 10 }, 4, true);" in controller_path.read_text()
+        )
@@ -0,0 +1,78 @@
+"""Test of merge.py"""
+
+import random
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from vaf.vafgeneration.merge import merge_three_way, split_lines
+
+BASE = b"".join(f"line {i}\n".encode() for i in range(20))
+
+
+def test_split_lines() -> None:
+    """Test splitting content into lines with line feeds"""
+    assert not split_lines(b"")
+    assert split_lines(b"a\nb\n") == [b"a\n", b"b\n"]
+    assert split_lines(b"a\r\nb") == [b"a\r\n", b"b"]
+
+
+def test_merge_without_conflicts() -> None:
+    """Test merging changes of both sides"""
+    ours = BASE.replace(b"line 2\n", b"line 2 edited\n")
+    theirs = BASE.replace(b"line 15\n", b"line 15\nline 15a\n")
+    result, conflicts = merge_three_way(ours, BASE, theirs)
+    assert conflicts == 0
+    assert result == BASE.replace(b"line 2\n", b"line 2 edited\n").replace(b"line 15\n", b"line 15\nline 15a\n")
+
+    # identical changes on both sides
+    result, conflicts = merge_three_way(ours, BASE, ours)
+    assert conflicts == 0
+    assert result == ours
+
+
+def test_merge_with_conflict() -> None:
+    """Test conflict markers of changes at the same lines"""
+    ours = BASE.replace(b"line 5\n", b"ours\n")
+    theirs = BASE.replace(b"line 5\n", b"theirs\n")
+    result, conflicts = merge_three_way(ours, BASE, theirs, "current", "new")
+    assert conflicts == 1
+    assert result == BASE.replace(b"line 5\n", b"<<<<<<< current\nours\n=======\ntheirs\n>>>>>>> new\n")
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+def test_compatible_with_git(tmp_path: Path) -> None:
+    """Test that the results are identical to git merge-file -p
+
+    Args:
+        tmp_path (Path): Directory of the files passed to git
+    """
+    rng = random.Random(42)
+    vocabulary = [b"{\n", b"}\n", b"\n", b"  return;\n", b"// comment\n", b"a\n", b"b\n", b"c\n"]
+
+    def mutate(lines: list[bytes]) -> list[bytes]:
+        lines = list(lines)
+        for _ in range(rng.randint(0, 6)):
+            position = rng.randint(0, len(lines))
+            operation = rng.random()
+            if operation < 0.4:
+                lines[position:position] = rng.choices(vocabulary, k=rng.randint(1, 3))
+            elif operation < 0.7:
+                del lines[position : position + rng.randint(1, 3)]
+            elif lines:
+                lines[min(position, len(lines) - 1)] = rng.choice(vocabulary)
+        return lines
+
+    paths = [tmp_path / "ours", tmp_path / "base", tmp_path / "theirs"]
+    for _ in range(200):
+        base = rng.choices(vocabulary, k=rng.randint(0, 40))
+        ours, ancestor, theirs = b"".join(mutate(base)), b"".join(base), b"".join(mutate(base))
+        for path, content in zip(paths, [ours, ancestor, theirs]):
+            path.write_bytes(content)
+        git_merge = subprocess.run(["git", "merge-file", "-p", *map(str, paths)], capture_output=True, check=False)
+        assert merge_three_way(ours, ancestor, theirs, str(paths[0]), str(paths[2])) == (
+            git_merge.stdout,
+            git_merge.returncode,
+        )
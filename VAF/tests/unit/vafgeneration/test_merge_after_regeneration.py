@@ -20,6 +20,7 @@ from vaf.cli_core.common.utils import concat_str_to_path
 from vaf.cli_core.main import project_cmd
 from vaf.vafgeneration.vaf_generate_application_module import generate_application_module
 from vaf.vafgeneration.vaf_generate_common import (
+    PristineStore,
     __file_has_conflict,
     __get_ancestor_file_rel_path,
     __get_newly_generated_file_path,
@@ -330,3 +331,31 @@ class TestRegenerationMerge:
             tmp_path / "SensorFusion" / self.ut_h_rel_path,
             self.ut_mock_data_path / "removal/sensor_fusion_base_test_goal.h",
         )
+
+    def test_merge_with_pristine_store(self, tmp_path) -> None:
+        """Test merging with the ancestors of the pristine store instead of the old model.json~"""
+        self._prerun_test_merge_regeneration(tmp_path, cycle=1)
+        store = PristineStore(tmp_path / "SensorFusion")
+        assert store.is_available()
+        assert store.get(self.h_rel_path) is not None
+
+        # update model without keeping the old model.json~
+        self._update_model_json(
+            self.ut_mock_data_path / "simple_changes/model_changed.json",
+            tmp_path / "SensorFusion" / self.model_rel_out_path,
+        )
+        concat_str_to_path(tmp_path / "SensorFusion" / self.model_rel_out_path, "~").unlink()
+
+        # regenerate
+        self._generate(tmp_path)
+
+        # assert no conflicts in h
+        assert filecmp.cmp(
+            tmp_path / "SensorFusion" / self.h_rel_path,
+            self.ut_mock_data_path / "simple_changes/sensor_fusion_goal.h",
+        )
+        assert not (tmp_path / "SensorFusion" / get_ancestor_file_rel_path(self.h_rel_path)).is_file()
+        # store contains the pristine versions of the last generation
+        store = PristineStore(tmp_path / "SensorFusion")
+        assert store.get(self.h_rel_path) != (tmp_path / "SensorFusion" / self.h_rel_path).read_bytes()
+        assert len(list((store.store_dir / "objects").iterdir())) == len(set(store.index.values()))
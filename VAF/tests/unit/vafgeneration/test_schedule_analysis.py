@@ -0,0 +1,79 @@
+"""Test of schedule_analysis.py"""
+
+from typing import List
+
+import pytest
+
+from vaf import vafmodel
+from vaf.vafgeneration import schedule_analysis
+
+
+def _create_executable(
+    tasks: List[vafmodel.ApplicationModuleTasks], task_mapping: List[vafmodel.ExecutableTaskMapping]
+) -> vafmodel.Executable:
+    app_module = vafmodel.ApplicationModule(
+        Name="MyApp", Namespace="test", ConsumedInterfaces=[], ProvidedInterfaces=[], Tasks=tasks
+    )
+    return vafmodel.Executable(
+        Name="MyExecutable",
+        ExecutorPeriod="10ms",
+        ApplicationModules=[
+            vafmodel.ExecutableApplicationModuleMapping(
+                ApplicationModuleRef=app_module, InterfaceInstanceToModuleMappings=[], TaskMapping=task_mapping
+            )
+        ],
+        InternalCommunicationModules=[],
+    )
+
+
+def test_analyze_executable() -> None:
+    """Test the tick load & the suggested offsets"""
+    executable = _create_executable(
+        [
+            vafmodel.ApplicationModuleTasks(Name="fast", Period="10ms"),
+            vafmodel.ApplicationModuleTasks(Name="slow", Period="40ms"),
+            vafmodel.ApplicationModuleTasks(Name="slow_after", Period="20ms", RunAfter=["slow"]),
+            vafmodel.ApplicationModuleTasks(Name="fixed", Period="20ms", PreferredOffset=1),
+        ],
+        [
+            vafmodel.ExecutableTaskMapping(TaskName="fast", Budget="1ms"),
+            vafmodel.ExecutableTaskMapping(TaskName="slow", Budget="4ms"),
+            vafmodel.ExecutableTaskMapping(TaskName="slow_after", Budget="1ms"),
+            vafmodel.ExecutableTaskMapping(TaskName="fixed", Offset=3, Budget="2ms"),
+        ],
+    )
+    report = schedule_analysis.analyze_executable(executable)
+
+    assert report["HyperperiodTicks"] == 4
+    assert report["TickLoad"] == [6_000_000, 3_000_000, 2_000_000, 3_000_000]
+    assert report["WorstCaseTick"] == 0
+    assert report["WorstCaseUtilization"] == 60.0
+    assert report["AverageUtilization"] == 35.0
+    assert not report["TasksWithoutBudget"]
+
+    # the offset of the task mapping wins, RunAfter keeps slow & slow_after in the same tick
+    assert [(task["Offset"], task["SuggestedOffset"]) for task in report["Tasks"]] == [(0, 0), (0, 0), (0, 0), (3, 3)]
+    assert report["Suggested"]["TickLoad"] == report["TickLoad"]
+
+    executable.ApplicationModules[0].ApplicationModuleRef.Tasks[2].RunAfter = []
+    report = schedule_analysis.analyze_executable(executable)
+    assert [task["SuggestedOffset"] for task in report["Tasks"]] == [0, 0, 1, 3]
+    assert report["Suggested"]["TickLoad"] == [5_000_000, 4_000_000, 1_000_000, 4_000_000]
+    assert report["Suggested"]["WorstCaseUtilization"] == 50.0
+
+
+def test_analyze_executable_errors() -> None:
+    """Test tasks faster than the executor & too long hyperperiods"""
+    executable = _create_executable([vafmodel.ApplicationModuleTasks(Name="task", Period="5ms")], [])
+    with pytest.raises(ValueError, match="shorter than the executor period"):
+        schedule_analysis.analyze_executable(executable)
+
+    executable = _create_executable(
+        [
+            vafmodel.ApplicationModuleTasks(Name="task1", Period="9990ms"),
+            vafmodel.ApplicationModuleTasks(Name="task2", Period="9970ms"),
+        ],
+        [],
+    )
+    with pytest.raises(ValueError, match="Hyperperiod"):
+        schedule_analysis.analyze_executable(executable)
@@ -143,6 +143,7 @@ class TestIntegration:
                 Name="my_data_element2",
                 TypeRef=vafmodel.DataType(Name="uint64_t", Namespace=""),
                 InitialValue="{64}",
+                SamplePoolSize=4,
             )
         )
 
@@ -18,11 +18,14 @@ Test
 # ruff: noqa: F841
 import unittest
 from datetime import timedelta
+from typing import Any, Callable
+from unittest import mock
 
 import pytest
 
 from vaf import vafmodel, vafpy
-from vaf.cli_core.common.utils import create_name_namespace_full_name
+from vaf.cli_core.common.utils import ProjectType, create_name_namespace_full_name
+from vaf.vafpy import validator
 from vaf.vafpy.model_runtime import model_runtime
 
 
@@ -38,6 +41,10 @@ class TestMain(unittest.TestCase):
         """Reset model runtime for each test"""
         model_runtime.reset()
 
+    def tearDown(self) -> None:
+        """Disable incremental validation after each test"""
+        vafpy.enable_incremental_validation(False)
+
     def test_string(self) -> None:
         """test string creation"""
         vafpy.datatypes.String("FirstString", "test")
@@ -329,3 +336,210 @@ class TestMain(unittest.TestCase):
         assert len(model_runtime.element_by_namespace.get("vaf", {}).get("Strings", {}).keys()) == 1
         assert model_runtime.main_model.DataTypeDefinitions.Strings[0].Namespace == "vaf"
         assert model_runtime.main_model.DataTypeDefinitions.Strings[0].Name == "string"
+
+    def test_validator_rule_engine(self) -> None:
+        """Test single traversal of the validator feeding registered rules"""
+        my_interface = vafpy.ModuleInterface(name="MyInterface", namespace="interfaces")
+        my_interface.add_data_element(name="data_element1", datatype=vafpy.BaseTypes.UINT16_T)
+
+        app_module1 = vafpy.ApplicationModule(name="AppModule1", namespace="app_modules")
+        app_module1.add_provided_interface(instance_name="Instance1", interface=my_interface)
+        app_module2 = vafpy.ApplicationModule(name="AppModule2", namespace="app_modules")
+        app_module2.add_consumed_interface(instance_name="Instance1", interface=my_interface)
+        vafpy.ApplicationModule(name="Unconnected", namespace="app_modules")
+
+        exe = vafpy.Executable("exe", timedelta(milliseconds=10))
+        exe.add_application_module(app_module1, [])
+        exe.add_application_module(app_module2, [])
+        exe.connect_interfaces(app_module1, "Instance1", app_module2, "Instance1")
+
+        visited: list[str] = []
+
+        class CountingRule(validator.ValidationRule):
+            project_types = (ProjectType.INTEGRATION,)
+
+            def visitors(self) -> dict[str, Callable[[Any], validator.Findings]]:
+                return {"ApplicationModules": self.visit_application_module}
+
+            def visit_application_module(self, am: Any) -> validator.Findings:
+                visited.append(am.Name)
+                return [], []
+
+            def finalize(self) -> validator.Findings:
+                return [f"Visited {len(visited)}"], []
+
+        validator.Validator.register_rule(CountingRule)
+        try:
+            with pytest.warns(UserWarning, match="App Module 'app_modules::Unconnected' is defined"):
+                with pytest.raises(vafpy.core.ModelError, match="Visited 2"):
+                    validator.Validator(ProjectType.INTEGRATION, max_workers=2).validate_model(model_runtime)
+        finally:
+            validator.Validator.rules.remove(CountingRule)
+
+        # only connected app modules are fed to the rules
+        assert visited == ["AppModule1", "AppModule2"]
+        assert [am.Name for am in model_runtime.main_model.ApplicationModules] == ["AppModule1", "AppModule2"]
+
+    def test_incremental_validation(self) -> None:
+        """Test per-element validation state while building the model"""
+        vafpy.enable_incremental_validation()
+
+        my_interface = vafpy.ModuleInterface(name="MyInterface", namespace="interfaces")
+        assert vafpy.get_validation_findings() == {"interfaces::MyInterface": ([], ["interfaces::MyInterface"])}
+        my_interface.add_data_element(name="data_element1", datatype=vafpy.BaseTypes.UINT16_T)
+        assert not vafpy.get_validation_findings()
+
+        p_10ms = timedelta(milliseconds=10)
+        app_module1 = vafpy.ApplicationModule(name="AppModule1", namespace="app_modules")
+        app_module1.add_provided_interface(instance_name="Instance1", interface=my_interface)
+        app_module1.add_task(
+            vafpy.Task(name="Step2", period=p_10ms, run_after=[vafpy.Task(name="Step1", period=p_10ms)])
+        )
+        app_module2 = vafpy.ApplicationModule(name="AppModule2", namespace="app_modules")
+        app_module2.add_consumed_interface(instance_name="Instance1", interface=my_interface)
+
+        findings = vafpy.get_validation_findings()
+        assert findings["app_modules::AppModule1"] == (
+            [
+                (
+                    "Task Step1 is used in as a 'run_after' dependency in ApplicationModule"
+                    " app_modules::AppModule1, but is not part of it."
+                )
+            ],
+            ["app_modules::AppModule1 - Instance1"],
+        )
+        assert findings["app_modules::AppModule2"] == ([], ["app_modules::AppModule2 - Instance1"])
+
+        exe = vafpy.Executable("exe", p_10ms)
+        exe.add_application_module(app_module1, [])
+        exe.add_application_module(app_module2, [])
+        exe.connect_interfaces(app_module1, "Instance1", app_module2, "Instance1")
+        app_module1.add_task(vafpy.Task(name="Step1", period=p_10ms))
+        assert not vafpy.get_validation_findings()
+
+        # finalisation takes the findings of the cacheable rules from the validation state
+        with mock.patch.object(validator.ApplicationModuleRule, "visit_application_module") as visit:
+            validator.Validator(ProjectType.INTEGRATION).validate_model(model_runtime)
+            visit.assert_not_called()
+
+    def test_list_index(self) -> None:
+        """Test the index follows changes of the indexed list"""
+        index: vafpy.core.ListIndex[vafmodel.DataType] = vafpy.core.ListIndex(lambda item: item.Name)
+        items = [vafmodel.DataType(Name=f"T{idx}", Namespace="test") for idx in range(3)]
+        assert index.find(items, "T1") == [items[1]]
+        assert not index.find(items, "T3")
+
+        items.append(vafmodel.DataType(Name="T3", Namespace="test"))
+        assert index.find(items, "T3") == [items[3]]
+
+        # replaced in place
+        replaced = items[1]
+        items[1] = vafmodel.DataType(Name="T4", Namespace="test")
+        assert index.find(items, "T4")[0] is items[1]
+        assert not index.find(items, "T1")
+        items[2] = vafmodel.DataType(Name="T2", Namespace="other")
+        assert index.find(items, "T2")[0] is items[2]
+
+        # removed & appended, same length
+        items.remove(items[0])
+        items.append(replaced)
+        assert index.find(items, "T1")[0] is replaced
+        assert not index.find(items, "T0")
+        assert index.find(items, "T3")[0] is items[2]
+
+    def test_connect_interfaces_indexed(self) -> None:
+        """Test indexed lookups while wiring executables"""
+        my_interface = vafpy.ModuleInterface(name="MyInterface", namespace="interfaces")
+        my_interface.add_data_element(name="data_element1", datatype=vafpy.BaseTypes.UINT16_T)
+
+        provider = vafpy.ApplicationModule(name="Provider", namespace="app_modules")
+        provider.add_provided_interface(instance_name="Out", interface=my_interface)
+        provider.add_consumed_interface(instance_name="In", interface=my_interface)
+
+        exe = vafpy.Executable("exe", timedelta(milliseconds=10))
+        exe.add_application_module(provider, [])
+        consumers = []
+        for idx in range(100):
+            consumer = vafpy.ApplicationModule(name=f"Consumer{idx}", namespace="app_modules")
+            consumer.add_consumed_interface(instance_name="In", interface=my_interface)
+            exe.add_application_module(consumer, [])
+            exe.connect_interfaces(provider, "Out", consumer, "In")
+            consumers.append(consumer)
+
+        # all consumers share the internal communication module of the provider
+        assert len(exe.InternalCommunicationModules) == 1
+        assert len(exe.ApplicationModules[0].InterfaceInstanceToModuleMappings) == 1
+        assert all(
+            mapping.InterfaceInstanceToModuleMappings[0].ModuleRef is exe.InternalCommunicationModules[0]
+            for mapping in exe.ApplicationModules[1:]
+        )
+        assert len(model_runtime.connected_interfaces["app_modules::Provider"]) == 100
+
+        with pytest.raises(vafpy.core.ModelError, match="Could not find interface instance Out2"):
+            exe.connect_interfaces(provider, "Out2", consumers[0], "In")
+
+        unmapped = vafpy.ApplicationModule(name="Unmapped", namespace="app_modules")
+        unmapped.add_consumed_interface(instance_name="In", interface=my_interface)
+        with pytest.raises(vafpy.core.ModelError, match="Could not find application module Unmapped"):
+            exe.connect_interfaces(provider, "Out", unmapped, "In")
+
+        # mappings appended directly to the model are found as well
+        exe.ApplicationModules.append(
+            vafmodel.ExecutableApplicationModuleMapping(
+                ApplicationModuleRef=unmapped, InterfaceInstanceToModuleMappings=[]
+            )
+        )
+        exe.connect_interfaces(provider, "Out", unmapped, "In")
+
+        # SIL Kit modules are reused per module interface and service interface name
+        exe.connect_consumed_interface_to_silkit(provider, "In", "Silkit_Service")
+        exe.connect_consumed_interface_to_silkit(consumers[0], "In", "Silkit_Service")
+        exe.connect_consumed_interface_to_silkit(consumers[1], "In", "Silkit_Other")
+        assert len(model_runtime.main_model.PlatformConsumerModules) == 2
+        assert (
+            exe.ApplicationModules[1].InterfaceInstanceToModuleMappings[-1].ModuleRef
+            is model_runtime.main_model.PlatformConsumerModules[0]
+        )
+
+    def test_connect_many(self) -> None:
+        """Test bulk wiring of executables"""
+        my_interface = vafpy.ModuleInterface(name="MyInterface", namespace="interfaces")
+        my_interface.add_data_element(name="data_element1", datatype=vafpy.BaseTypes.UINT16_T)
+
+        provider = vafpy.ApplicationModule(name="Provider", namespace="app_modules")
+        provider.add_provided_interface(instance_name="Out", interface=my_interface)
+        consumers = []
+        for idx in range(10):
+            consumer = vafpy.ApplicationModule(name=f"Consumer{idx}", namespace="app_modules")
+            consumer.add_consumed_interface(instance_name="In", interface=my_interface)
+            consumers.append(consumer)
+
+        exe = vafpy.Executable("exe", timedelta(milliseconds=10))
+        exe.add_application_modules(
+            [(provider, [])] + [(consumer, [("step", timedelta(milliseconds=1), 0)]) for consumer in consumers]
+        )
+        assert len(exe.ApplicationModules) == 11
+        assert exe.ApplicationModules[1].TaskMapping[0].Budget == "1ms"
+
+        # a failing entry leaves the model untouched and all errors are reported at once
+        with pytest.raises(vafpy.core.ModelError) as err:
+            exe.connect_many(
+                [
+                    (provider, "Out", consumers[0], "In"),
+                    (provider, "Out2", consumers[1], "In"),
+                    (provider, "Out", consumers[2], "In2"),
+                ]
+            )
+        assert "Out2" in str(err.value) and "In2" in str(err.value)
+        assert not exe.InternalCommunicationModules
+        assert not model_runtime.connected_interfaces
+
+        exe.connect_many([(provider, "Out", consumer, "In") for consumer in consumers])
+        assert len(exe.InternalCommunicationModules) == 1
+        assert len(exe.ApplicationModules[0].InterfaceInstanceToModuleMappings) == 1
+        assert all(
+            mapping.InterfaceInstanceToModuleMappings[0].ModuleRef is exe.InternalCommunicationModules[0]
+            for mapping in exe.ApplicationModules[1:]
+        )
+        assert len(model_runtime.connected_interfaces["app_modules::Provider"]) == 10
+        assert model_runtime.connected_interfaces["app_modules::Consumer0"] == ["In"]